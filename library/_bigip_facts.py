@@ -67,6 +67,8 @@ options:
     description:
       - Shell-style glob matching string used to filter fact keys. Not
         applicable for software, provision, and system_info fact categories.
+      - When the filter starts with a folder, such as C(/Common/web-*), only
+        objects in that folder are requested from the device.
     required: false
     default: null
     choices: []
@@ -1599,6 +1601,25 @@ def generate_provision_dict(f5):
     return generate_simple_dict(provisioned, fields)
 
 
+def get_filter_folder(fact_filter):
+    """Returns the folder that a filter is bounded to
+
+    When the filter starts with a literal folder, such as ``/Common/`` in
+    ``/Common/web-*``, the active folder can be set to it so that the
+    device only returns objects in that folder. The filter itself is still
+    applied to the names that come back.
+
+    :param fact_filter: The shell-style filter provided by the user.
+    :return: The folder to query, or "/" when the filter is not bounded.
+    """
+    if not fact_filter:
+        return "/"
+    matches = re.match(r'^(/[^*?\[\]/]+)/', fact_filter)
+    if matches:
+        return matches.group(1)
+    return "/"
+
+
 def main():
     argument_spec = f5_argument_spec()
 
@@ -1633,6 +1654,7 @@ def main():
         regex = fnmatch.translate(fact_filter)
     else:
         regex = None
+    folder = get_filter_folder(fact_filter)
     include = [x.lower() for x in module.params['include']]
     valid_includes = ('address_class', 'certificate', 'client_ssl_profile',
                       'device', 'device_group', 'interface', 'key', 'node',
@@ -1650,8 +1672,8 @@ def main():
             f5 = F5(server, user, password, session, validate_certs, server_port)
             saved_active_folder = f5.get_active_folder()
             saved_recursive_query_state = f5.get_recursive_query_state()
-            if saved_active_folder != "/":
-                f5.set_active_folder("/")
+            if saved_active_folder != folder:
+                f5.set_active_folder(folder)
             if saved_recursive_query_state != "STATE_ENABLED":
                 f5.enable_recursive_query_state()
 
@@ -1695,7 +1717,7 @@ def main():
                 facts['system_info'] = generate_system_info_dict(f5)
 
             # restore saved state
-            if saved_active_folder and saved_active_folder != "/":
+            if saved_active_folder and saved_active_folder != folder:
                 f5.set_active_folder(saved_active_folder)
             if saved_recursive_query_state and \
                saved_recursive_query_state != "STATE_ENABLED":
@@ -48,6 +48,11 @@ options:
     choices:
       - yes
       - no
+  timeout:
+    description:
+      - Number of seconds to wait for the sync operation to finish.
+    default: 540
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -93,9 +98,16 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-# only common fields returned
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for
+        the sync operation to finish.
+    returned: changed
+    type: dict
+    sample: {"sync": {"seconds": 7.3, "polls": 4, "waits": 1}}
 '''
 
+import random
 import time
 import re
 
@@ -183,6 +195,39 @@ class ModuleManager(object):
     def __init__(self, client):
         self.client = client
         self.want = Parameters(self.client.module.params)
+        self.wait_times = dict()
+
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for the device group to finish syncing
+
+        condition is checked straight away and then after delays that double
+        from interval, up to 30 seconds. The wait ends after the timeout,
+        540 seconds unless the module was given one. How long the sync took
+        is returned in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 540
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
 
     def exec_module(self):
         result = dict()
@@ -193,6 +238,8 @@ class ModuleManager(object):
             raise F5ModuleError(str(e))
 
         result.update(dict(changed=changed))
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
         return result
 
     def present(self):
@@ -248,10 +295,11 @@ class ModuleManager(object):
         )
 
     def _wait_for_sync(self):
-        # Wait no more than half an hour
         resource = self.read_current_from_device()
-        for x in range(1, 180):
-            time.sleep(3)
+        checks = []
+
+        def synced():
+            checks.append(True)
             status = self._get_status_from_resource(resource)
 
             # Changes Pending:
@@ -268,14 +316,23 @@ class ModuleManager(object):
             #     after starting the sync and stay until all devices finish.
             #
             if status in ['Changes Pending']:
-                details = self._get_details_from_resource(resource)
-                self._validate_pending_status(details)
+                # The first check can be made before the device has
+                # started the sync that was just requested.
+                if len(checks) > 1:
+                    details = self._get_details_from_resource(resource)
+                    self._validate_pending_status(details)
             elif status in ['Awaiting Initial Sync', 'Not All Devices Synced']:
                 pass
             elif status == 'In Sync':
-                return
+                return True
             else:
                 raise F5ModuleError(status)
+            return False
+
+        if not self._wait_until('sync', synced):
+            raise F5ModuleError(
+                "Timed out waiting for the sync operation to finish"
+            )
 
     def read_current_from_device(self):
         result = self.client.api.tm.cm.sync_status.load()
@@ -329,6 +386,10 @@ class ArgumentSpec(object):
             ),
             device_group=dict(
                 required=True
+            ),
+            timeout=dict(
+                type='int',
+                default=540
             )
         )
         self.f5_product_name = 'bigip'
@@ -38,6 +38,32 @@ options:
     choices:
       - present
       - absent
+  zone_file:
+    description:
+      - Path to an RFC 1035 zone file holding all of the records of C(zone)
+        in C(view).
+      - The file is read one record at a time and compared with the records
+        already in the zone. Records that are missing are added, and records
+        that are not in the file are deleted. The SOA record is updated in
+        place when it differs.
+      - When C(state) is C(absent), the records in the file are deleted
+        from the zone instead.
+      - Names that are not fully qualified are relative to C(zone), or to
+        the last C($ORIGIN) in the file.
+    version_added: "2.5"
+  records:
+    description:
+      - List of records, in the same format as the lines of a zone file, to
+        add to C(zone) in C(view), or delete when C(state) is C(absent).
+      - Unlike C(zone_file), records in the zone that are not listed are
+        left alone.
+    version_added: "2.5"
+  batch_size:
+    description:
+      - Maximum number of records of each type added or deleted in a single
+        call to the device when C(zone_file) or C(records) is provided.
+    default: 500
+    version_added: "2.5"
 notes:
   - Requires the bigsuds Python package on the remote host. This is as easy as
     pip install bigsuds
@@ -75,10 +101,72 @@ EXAMPLES = '''
       options:
           domain_name: "elliot.organization.com"
           ip_address: "10.1.1.1"
+
+- name: Import the organization.com zone from a zone file
+  bigip_dns_record:
+      user: "admin"
+      password: "secret"
+      server: "lb.mydomain.com"
+      zone: "organization.com"
+      zone_file: "/srv/zones/organization.com.zone"
+      batch_size: 1000
+  delegate_to: localhost
+
+- name: Add a few records to the organization.com zone
+  bigip_dns_record:
+      user: "admin"
+      password: "secret"
+      server: "lb.mydomain.com"
+      zone: "organization.com"
+      records:
+          - "elliot 300 IN A 10.1.1.1"
+          - "www 300 IN CNAME elliot"
+  delegate_to: localhost
+'''
+
+RETURN = '''
+created:
+    description:
+      - Number of records added when C(zone_file) or C(records) is provided.
+    returned: changed
+    type: int
+    sample: 49210
+updated:
+    description:
+      - Number of SOA records replaced when C(zone_file) is provided.
+    returned: changed
+    type: int
+    sample: 1
+deleted:
+    description:
+      - Number of records deleted when C(zone_file) or C(records) is provided.
+    returned: changed
+    type: int
+    sample: 12
+unchanged:
+    description:
+      - Number of records that were already as wanted when C(zone_file) or
+        C(records) is provided.
+    returned: changed
+    type: int
+    sample: 790
+seconds:
+    description:
+      - Time taken to read, compare and change the records.
+    returned: changed
+    type: float
+    sample: 41.3
+records_per_second:
+    description:
+      - Number of records read from the zone file or list per second.
+    returned: changed
+    type: float
+    sample: 1210.9
 '''
 
 from distutils.version import StrictVersion
 import re
+import time
 
 
 VERSION_PATTERN = 'BIG-IP_v(?P<version>\d+\.\d+\.\d+)'
@@ -89,6 +177,10 @@ RECORDS = [
 ]
 
 
+class ResourceRecordException(Exception):
+    pass
+
+
 class BigIpCommon(object):
     def __init__(self, *args, **kwargs):
         self.result = dict(changed=False, changes=dict())
@@ -466,23 +558,343 @@ class TxtResourceRecord(ResourceRecord):
             raise ResourceRecordException(str(e))
 
 
+RECORD_CLASSES = dict(
+    A=AResourceRecord,
+    AAAA=AaaaResourceRecord,
+    CNAME=CnameResourceRecord,
+    DNAME=DnameResourceRecord,
+    DS=DsResourceRecord,
+    HINFO=HinfoResourceRecord,
+    MX=MxResourceRecord,
+    NAPTR=NaptrResourceRecord,
+    NS=NsResourceRecord,
+    PTR=PtrResourceRecord,
+    SOA=SoaResourceRecord,
+    SRV=SrvResourceRecord,
+    TXT=TxtResourceRecord
+)
+
+# Record fields that hold a domain name, or a number of seconds
+NAME_FIELDS = [
+    'cname', 'label', 'mail', 'host_name', 'dname', 'primary', 'email',
+    'target', 'replacement'
+]
+NUMBER_FIELDS = [
+    'key_tag', 'algorithm', 'digest_type', 'preference', 'order', 'serial',
+    'refresh', 'retry', 'expire', 'neg_ttl', 'priority', 'weight', 'port'
+]
+
+TOKEN_PATTERN = r'"(?:[^"\\]|\\.)*"|;.*|[()]|[^\s()";]+'
+TTL_PATTERN = r'^(\d+[wdhmsWDHMS]?)+$'
+CLASSES = ['IN', 'CH', 'HS']
+
+
+def to_seconds(value):
+    """Converts a TTL such as 3600 or 1h30m to a number of seconds"""
+    units = dict(w=604800, d=86400, h=3600, m=60, s=1)
+    result = 0
+    for number, unit in re.findall(r'(\d+)([wdhmsWDHMS]?)', str(value)):
+        result += int(number) * units.get(unit.lower(), 1)
+    return result
+
+
+def to_absolute(name, origin):
+    if name == '@':
+        return origin
+    if name.endswith('.'):
+        return name.lower()
+    return '{0}.{1}'.format(name, origin).lower()
+
+
+def make_record(rtype, owner, ttl, rdata, origin):
+    """Builds the iControl record structure for a record of a zone file
+
+    The fields of the structure are the REQUIRED_PARAMS of the matching
+    ResourceRecord class, which are in the same order as in a zone file.
+    """
+    if rtype not in RECORD_CLASSES:
+        raise ResourceRecordException(
+            'The record type %s of %s is not supported' % (rtype, owner)
+        )
+    if ttl is None:
+        raise ResourceRecordException('No TTL was given for %s' % owner)
+    fields = RECORD_CLASSES[rtype].REQUIRED_PARAMS
+    if rtype == 'TXT':
+        rdata = [' '.join(rdata)]
+    elif rtype == 'HINFO':
+        rdata = [x.strip('"') for x in rdata]
+    if rtype == 'PTR' and owner.endswith('.in-addr.arpa.'):
+        owner = '.'.join(reversed(owner.split('.')[:-3]))
+    values = [owner] + rdata
+    if len(values) != len(fields):
+        raise ResourceRecordException(
+            'The %s record of %s is malformed' % (rtype, owner)
+        )
+    result = dict(zip(fields, values))
+    for field in fields:
+        if field in NAME_FIELDS:
+            result[field] = to_absolute(result[field], origin)
+        elif field in NUMBER_FIELDS:
+            result[field] = to_seconds(result[field])
+    result['ttl'] = ttl
+    return result
+
+
+def read_zone(lines, origin, ttl=None, skip_unsupported=False):
+    """Reads the records of an RFC 1035 zone file one at a time
+
+    Comments, records split over several lines by parentheses, blank
+    owner names, and the $ORIGIN and $TTL directives are supported.
+
+    :param lines: Iterable of the lines of the zone file.
+    :param origin: Fully qualified name that relative names are based on.
+    :param ttl: TTL of records that do not specify one, until a $TTL.
+    :param skip_unsupported: Skip records of types that cannot be managed,
+                             instead of raising an error.
+    :return: Generator of tuples of the record type and the record.
+    """
+    owner = None
+    tokens = []
+    depth = 0
+    for line in lines:
+        if depth == 0:
+            tokens = []
+            inherit_owner = line[:1] in [' ', '\t']
+        for token in re.findall(TOKEN_PATTERN, line):
+            if token == '(':
+                depth += 1
+            elif token == ')':
+                depth -= 1
+            elif not token.startswith(';'):
+                tokens.append(token)
+        if depth > 0 or not tokens:
+            continue
+
+        if tokens[0] == '$ORIGIN':
+            origin = to_absolute(tokens[1], origin)
+            continue
+        elif tokens[0] == '$TTL':
+            ttl = to_seconds(tokens[1])
+            continue
+        elif tokens[0].startswith('$'):
+            raise ResourceRecordException(
+                'The %s directive is not supported' % tokens[0]
+            )
+
+        if not inherit_owner:
+            owner = to_absolute(tokens.pop(0), origin)
+        elif owner is None:
+            raise ResourceRecordException(
+                'The first record of the zone has no name'
+            )
+        record_ttl = ttl
+        while tokens and (re.match(TTL_PATTERN, tokens[0]) or tokens[0].upper() in CLASSES):
+            token = tokens.pop(0)
+            if token.upper() not in CLASSES:
+                record_ttl = to_seconds(token)
+        if not tokens:
+            raise ResourceRecordException('The record of %s has no type' % owner)
+        rtype = tokens.pop(0).upper()
+        if skip_unsupported and rtype not in RECORD_CLASSES:
+            continue
+        yield rtype, make_record(rtype, owner, record_ttl, tokens, origin)
+
+
+def record_key(rtype, record):
+    return (rtype,) + tuple(sorted(record.items()))
+
+
+class ZoneImporter(BigIpCommon):
+    """Adds and deletes many resource records of a zone at once
+
+    The records already in the zone are read in a single call and compared
+    with the records from the zone file or list. The records to add and
+    delete are then sent in calls of at most batch_size records of a type.
+    """
+    REQUIRED_BIGIP_VERSION = '11.4.0'
+
+    def __init__(self, *args, **kwargs):
+        super(ZoneImporter, self).__init__(*args, **kwargs)
+
+        self.zone = self.params['zone'].lower()
+        if not self.zone.endswith('.'):
+            self.zone += '.'
+        self.view_zones = [{
+            'view_name': self.params['view'],
+            'zone_name': self.zone
+        }]
+        self.client = bigip_api(self.params['server'],
+                                self.params['user'],
+                                self.params['password'],
+                                self.params['validate_certs'],
+                                self.params['server_port'])
+
+    def flush(self):
+        start = time.time()
+        current = dict(
+            (record_key(*x), x) for x in self.read_records_from_device()
+        )
+        wanted = set()
+        created = []
+        deleted = []
+        unchanged = 0
+        for rtype, record in self.read_records():
+            key = record_key(rtype, record)
+            if key in wanted:
+                continue
+            wanted.add(key)
+            if key in current:
+                unchanged += 1
+                if self.params['state'] == 'absent':
+                    deleted.append((rtype, record))
+            elif self.params['state'] == 'present':
+                created.append((rtype, record))
+        if self.params['state'] == 'present' and self.params['zone_file']:
+            # The SOA record can be replaced, but never left out
+            soa = any(x[0] == 'SOA' for x in created)
+            deleted = [
+                v for k, v in current.items()
+                if k not in wanted and (soa or v[0] != 'SOA')
+            ]
+        if self.params['state'] == 'absent':
+            unchanged = 0
+
+        # A zone always has one SOA record, so it is replaced rather than
+        # being deleted and added.
+        old = [x for x in deleted if x[0] == 'SOA']
+        new = [x for x in created if x[0] == 'SOA']
+        updated = []
+        if old and new:
+            deleted.remove(old[0])
+            created.remove(new[0])
+            updated.append((old[0][1], new[0][1]))
+
+        if not self.params['check_mode']:
+            self.check_version(created + deleted)
+            for old, new in updated:
+                self.update_soa_on_device(old, new)
+            self.change_on_device('delete', deleted)
+            self.change_on_device('add', created)
+
+        seconds = time.time() - start
+        return dict(
+            changed=bool(created or deleted or updated),
+            created=len(created),
+            updated=len(updated),
+            deleted=len(deleted),
+            unchanged=unchanged,
+            seconds=round(seconds, 1),
+            records_per_second=round(len(wanted) / max(seconds, 0.001), 1)
+        )
+
+    def read_records(self):
+        ttl = to_seconds(self.params['ttl'])
+        if self.params['records']:
+            return read_zone(self.params['records'], self.zone, ttl)
+        return self.read_zone_file(ttl)
+
+    def read_zone_file(self, ttl):
+        with open(self.params['zone_file']) as fh:
+            for record in read_zone(fh, self.zone, ttl):
+                yield record
+
+    def read_records_from_device(self):
+        """Reads the records of the zone that this module can manage
+
+        Records of other types, such as SPF, are left alone in the zone.
+        """
+        response = self.client.Management.ResourceRecord.get_rrs(
+            view_zones=self.view_zones
+        )
+        return list(read_zone(response[0], self.zone, skip_unsupported=True))
+
+    def check_version(self, records):
+        """Checks the device version once for the record types that need it"""
+        if not any(rtype in ['DS', 'NAPTR'] for rtype, record in records):
+            return
+        response = self.client.System.SystemInfo.get_version()
+        match = re.search(VERSION_PATTERN, response)
+        version = match.group('version')
+        if StrictVersion(version) < StrictVersion(self.REQUIRED_BIGIP_VERSION):
+            raise ResourceRecordException(
+                'The BIG-IP version %s does not support DS and NAPTR records' % version
+            )
+
+    def update_soa_on_device(self, old, new):
+        try:
+            self.client.Management.ResourceRecord.update_soa(
+                view_zones=self.view_zones,
+                old_soa_records=[[old]],
+                new_soa_records=[[new]]
+            )
+        except Exception as e:
+            raise ResourceRecordException(str(e))
+
+    def change_on_device(self, action, records):
+        rtypes = ['SOA', 'NS'] + [x for x in RECORDS if x not in ['SOA', 'NS']]
+        if action == 'delete':
+            rtypes.reverse()
+        size = self.params['batch_size']
+        for rtype in rtypes:
+            batch = [record for x, record in records if x == rtype]
+            for index in range(0, len(batch), size):
+                method = getattr(
+                    self.client.Management.ResourceRecord,
+                    '%s_%s' % (action, rtype.lower())
+                )
+                params = dict(view_zones=self.view_zones)
+                params['%s_records' % rtype.lower()] = [batch[index:index + size]]
+                if rtype in ['A', 'AAAA']:
+                    # PTR records are imported like any other record, so
+                    # they are not kept in step with the A and AAAA records.
+                    params['sync_ptrs'] = [0]
+                try:
+                    method(**params)
+                except Exception as e:
+                    raise ResourceRecordException(str(e))
+
+
 def main():
     argument_spec = f5_argument_spec()
 
     meta_args = dict(
-        type=dict(default=None, required=True, choices=RECORDS),
+        type=dict(default=None, choices=RECORDS),
         ttl=dict(default=60),
         view=dict(default='external'),
         zone=dict(required=True),
-        options=dict(required=True, type='dict')
+        options=dict(type='dict'),
+        zone_file=dict(type='path'),
+        records=dict(type='list'),
+        batch_size=dict(type='int', default=500)
     )
     argument_spec.update(meta_args)
 
     module = AnsibleModule(
         argument_spec=argument_spec,
-        supports_check_mode=True
+        supports_check_mode=True,
+        mutually_exclusive=[
+            ['zone_file', 'records', 'options']
+        ],
+        required_one_of=[
+            ['zone_file', 'records', 'options']
+        ],
+        required_together=[
+            ['options', 'type']
+        ]
     )
 
+    if module.params['zone_file'] or module.params['records']:
+        try:
+            if not bigsuds_found:
+                raise Exception("The python bigsuds module is required")
+            if module.params['batch_size'] < 1:
+                raise Exception("The batch_size must be at least 1")
+            obj = ZoneImporter(check_mode=module.check_mode, **module.params)
+            result = obj.flush()
+        except Exception as e:
+            module.fail_json(msg=str(e))
+        module.exit_json(**result)
+
     try:
         obj = BigIpApiFactory.factory(module)
         result = obj.flush()
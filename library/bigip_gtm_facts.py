@@ -45,6 +45,55 @@ options:
       - Perform regex filter of response. Filtering is done on the name of
         the resource. Valid filters are anything that can be provided to
         Python's C(re) module.
+      - When the filter starts with a partition, such as C(/Common/web-.*),
+        only resources in that partition are requested from the device and
+        the rest of the filter is matched against the resource name.
+  concurrency:
+    description:
+      - Maximum number of collections, such as the GTM pools of one type or
+        the GTM servers, that are read from the device at the same time.
+        The limit is shared by all of the fact categories. All requests
+        share a single connection to the device.
+      - Set to C(1) to fetch everything serially.
+    default: 4
+    version_added: 2.5
+  cache_dir:
+    description:
+      - Directory in which a snapshot of the collected facts is kept between
+        runs, one file per device.
+      - When set, only the generation of each resource is downloaded first.
+        A collection is read in full only if its resource count or highest
+        generation has changed since the snapshot was taken.
+    version_added: 2.5
+  targets:
+    description:
+      - List of devices to collect facts from in a single task. Each item
+        is either the address of a device, or a dictionary containing its
+        C(server) and, optionally, the C(server_port), C(user) and
+        C(password) to use for that device. Values not given for a device
+        are taken from the task.
+      - Each device is logged in to once, and all of its fact categories are
+        collected over that connection.
+      - When specified, the C(server) of the task is only used as a default
+        for the credentials and is not collected from unless it is listed.
+    version_added: 2.5
+  max_concurrent_targets:
+    description:
+      - Maximum number of devices in C(targets) that facts are collected
+        from at the same time.
+    default: 10
+    version_added: 2.5
+  dest:
+    description:
+      - File to write the facts of each device in C(targets) to, as
+        JSON Lines. Each line is a JSON object with the C(server) and
+        C(server_port) of one device and its facts, or the C(msg) of the
+        error collecting them.
+      - Lines are written as each device finishes, so the facts of all of
+        the devices are never held in memory at once. The file is only
+        put in place once every device has been handled.
+      - When set, the facts are not included in the result of the task.
+    version_added: 2.5
 notes:
    - Requires the f5-sdk Python package on the host. This is as easy as
      pip install f5-sdk
@@ -64,6 +113,21 @@ EXAMPLES = '''
       include: "pool"
       filter: "my_pool"
   delegate_to: localhost
+
+- name: Collect facts from every GTM into a JSON Lines file
+  bigip_gtm_facts:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      include:
+        - pool
+        - wide_ip
+        - virtual_server
+      targets: "{{ groups['gtm'] }}"
+      max_concurrent_targets: 25
+      dest: "/var/lib/cmdb/gtm-facts.jsonl"
+  run_once: true
+  delegate_to: localhost
 '''
 
 RETURN = '''
@@ -181,6 +245,23 @@ virtual_server:
                     name: "jsdfhsd"
                     translation_address: "none"
                     translation_port: "0"
+targets:
+    description:
+      - Results for each device when C(targets) is used, including the
+        time taken for that device in C(seconds). The facts of each
+        device are left out when C(dest) is set.
+      - A device that facts could not be collected from has C(failed) set
+        and the error in C(msg). The other devices are still collected.
+    returned: changed
+    type: list
+    sample: [{"server": "10.0.0.1", "server_port": 443, "seconds": 3.2, "pool": []}]
+failed_targets:
+    description:
+      - Number of devices in C(targets) that facts could not be collected
+        from.
+    returned: changed
+    type: int
+    sample: 1
 '''
 
 try:
@@ -188,17 +269,119 @@ try:
     from f5.bigip.contexts import TransactionContextManager
     from f5.bigip import ManagementRoot
     from icontrol.session import iControlUnexpectedHTTPError
+    from requests.exceptions import RequestException
 
     HAS_F5SDK = True
 except ImportError:
     HAS_F5SDK = False
 
+import json
+import os
 import re
+import tempfile
+import threading
+import time
+
+from multiprocessing.pool import ThreadPool
+
+
+def map_concurrently(func, items, concurrency=1):
+    """Calls func for every item using a bounded pool of threads
+
+    Results are returned in the same order as items, regardless of the
+    order in which the calls finish. Any exception raised by func is
+    re-raised in the caller.
+
+    :param func: Callable accepting a single item.
+    :param items: List of items to call func with.
+    :param concurrency: Maximum number of simultaneous calls.
+    :return: List of results
+    """
+    workers = min(concurrency or 1, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    pool = ThreadPool(workers)
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def parse_filter(value):
+    """Splits a name filter into the parts applied by the device and locally
+
+    A leading partition, for example the ``/Common/`` in ``/Common/web-.*``,
+    can be handed to the device as a ``$filter`` so that resources in other
+    partitions are never sent to us. Whatever remains is compiled once and
+    matched against resource names.
+
+    :param value: The filter provided by the user.
+    :return: Tuple of the partition (or None) and compiled regex (or None).
+    """
+    if not value:
+        return None, None
+    matches = re.match(r'^/(?P<partition>[\w-]+)/(?P<name>.*)$', value)
+    if matches:
+        name = matches.group('name')
+        if name in ['', '.*']:
+            return matches.group('partition'), None
+        return matches.group('partition'), re.compile(name)
+    return None, re.compile(value)
+
+
+class FactCache(object):
+    """On-disk snapshot of previously collected facts
+
+    Facts are stored per collection along with the collection's
+    fingerprint. A collection is only read again when its fingerprint on
+    the device no longer matches the stored one.
+    """
+    def __init__(self, cache_dir, server, server_port):
+        name = 'bigip_gtm_facts-{0}-{1}.json'.format(server, server_port)
+        name = re.sub(r'[^\w.-]', '_', name)
+        self.path = os.path.join(cache_dir, name)
+        self.snapshot = dict()
+        self.changed = False
+
+    def load(self):
+        try:
+            with open(self.path) as fh:
+                self.snapshot = json.load(fh)
+        except (IOError, OSError, ValueError):
+            self.snapshot = dict()
+
+    def save(self):
+        if not self.changed:
+            return
+        directory = os.path.dirname(self.path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'w') as fh:
+            json.dump(self.snapshot, fh)
+        os.rename(tmp, self.path)
+
+    def get(self, key, fingerprint):
+        entry = self.snapshot.get(key, None)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            return None
+        return entry['facts']
+
+    def set(self, key, fingerprint, facts):
+        self.snapshot[key] = dict(fingerprint=fingerprint, facts=facts)
+        self.changed = True
 
 
 class BigIpGtmFactsCommon(object):
     def __init__(self):
         self.api = None
+        self.cache = None
+        self._filter = None
+
+        # Semaphore shared with the other collectors of the device, which
+        # bounds the number of collections read from it at once.
+        self.limit = None
         self.attributes_to_remove = [
             'kind', 'generation', 'selfLink', '_meta_data',
             'membersReference', 'datacenterReference',
@@ -212,11 +395,11 @@ class BigIpGtmFactsCommon(object):
             naptrs='naptr',
             srvs='srv'
         )
-        self.request_params = dict(
-            requests_params=dict(
-                params='expandSubcollections=true'
-            )
-        )
+        self.page_size = 100
+
+        # Reference to the subcollection that is expanded into the facts
+        # of each resource, if any.
+        self.subcollection = None
 
     def is_version_less_than_12(self):
         version = self.api.tmos_version
@@ -233,22 +416,122 @@ class BigIpGtmFactsCommon(object):
             result[key] = str(val)
         return result
 
+    @property
+    def filter(self):
+        if self._filter is None:
+            self._filter = parse_filter(self.params.get('filter'))
+        return self._filter
+
     def filter_matches_name(self, name):
-        if not self.params['filter']:
+        partition, regex = self.filter
+        if regex is None:
             return True
-        matches = re.match(self.params['filter'], str(name))
+        matches = regex.match(str(name))
         if matches:
             return True
         else:
             return False
 
+    def iterate_collection(self, collection):
+        """Yields the resources in a collection one page at a time
+
+        Only a single page of resources is held in memory at once, so
+        very large GTM configurations can be walked without downloading
+        every object in one response.
+
+        :param collection: The SDK collection to read from.
+        """
+        skip = 0
+        while True:
+            params = 'expandSubcollections=true&$top={0}&$skip={1}'.format(
+                self.page_size, skip
+            )
+            partition = self.filter[0]
+            if partition:
+                params += "&$filter=partition+eq+'{0}'".format(partition)
+            items = collection.get_collection(
+                requests_params=dict(params=params)
+            )
+            for item in items:
+                yield item
+            if len(items) < self.page_size:
+                break
+            skip += self.page_size
+
+    def get_collection_fingerprint(self, collection):
+        """Returns the number of resources and their highest generation
+
+        Every configuration change on the device bumps the generation of
+        the objects it touches, and removing an object changes the count,
+        so this pair changes whenever the collection does. Only the
+        generation of each resource is downloaded to compute it.
+
+        Changing a pool member or server virtual server does not always
+        bump the generation of the resource it belongs to, so when a
+        subcollection is expanded into the facts, the count and highest
+        generation of its items are included too.
+
+        :param collection: The SDK collection to fingerprint.
+        :return: List of the resource count and highest generation, then
+                 the item count and highest generation of subcollections.
+        """
+        uri = collection._meta_data['uri']
+        session = self.api._meta_data['icr_session']
+        page_size = 1000
+        count = 0
+        generation = 0
+        sub_count = 0
+        sub_generation = 0
+        skip = 0
+        while True:
+            if self.subcollection:
+                params = 'expandSubcollections=true&$select=generation,{0}&'.format(
+                    self.subcollection
+                )
+            else:
+                params = '$select=generation&'
+            params += '$top={0}&$skip={1}'.format(page_size, skip)
+            partition = self.filter[0]
+            if partition:
+                params += "&$filter=partition+eq+'{0}'".format(partition)
+            response = session.get(uri, params=params)
+            items = response.json().get('items', [])
+            for item in items:
+                count += 1
+                generation = max(generation, item.get('generation', 0))
+                if not self.subcollection:
+                    continue
+                for sub_item in item.get(self.subcollection, {}).get('items', []):
+                    sub_count += 1
+                    sub_generation = max(sub_generation, sub_item.get('generation', 0))
+            if len(items) < page_size:
+                break
+            skip += page_size
+        if self.subcollection:
+            return [count, generation, sub_count, sub_generation]
+        return [count, generation]
+
     def get_facts_from_collection(self, collection, collection_type=None):
+        if self.limit is None:
+            return self.read_facts_from_collection(collection, collection_type)
+        with self.limit:
+            return self.read_facts_from_collection(collection, collection_type)
+
+    def read_facts_from_collection(self, collection, collection_type=None):
+        if self.cache is not None:
+            key = '{0}|{1}'.format(collection._meta_data['uri'], self.params.get('filter') or '')
+            fingerprint = self.get_collection_fingerprint(collection)
+            results = self.cache.get(key, fingerprint)
+            if results is not None:
+                return results
         results = []
-        for item in collection:
+        for item in self.iterate_collection(collection):
             if not self.filter_matches_name(item.name):
                 continue
             facts = self.format_facts(item, collection_type)
             results.append(facts)
+        if self.cache is not None:
+            self.cache.set(key, fingerprint, results)
         return results
 
     def connect_to_bigip(self, **kwargs):
@@ -262,9 +545,11 @@ class BigIpGtmFactsPools(BigIpGtmFactsCommon):
     def __init__(self, *args, **kwargs):
         super(BigIpGtmFactsPools, self).__init__()
         self.params = kwargs
+        self.subcollection = 'membersReference'
 
     def get_facts(self):
-        self.api = self.connect_to_bigip(**self.params)
+        if self.api is None:
+            self.api = self.connect_to_bigip(**self.params)
         return self.get_facts_from_device()
 
     def get_facts_from_device(self):
@@ -277,21 +562,19 @@ class BigIpGtmFactsPools(BigIpGtmFactsCommon):
             raise F5ModuleError(str(e))
 
     def get_facts_with_types(self):
-        result = []
-        for key, type in self.gtm_types.iteritems():
-            facts = self.get_all_facts_by_type(key, type)
-            if facts:
-                result.append(facts)
-        return result
+        keys = sorted(self.gtm_types.keys())
+        facts = map_concurrently(
+            lambda key: self.get_all_facts_by_type(key, self.gtm_types[key]),
+            keys, self.params.get('concurrency')
+        )
+        return [x for x in facts if x]
 
     def get_facts_without_types(self):
-        pools = self.api.tm.gtm.pools.get_collection(**self.request_params)
-        return self.get_facts_from_collection(pools)
+        return self.get_facts_from_collection(self.api.tm.gtm.pools)
 
     def get_all_facts_by_type(self, key, type):
         collection = getattr(self.api.tm.gtm.pools, key)
-        pools = collection.get_collection(**self.request_params)
-        return self.get_facts_from_collection(pools, type)
+        return self.get_facts_from_collection(collection, type)
 
     def format_facts(self, pool, collection_type):
         result = dict()
@@ -318,7 +601,8 @@ class BigIpGtmFactsWideIps(BigIpGtmFactsCommon):
         self.params = kwargs
 
     def get_facts(self):
-        self.api = self.connect_to_bigip(**self.params)
+        if self.api is None:
+            self.api = self.connect_to_bigip(**self.params)
         return self.get_facts_from_device()
 
     def get_facts_from_device(self):
@@ -331,23 +615,19 @@ class BigIpGtmFactsWideIps(BigIpGtmFactsCommon):
             raise F5ModuleError(str(e))
 
     def get_facts_with_types(self):
-        result = []
-        for key, type in self.gtm_types.iteritems():
-            facts = self.get_all_facts_by_type(key, type)
-            if facts:
-                result.append(facts)
-        return result
+        keys = sorted(self.gtm_types.keys())
+        facts = map_concurrently(
+            lambda key: self.get_all_facts_by_type(key, self.gtm_types[key]),
+            keys, self.params.get('concurrency')
+        )
+        return [x for x in facts if x]
 
     def get_facts_without_types(self):
-        wideips = self.api.tm.gtm.wideips.get_collection(
-            **self.request_params
-        )
-        return self.get_facts_from_collection(wideips)
+        return self.get_facts_from_collection(self.api.tm.gtm.wideips)
 
     def get_all_facts_by_type(self, key, type):
         collection = getattr(self.api.tm.gtm.wideips, key)
-        wideips = collection.get_collection(**self.request_params)
-        return self.get_facts_from_collection(wideips, type)
+        return self.get_facts_from_collection(collection, type)
 
     def format_facts(self, wideip, collection_type):
         result = dict()
@@ -372,19 +652,18 @@ class BigIpGtmFactsVirtualServers(BigIpGtmFactsCommon):
     def __init__(self, *args, **kwargs):
         super(BigIpGtmFactsVirtualServers, self).__init__()
         self.params = kwargs
+        self.subcollection = 'virtualServersReference'
 
     def get_facts(self):
         try:
-            self.api = self.connect_to_bigip(**self.params)
+            if self.api is None:
+                self.api = self.connect_to_bigip(**self.params)
             return self.get_facts_from_device()
         except iControlUnexpectedHTTPError as e:
             raise F5ModuleError(str(e))
 
     def get_facts_from_device(self):
-        servers = self.api.tm.gtm.servers.get_collection(
-            **self.request_params
-        )
-        return self.get_facts_from_collection(servers)
+        return self.get_facts_from_collection(self.api.tm.gtm.servers)
 
     def format_facts(self, server, collection_type=None):
         result = dict()
@@ -417,35 +696,154 @@ class BigIpGtmFactsManager(object):
     def __init__(self, *args, **kwargs):
         self.params = kwargs
         self.api = None
+        self.cache = None
+        self.limit = threading.BoundedSemaphore(self.params.get('concurrency') or 1)
+        if self.params.get('cache_dir'):
+            self.cache = FactCache(
+                self.params['cache_dir'], self.params['server'],
+                self.params['server_port']
+            )
 
     def get_facts(self):
         result = dict()
-        facts = dict()
-
-        if 'pool' in self.params['include']:
-            facts['pool'] = self.get_pool_facts()
-        if 'wide_ip' in self.params['include']:
-            facts['wide_ip'] = self.get_wide_ip_facts()
-        if 'virtual_server' in self.params['include']:
-            facts['virtual_server'] = self.get_virtual_server_facts()
+        collectors = dict(
+            pool=self.get_pool_facts,
+            wide_ip=self.get_wide_ip_facts,
+            virtual_server=self.get_virtual_server_facts
+        )
+        includes = [x for x in ['pool', 'wide_ip', 'virtual_server'] if x in self.params['include']]
+
+        # Connect before fanning out so that every collector shares the
+        # same session.
+        if includes:
+            self.connect_to_bigip()
+        if self.cache is not None:
+            self.cache.load()
+        facts = map_concurrently(
+            lambda include: collectors[include](),
+            includes, self.params.get('concurrency')
+        )
+        if self.cache is not None:
+            self.cache.save()
 
-        result.update(**facts)
+        result.update(**dict(zip(includes, facts)))
         result.update(dict(changed=True))
         return result
 
+    def connect_to_bigip(self):
+        """Returns the connection shared by all of the facts collectors
+
+        Logging in to the device, and probing its version, only happens
+        once per module run regardless of how many includes are requested.
+
+        :return: ManagementRoot
+        """
+        if self.api is None:
+            self.api = ManagementRoot(self.params['server'],
+                                      self.params['user'],
+                                      self.params['password'],
+                                      port=self.params['server_port'])
+        return self.api
+
     def get_pool_facts(self):
         pools = BigIpGtmFactsPools(**self.params)
+        pools.api = self.connect_to_bigip()
+        pools.cache = self.cache
+        pools.limit = self.limit
         return pools.get_facts()
 
     def get_wide_ip_facts(self):
         wide_ips = BigIpGtmFactsWideIps(**self.params)
+        wide_ips.api = self.connect_to_bigip()
+        wide_ips.cache = self.cache
+        wide_ips.limit = self.limit
         return wide_ips.get_facts()
 
     def get_virtual_server_facts(self):
         wide_ips = BigIpGtmFactsVirtualServers(**self.params)
+        wide_ips.api = self.connect_to_bigip()
+        wide_ips.cache = self.cache
+        wide_ips.limit = self.limit
         return wide_ips.get_facts()
 
 
+class BigIpGtmFactsFleetManager(object):
+    """Collects facts from every device in targets concurrently
+
+    Each device is handled by its own BigIpGtmFactsManager, so it is
+    logged in to once and keeps its own fact cache.
+    """
+    def __init__(self, *args, **kwargs):
+        self.params = kwargs
+
+    def get_target_params(self, target):
+        params = dict(self.params)
+        params.pop('targets', None)
+        if isinstance(target, dict):
+            for key in ['server', 'server_port', 'user', 'password']:
+                if target.get(key) is not None:
+                    params[key] = target[key]
+        else:
+            params['server'] = target
+        return params
+
+    def get_target_facts(self, target):
+        params = self.get_target_params(target)
+        start = time.time()
+        result = dict(
+            server=params['server'],
+            server_port=params['server_port']
+        )
+        try:
+            facts = BigIpGtmFactsManager(**params).get_facts()
+            facts.pop('changed', None)
+            result.update(facts)
+        except (iControlUnexpectedHTTPError, F5ModuleError, RequestException) as ex:
+            # Errors are recorded against the device they happened on, so
+            # that one unreachable device does not stop the others from
+            # being collected.
+            result.update(dict(failed=True, msg=str(ex)))
+        return result, round(time.time() - start, 1)
+
+    def get_facts(self):
+        targets = self.params['targets']
+        dest = self.params.get('dest')
+        workers = min(self.params.get('max_concurrent_targets') or 1, len(targets)) or 1
+        results = []
+
+        fh = None
+        if dest:
+            directory = os.path.dirname(os.path.abspath(dest))
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            fd, tmp = tempfile.mkstemp(dir=directory)
+            fh = os.fdopen(fd, 'w')
+
+        pool = ThreadPool(workers)
+        try:
+            for facts, seconds in pool.imap_unordered(self.get_target_facts, targets):
+                if fh is not None:
+                    fh.write(json.dumps(facts, sort_keys=True) + '\n')
+                    facts = dict(
+                        (k, v) for k, v in facts.items()
+                        if k in ['server', 'server_port', 'failed', 'msg']
+                    )
+                facts['seconds'] = seconds
+                results.append(facts)
+        finally:
+            pool.close()
+            pool.join()
+            if fh is not None:
+                fh.close()
+        if fh is not None:
+            os.rename(tmp, dest)
+
+        order = [self.get_target_params(x)['server'] for x in targets]
+        results.sort(key=lambda x: order.index(x['server']))
+        failed = [x for x in results if x.get('failed')]
+        return dict(changed=True, targets=results, failed_targets=len(failed))
+
+
 class BigIpGtmFactsModuleConfig(object):
     def __init__(self):
         self.argument_spec = dict()
@@ -458,7 +856,12 @@ class BigIpGtmFactsModuleConfig(object):
     def initialize_meta_args(self):
         args = dict(
             include=dict(type='list', required=True),
-            filter=dict(type='str', required=False)
+            filter=dict(type='str', required=False),
+            concurrency=dict(type='int', default=4),
+            cache_dir=dict(type='path', required=False),
+            targets=dict(type='list', required=False),
+            max_concurrent_targets=dict(type='int', default=10),
+            dest=dict(type='path', required=False)
         )
         self.meta_args = args
 
@@ -481,9 +884,14 @@ def main():
     module = config.create()
 
     try:
-        obj = BigIpGtmFactsManager(
-            check_mode=module.check_mode, **module.params
-        )
+        if module.params['targets']:
+            obj = BigIpGtmFactsFleetManager(
+                check_mode=module.check_mode, **module.params
+            )
+        else:
+            obj = BigIpGtmFactsManager(
+                check_mode=module.check_mode, **module.params
+            )
         result = obj.get_facts()
 
         module.exit_json(**result)
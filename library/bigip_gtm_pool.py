@@ -136,6 +136,23 @@ options:
     required: False
     default: 'Common'
     version_added: 2.5
+  cache_dir:
+    description:
+      - Directory in which what the device is capable of, such as the
+        modules that are provisioned on it, is kept between tasks, one file
+        per device.
+      - When set, the device is only asked whether GTM is provisioned if
+        there is no record for it, the record is older than C(cache_ttl),
+        or the device has been upgraded since the record was written.
+      - The C(bigip_provision) and C(bigip_software) modules remove the
+        record when they are given the same C(cache_dir) and change the
+        device.
+    version_added: 2.5
+  cache_ttl:
+    description:
+      - Number of seconds a record in C(cache_dir) is used for.
+    default: 3600
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as
     pip install f5-sdk.
@@ -170,6 +187,11 @@ fallback_ip:
     returned: changed
     type: string
     sample: "10.10.10.10"
+requests:
+    description: Number of requests made to the device.
+    returned: always
+    type: int
+    sample: 1
 '''
 
 EXAMPLES = '''
@@ -189,10 +211,27 @@ EXAMPLES = '''
       state: "disabled"
       name: "my_pool"
   delegate_to: localhost
+
+- name: Create many pools, checking provisioning once an hour
+  bigip_gtm_pool:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      name: "{{ item }}"
+      cache_dir: "~/.ansible/f5"
+  with_items: "{{ gtm_pools }}"
+  delegate_to: localhost
 '''
 
 
+import json
+import os
+import re
+import tempfile
+import time
+
 from distutils.version import LooseVersion
+from functools import wraps
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
     AnsibleF5Parameters,
@@ -210,6 +249,15 @@ except ImportError:
 import copy
 
 
+def counted(method):
+    """Counts each call of a method that sends one request for the GTM pool"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'loadBalancingMode': 'preferred_lb_method',
@@ -327,9 +375,54 @@ class Parameters(AnsibleF5Parameters):
             return None
 
 
+class CapabilityCache(object):
+    """On-disk record of what a device is capable of
+
+    There is one file per device, which is shared with the other modules
+    given the same directory. A record is not used once it is older than
+    the TTL, or when the device reports a different TMOS version than it
+    did when the record was written.
+    """
+    def __init__(self, cache_dir, server, server_port, ttl):
+        name = 'bigip-capabilities-{0}-{1}.json'.format(server, server_port)
+        name = re.sub(r'[^\w.-]', '_', name)
+        self.path = os.path.join(os.path.expanduser(cache_dir), name)
+        self.ttl = ttl
+
+    def get(self, version):
+        try:
+            with open(self.path) as fh:
+                record = json.load(fh)
+        except (IOError, OSError, ValueError):
+            return None
+        if record.get('version') != version:
+            return None
+        if time.time() - record.get('updated', 0) > self.ttl:
+            return None
+        return record
+
+    def set(self, version, **capabilities):
+        record = dict(version=version, updated=time.time())
+        record.update(capabilities)
+        directory = os.path.dirname(self.path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'w') as fh:
+            json.dump(record, fh)
+        os.rename(tmp, self.path)
+
+
 class ModuleManager(object):
     def __init__(self, client):
         self.client = client
+        self.cache = None
+        params = self.client.module.params
+        if params.get('cache_dir'):
+            self.cache = CapabilityCache(
+                params['cache_dir'], params['server'],
+                params['server_port'], params['cache_ttl']
+            )
 
     def exec_module(self):
         if not self.gtm_provisioned():
@@ -356,12 +449,29 @@ class ModuleManager(object):
             return False
 
     def gtm_provisioned(self):
-        resource = self.client.api.tm.sys.dbs.db.load(
-            name='provisioned.cpu.gtm'
+        capabilities = self.read_capabilities()
+        return 'gtm' in capabilities['provisioned']
+
+    def read_capabilities(self):
+        version = self.client.api.tmos_version
+        if self.cache is not None:
+            capabilities = self.cache.get(version)
+            if capabilities is not None:
+                return capabilities
+        capabilities = dict(
+            provisioned=self.read_provisioned_from_device()
         )
-        if int(resource.value) == 0:
-            return False
-        return True
+        if self.cache is not None:
+            self.cache.set(version, **capabilities)
+        return capabilities
+
+    def read_provisioned_from_device(self):
+        collection = self.client.api.tm.sys.provision.get_collection()
+        result = [
+            str(x['name']) for x in collection
+            if x.get('level', 'none') != 'none'
+        ]
+        return sorted(result)
 
 
 class BaseManager(object):
@@ -370,6 +480,9 @@ class BaseManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def _set_changed_options(self):
         changed = {}
@@ -413,9 +526,31 @@ class BaseManager(object):
 
         changes = self.changes.to_return()
         result.update(**changes)
-        result.update(dict(changed=changed))
+        result.update(dict(changed=changed, requests=self.requests))
         return result
 
+    def load_from_device(self):
+        """Returns the GTM pool, loading it on first use
+
+        :return: The pool, or None if it does not exist.
+        """
+        if not self._loaded:
+            try:
+                self._resource = self.load_on_device()
+            except iControlUnexpectedHTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._resource = None
+            self._loaded = True
+        return self._resource
+
+    def exists(self):
+        return self.load_from_device() is not None
+
+    @counted
+    def delete_on_device(self, resource):
+        resource.delete()
+
     def present(self):
         if self.exists():
             return self.update()
@@ -485,38 +620,28 @@ class TypedManager(BaseManager):
 
         return super(TypedManager, self).present()
 
-    def exists(self):
+    @counted
+    def load_on_device(self):
         pools = self.client.api.tm.gtm.pools
         collection = getattr(pools, self.want.collection)
         resource = getattr(collection, self.want.type)
-        result = resource.exists(
+        return resource.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        pools = self.client.api.tm.gtm.pools
-        collection = getattr(pools, self.want.collection)
-        resource = getattr(collection, self.want.type)
-        result = resource.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result.modify(**params)
 
     def read_current_from_device(self):
-        pools = self.client.api.tm.gtm.pools
-        collection = getattr(pools, self.want.collection)
-        resource = getattr(collection, self.want.type)
-        result = resource.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result = result.attrs
         return Parameters(result)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         pools = self.client.api.tm.gtm.pools
@@ -527,43 +652,35 @@ class TypedManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        pools = self.client.api.tm.gtm.pools
-        collection = getattr(pools, self.want.collection)
-        resource = getattr(collection, self.want.type)
-        resource = resource.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         if resource:
-            resource.delete()
+            self.delete_on_device(resource)
+            self._loaded = False
 
 
 class UntypedManager(BaseManager):
-    def exists(self):
-        result = self.client.api.tm.gtm.pools.pool.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.gtm.pools.pool.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        resource = self.client.api.tm.gtm.pools.pool.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.modify(**params)
 
     def read_current_from_device(self):
-        resource = self.client.api.tm.gtm.pools.pool.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return Parameters(result)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.gtm.pools.pool.create(
@@ -571,13 +688,12 @@ class UntypedManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        resource = self.client.api.tm.gtm.pools.pool.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
-        resource.delete()
+        resource = self.load_from_device()
+        self.delete_on_device(resource)
+        self._loaded = False
 
 
 class ArgumentSpec(object):
@@ -621,6 +737,13 @@ class ArgumentSpec(object):
             fallback_ip=dict(),
             type=dict(
                 choices=self.types
+            ),
+            cache_dir=dict(
+                type='path'
+            ),
+            cache_ttl=dict(
+                type='int',
+                default=3600
             )
         )
         self.required_if = [
@@ -116,10 +116,17 @@ state:
     returned: changed
     type: string
     sample: "disabled"
+requests:
+    description: Number of requests made to the device.
+    returned: always
+    type: int
+    sample: 1
 '''
 
 import re
 
+from functools import wraps
+
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
     AnsibleF5Parameters,
@@ -130,6 +137,15 @@ from ansible.module_utils.f5_utils import (
 from distutils.version import LooseVersion
 
 
+def counted(method):
+    """Counts each call of a method that sends one request for the wide IP"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     updatables = ['lb_method']
     returnables = ['name', 'lb_method', 'state']
@@ -292,6 +308,9 @@ class BaseManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def _set_changed_options(self):
         changed = {}
@@ -335,7 +354,7 @@ class BaseManager(object):
 
         changes = self.changes.to_return()
         result.update(**changes)
-        result.update(dict(changed=changed))
+        result.update(dict(changed=changed, requests=self.requests))
         self._announce_deprecations()
         return result
 
@@ -351,6 +370,28 @@ class BaseManager(object):
                 version=warning['version']
             )
 
+    def load_from_device(self):
+        """Returns the wide IP, loading it on first use
+
+        :return: The wide IP, or None if it does not exist.
+        """
+        if not self._loaded:
+            try:
+                self._resource = self.load_on_device()
+            except iControlUnexpectedHTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._resource = None
+            self._loaded = True
+        return self._resource
+
+    def exists(self):
+        return self.load_from_device() is not None
+
+    @counted
+    def delete_on_device(self, resource):
+        resource.delete()
+
     def present(self):
         if self.want.lb_method is None:
             raise F5ModuleError(
@@ -398,28 +439,25 @@ class BaseManager(object):
 
 
 class UntypedManager(BaseManager):
-    def exists(self):
-        return self.client.api.tm.gtm.wideips.wideip.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.gtm.wideips.wideip.load(
             name=self.want.name,
             partition=self.want.partition
         )
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        result = self.client.api.tm.gtm.wideips.wipeip.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result.modify(**params)
 
     def read_current_from_device(self):
-        resource = self.client.api.tm.gtm.wideips.wideip.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return Parameters(result)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.gtm.wideips.wideip.create(
@@ -427,14 +465,13 @@ class UntypedManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        result = self.client.api.tm.gtm.wideips.wideip.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         if result:
-            result.delete()
+            self.delete_on_device(result)
+            self._loaded = False
 
 
 class TypedManager(BaseManager):
@@ -446,38 +483,28 @@ class TypedManager(BaseManager):
                 "greater than or equal to 12.x"
             )
 
-    def exists(self):
+    @counted
+    def load_on_device(self):
         wideips = self.client.api.tm.gtm.wideips
         collection = getattr(wideips, self.want.collection)
         resource = getattr(collection, self.want.type)
-        result = resource.exists(
+        return resource.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        wideips = self.client.api.tm.gtm.wideips
-        collection = getattr(wideips, self.want.collection)
-        resource = getattr(collection, self.want.type)
-        result = resource.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result.modify(**params)
 
     def read_current_from_device(self):
-        wideips = self.client.api.tm.gtm.wideips
-        collection = getattr(wideips, self.want.collection)
-        resource = getattr(collection, self.want.type)
-        result = resource.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result = result.attrs
         return Parameters(result)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         wideips = self.client.api.tm.gtm.wideips
@@ -488,17 +515,13 @@ class TypedManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        wideips = self.client.api.tm.gtm.wideips
-        collection = getattr(wideips, self.want.collection)
-        resource = getattr(collection, self.want.type)
-        result = resource.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         if result:
-            result.delete()
+            self.delete_on_device(result)
+            self._loaded = False
 
 
 class ArgumentSpec(object):
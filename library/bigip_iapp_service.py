@@ -72,11 +72,8 @@ options:
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
-  - Requires the deepdiff Python package on the host. This is as easy as pip
-    install f5-sdk.
 requirements:
   - f5-sdk
-  - deepdiff
 extends_documentation_fragment: f5
 author:
   - Tim Rupp (@caphrim007)
@@ -156,9 +153,20 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-# only common fields returned
+parameters_diff:
+    description:
+      - The tables, variables and lists of the service that were changed.
+        For tables, only the rows that were added or removed are listed.
+    returned: changed
+    type: dict
+    sample: {"tables": {"pool__members": {"added": [["10.0.0.2", "80"]], "removed": []}}, "variables": {"pool__addr": "changed"}}
 '''
 
+import hashlib
+import json
+
+from collections import Counter
+from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
     AnsibleF5Parameters,
@@ -167,17 +175,36 @@ from ansible.module_utils.f5_utils import (
     iteritems,
     iControlUnexpectedHTTPError
 )
-from deepdiff import DeepDiff
+
+
+def digest(value):
+    """Returns a digest of a JSON serializable value
+
+    Equal values always have the same digest, so large structures can be
+    compared, or counted, by their digests instead of by their contents.
+    """
+    return hashlib.sha1(to_bytes(json.dumps(value, sort_keys=True))).hexdigest()
 
 
 class Parameters(AnsibleF5Parameters):
-    returnables = []
+    returnables = ['parameters_diff']
     api_attributes = [
         'tables', 'variables', 'template', 'lists', 'deviceGroup',
         'inheritedDevicegroup', 'inheritedTrafficGroup', 'trafficGroup'
     ]
     updatables = ['tables', 'variables', 'lists']
 
+    def __init__(self, params=None):
+        # Normalized tables, variables and lists, and their digests, are
+        # built once and kept here until the value they came from is set
+        # again.
+        self._normalized = dict()
+        super(Parameters, self).__init__(params)
+
+    def _reset(self, section):
+        self._normalized.pop(section, None)
+        self._normalized.pop(section + '_digests', None)
+
     def to_return(self):
         result = {}
         for returnable in self.returnables:
@@ -197,6 +224,11 @@ class Parameters(AnsibleF5Parameters):
 
     @property
     def tables(self):
+        if 'tables' not in self._normalized:
+            self._normalized['tables'] = self._normalize_tables()
+        return self._normalized['tables']
+
+    def _normalize_tables(self):
         result = []
         if not self._values['tables']:
             return None
@@ -224,10 +256,16 @@ class Parameters(AnsibleF5Parameters):
 
     @tables.setter
     def tables(self, value):
+        self._reset('tables')
         self._values['tables'] = value
 
     @property
     def variables(self):
+        if 'variables' not in self._normalized:
+            self._normalized['variables'] = self._normalize_variables()
+        return self._normalized['variables']
+
+    def _normalize_variables(self):
         result = []
         if not self._values['variables']:
             return None
@@ -251,10 +289,16 @@ class Parameters(AnsibleF5Parameters):
 
     @variables.setter
     def variables(self, value):
+        self._reset('variables')
         self._values['variables'] = value
 
     @property
     def lists(self):
+        if 'lists' not in self._normalized:
+            self._normalized['lists'] = self._normalize_lists()
+        return self._normalized['lists']
+
+    def _normalize_lists(self):
         result = []
         if not self._values['lists']:
             return None
@@ -277,8 +321,40 @@ class Parameters(AnsibleF5Parameters):
 
     @lists.setter
     def lists(self, value):
+        self._reset('lists')
         self._values['lists'] = value
 
+    def digests(self, section):
+        """Returns the digest of each of the entries in a section by name
+
+        The digest of a table only covers its column names. Its rows are
+        digested one at a time, so that the rows that changed can be found
+        without comparing whole tables.
+
+        :param section: One of tables, variables or lists.
+        :return: Dictionary of entry names to digests.
+        """
+        key = section + '_digests'
+        if key not in self._normalized:
+            result = dict()
+            for item in getattr(self, section) or []:
+                if section == 'tables':
+                    rows = [digest(x['row']) for x in item.get('rows', [])]
+                    result[item['name']] = (digest(item.get('columnNames')), rows)
+                else:
+                    result[item['name']] = digest(item)
+            self._normalized[key] = result
+        return self._normalized[key]
+
+    def table_rows(self, name):
+        """Returns the rows of a table by their digest"""
+        for table in self.tables or []:
+            if table['name'] == name:
+                return dict(
+                    (digest(x['row']), x['row']) for x in table.get('rows', [])
+                )
+        return dict()
+
     @property
     def parameters(self):
         return dict(
@@ -330,6 +406,7 @@ class ModuleManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.changed_sections = []
 
     def _set_changed_options(self):
         changed = {}
@@ -343,15 +420,61 @@ class ModuleManager(object):
         changed = {}
         for key in Parameters.updatables:
             if getattr(self.want, key) is not None:
-                attr1 = getattr(self.want, key)
-                attr2 = getattr(self.have, key)
-                if attr1 != attr2:
-                    changed[key] = str(DeepDiff(attr1, attr2))
+                diff = self._diff_section(key)
+                if diff:
+                    changed[key] = diff
         if changed:
-            self.changes = Parameters(changed)
+            self.changed_sections = list(changed.keys())
+            self.changes = Parameters(dict(parameters_diff=changed))
             return True
         return False
 
+    def _diff_section(self, section):
+        """Compares the entries of a section by their digests
+
+        :return: Dictionary of the names of the entries that differ, and
+                 how. For tables whose columns are unchanged, this is the
+                 rows that were added and removed.
+        """
+        want = self.want.digests(section)
+        have = self.have.digests(section)
+        result = dict()
+        for name in sorted(set(want) | set(have)):
+            if name not in have:
+                result[name] = 'added'
+            elif name not in want:
+                result[name] = 'removed'
+            elif want[name] == have[name]:
+                continue
+            elif section == 'tables' and want[name][0] == have[name][0]:
+                result[name] = self._diff_rows(name, want[name][1], have[name][1])
+            else:
+                result[name] = 'changed'
+        return result
+
+    def _diff_rows(self, name, want, have):
+        added = Counter(want)
+        added.subtract(Counter(have))
+        removed = Counter(have)
+        removed.subtract(Counter(want))
+        result = dict(added=[], removed=[])
+        if any(x > 0 for x in added.values()):
+            rows = self.want.table_rows(name)
+            for key in want:
+                if added[key] > 0:
+                    added[key] -= 1
+                    result['added'].append(rows[key])
+        if any(x > 0 for x in removed.values()):
+            rows = self.have.table_rows(name)
+            for key in have:
+                if removed[key] > 0:
+                    removed[key] -= 1
+                    result['removed'].append(rows[key])
+        if not result['added'] and not result['removed']:
+            # Only the order of the rows changed
+            result['reordered'] = True
+        return result
+
     def exec_module(self):
         changed = False
         result = dict()
@@ -407,12 +530,17 @@ class ModuleManager(object):
 
     def update_on_device(self):
         params = self.want.api_params()
+        if not self.want.force:
+            # Only the sections that changed are sent to the device
+            for section in Parameters.updatables:
+                if section not in self.changed_sections:
+                    params.pop(section, None)
         params['execute-action'] = 'definition'
         resource = self.client.api.tm.sys.application.services.service.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        resource.update(**params)
+        resource.modify(**params)
 
     def read_current_from_device(self):
         result = self.client.api.tm.sys.application.services.service.load(
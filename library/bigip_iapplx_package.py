@@ -48,6 +48,11 @@ options:
     choices:
       - present
       - absent
+  timeout:
+    description:
+      - Number of seconds to wait for package management tasks to finish.
+    default: 60
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -95,11 +100,19 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-# only common fields returned
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for
+        package management tasks to finish.
+    returned: changed
+    type: dict
+    sample: {"task": {"seconds": 2.1, "polls": 3, "waits": 1}}
 '''
 
 from distutils.version import LooseVersion
+import hashlib
 import os
+import random
 import subprocess
 import time
 
@@ -114,6 +127,34 @@ except ImportError:
     HAS_F5SDK = False
 
 
+def file_checksum(fileobj, chunk_size=1024 * 1024):
+    """Returns the size and MD5 sum of a file, reading it only once"""
+    md5 = hashlib.md5()
+    size = 0
+    fileobj.seek(0)
+    while True:
+        data = fileobj.read(chunk_size)
+        if not data:
+            break
+        md5.update(data)
+        size += len(data)
+    fileobj.seek(0)
+    return size, md5.hexdigest()
+
+
+def remote_file_matches(api, remote_path, size, checksum):
+    """Checks whether a file on the device has the given size and MD5 sum
+
+    The sum is only computed on the device when the size matches.
+    """
+    cmd = '-c "[ $(stat -c %s {0} 2>/dev/null) = {1} ] && md5sum {0} | cut -c1-32"'.format(
+        remote_path, size
+    )
+    output = api.tm.util.bash.exec_cmd('run', utilCmdArgs=cmd)
+    result = str(getattr(output, 'commandResult', '')).strip()
+    return result == checksum
+
+
 class Parameters(AnsibleF5Parameters):
     api_attributes = []
     returnables = []
@@ -179,6 +220,39 @@ class ModuleManager(object):
         self.client = client
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.wait_times = dict()
+
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for a package management task to finish
+
+        Tasks usually finish within a second or two, so the first checks are
+        close together and the delay doubles from there. The wait is given
+        up after a minute unless the module was given a timeout. The time
+        spent is recorded under wait_times[operation].
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 60
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
 
     def exec_module(self):
         result = dict()
@@ -202,6 +276,8 @@ class ModuleManager(object):
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
         return result
 
     def present(self):
@@ -259,10 +335,14 @@ class ModuleManager(object):
             raise F5ModuleError("Failed to create the iApp template")
 
     def upload_to_device(self):
-        upload = self.client.api.shared.file_transfer.uploads
-        upload.upload_file(
-            self.want.package
-        )
+        uploads = self.client.api.shared.file_transfer.uploads
+        with open(self.want.package, 'rb') as fileobj:
+            size, checksum = file_checksum(fileobj)
+            remote_path = "/var/config/rest/downloads/{0}".format(self.want.package_file)
+            if remote_file_matches(self.client.api, remote_path, size, checksum):
+                return False
+        uploads.upload_file(self.want.package)
+        return True
 
     def remove_package_file_from_device(self):
         self.client.api.tm.util.unix_rm.exec_cmd(
@@ -303,11 +383,11 @@ class ModuleManager(object):
         return False
 
     def _wait_for_task(self, task):
-        for x in range(0, 60):
+        def finished():
             task.refresh()
-            if task.status in ['FINISHED', 'FAILED']:
-                return task.status
-            time.sleep(1)
+            return task.status in ['FINISHED', 'FAILED']
+
+        self._wait_until('task', finished, interval=0.25)
         return task.status
 
     def enable_iapplx_on_device(self):
@@ -325,7 +405,11 @@ class ArgumentSpec(object):
                 default='present',
                 choices=['present', 'absent']
             ),
-            package=dict()
+            package=dict(),
+            timeout=dict(
+                type='int',
+                default=60
+            )
         )
         self.f5_product_name = 'bigip'
         self.required_if = [
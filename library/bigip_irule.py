@@ -117,10 +117,16 @@ content:
     returned: changed and success
     type: string
     sample: "when LB_FAILED { set wipHost [LB::server addr] }"
+requests:
+    description: Number of requests made to the device.
+    returned: always
+    type: int
+    sample: 1
 '''
 
 import os
 
+from functools import wraps
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
     AnsibleF5Parameters,
@@ -130,6 +136,15 @@ from ansible.module_utils.f5_utils import (
 )
 
 
+def counted(method):
+    """Counts each call of a method that sends one request for the rule"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'apiAnonymous': 'content'
@@ -220,6 +235,9 @@ class BaseManager(object):
         self.client = client
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def exec_module(self):
         changed = False
@@ -236,7 +254,7 @@ class BaseManager(object):
 
         changes = self.changes.to_return()
         result.update(**changes)
-        result.update(dict(changed=changed))
+        result.update(dict(changed=changed, requests=self.requests))
         return result
 
     def _set_changed_options(self):
@@ -260,6 +278,24 @@ class BaseManager(object):
             return True
         return False
 
+    def load_from_device(self):
+        """Returns the LTM or GTM rule, loading it on first use
+
+        :return: The rule, or None if the device has no rule of that name.
+        """
+        if not self._loaded:
+            try:
+                self._resource = self.load_on_device()
+            except iControlUnexpectedHTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._resource = None
+            self._loaded = True
+        return self._resource
+
+    def exists(self):
+        return self.load_from_device() is not None
+
     def present(self):
         if not self.want.content and not self.want.src:
             raise F5ModuleError(
@@ -309,79 +345,68 @@ class BaseManager(object):
 
 
 class LtmManager(BaseManager):
-    def exists(self):
-        result = self.client.api.tm.ltm.rules.rule.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.ltm.rules.rule.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.changes.api_params()
-        resource = self.client.api.tm.ltm.rules.rule.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.update(**params)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
-        import q
-        q.q(params)
         resource = self.client.api.tm.ltm.rules.rule
         resource.create(
             name=self.want.name,
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def read_current_from_device(self):
-        resource = self.client.api.tm.ltm.rules.rule.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return Parameters(result)
 
+    @counted
     def remove_from_device(self):
-        resource = self.client.api.tm.ltm.rules.rule.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.delete()
+        self._loaded = False
 
 
 class GtmManager(BaseManager):
     def read_current_from_device(self):
-        resource = self.client.api.tm.gtm.rules.rule.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return Parameters(result)
 
+    @counted
     def remove_from_device(self):
-        resource = self.client.api.tm.gtm.rules.rule.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.delete()
+        self._loaded = False
 
-    def exists(self):
-        result = self.client.api.tm.gtm.rules.rule.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.gtm.rules.rule.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.changes.api_params()
-        resource = self.client.api.tm.gtm.rules.rule.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.update(**params)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         resource = self.client.api.tm.gtm.rules.rule
@@ -390,6 +415,7 @@ class GtmManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
 
 class ArgumentSpec(object):
@@ -179,6 +179,11 @@ time_until_up:
     returned: changed
     type: int
     sample: 2
+requests:
+    description: Number of requests made to the device.
+    returned: always
+    type: int
+    sample: 1
 '''
 
 import os
@@ -195,6 +200,7 @@ from ansible.module_utils.f5_utils import HAS_F5SDK
 from ansible.module_utils.f5_utils import F5ModuleError
 from ansible.module_utils.f5_utils import iteritems
 from ansible.module_utils.f5_utils import defaultdict
+from functools import wraps
 
 try:
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
@@ -202,6 +208,15 @@ except ImportError:
     HAS_F5SDK = False
 
 
+def counted(method):
+    """Counts each call of a method that sends one request for the monitor"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     def __init__(self, params=None):
         self._values = defaultdict(lambda: None)
@@ -629,10 +644,32 @@ class BaseManager(object):
 
         changes = self.changes.to_return()
         result.update(**changes)
-        result.update(dict(changed=changed))
+        result.update(dict(changed=changed, requests=self.requests))
         self._announce_deprecations()
         return result
 
+    def load_from_device(self):
+        """Returns the TCP monitor, loading it on first use
+
+        :return: The monitor, or None if it does not exist.
+        """
+        if not self._loaded:
+            try:
+                self._resource = self.load_on_device()
+            except iControlUnexpectedHTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._resource = None
+            self._loaded = True
+        return self._resource
+
+    def exists(self):
+        return self.load_from_device() is not None
+
+    @counted
+    def delete_on_device(self, resource):
+        resource.delete()
+
     def present(self):
         if self.exists():
             return self.update()
@@ -682,6 +719,9 @@ class TcpManager(BaseManager):
         self.have = None
         self.want = ParametersTcp(self.client.module.params)
         self.changes = ParametersTcp()
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def _set_changed_options(self):
         changed = {}
@@ -719,28 +759,24 @@ class TcpManager(BaseManager):
             self.want.update({'port': '*'})
 
     def read_current_from_device(self):
-        resource = self.client.api.tm.ltm.monitor.tcps.tcp.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return ParametersTcp(result)
 
-    def exists(self):
-        result = self.client.api.tm.ltm.monitor.tcps.tcp.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.ltm.monitor.tcps.tcp.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.changes.api_params()
-        result = self.client.api.tm.ltm.monitor.tcps.tcp.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result.modify(**params)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.ltm.monitor.tcps.tcp.create(
@@ -748,14 +784,13 @@ class TcpManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        result = self.client.api.tm.ltm.monitor.tcps.tcp.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         if result:
-            result.delete()
+            self.delete_on_device(result)
+            self._loaded = False
 
 
 # TODO: Remove this in 2.5 and put it its own module
@@ -765,6 +800,9 @@ class TcpEchoManager(BaseManager):
         self.have = None
         self.want = ParametersEcho(self.client.module.params)
         self.changes = ParametersEcho()
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def _set_default_creation_values(self):
         if self.want.timeout is None:
@@ -800,28 +838,24 @@ class TcpEchoManager(BaseManager):
         return False
 
     def read_current_from_device(self):
-        resource = self.client.api.tm.ltm.monitor.tcp_echos.tcp_echo.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return ParametersEcho(result)
 
-    def exists(self):
-        result = self.client.api.tm.ltm.monitor.tcp_echos.tcp_echo.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.ltm.monitor.tcp_echos.tcp_echo.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        result = self.client.api.tm.ltm.monitor.tcp_echos.tcp_echo.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result.modify(**params)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.ltm.monitor.tcp_echos.tcp_echo.create(
@@ -829,14 +863,13 @@ class TcpEchoManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        result = self.client.api.tm.ltm.monitor.tcp_echos.tcp_echo.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         if result:
-            result.delete()
+            self.delete_on_device(result)
+            self._loaded = False
 
 
 # TODO: Remove this in 2.5 and put it its own module
@@ -846,6 +879,9 @@ class TcpHalfOpenManager(BaseManager):
         self.have = None
         self.want = ParametersHalfOpen(self.client.module.params)
         self.changes = ParametersHalfOpen()
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def _set_changed_options(self):
         changed = {}
@@ -883,28 +919,24 @@ class TcpHalfOpenManager(BaseManager):
             self.want.update({'port': '*'})
 
     def read_current_from_device(self):
-        resource = self.client.api.tm.ltm.monitor.tcp_half_opens.tcp_half_open.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         result = resource.attrs
         return ParametersHalfOpen(result)
 
-    def exists(self):
-        result = self.client.api.tm.ltm.monitor.tcp_half_opens.tcp_half_open.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.ltm.monitor.tcp_half_opens.tcp_half_open.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        result = self.client.api.tm.ltm.monitor.tcp_half_opens.tcp_half_open.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result.modify(**params)
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.ltm.monitor.tcp_half_opens.tcp_half_open.create(
@@ -912,14 +944,13 @@ class TcpHalfOpenManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        result = self.client.api.tm.ltm.monitor.tcp_half_opens.tcp_half_open.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         if result:
-            result.delete()
+            self.delete_on_device(result)
+            self._loaded = False
 
 
 class ArgumentSpec(object):
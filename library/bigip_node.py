@@ -56,7 +56,7 @@ options:
   name:
     description:
       - Specifies the name of the node.
-    required: True
+      - Required unless C(nodes) is provided.
   monitor_type:
     description:
       - Monitor rule type when C(monitors) is specified. When creating a new
@@ -102,6 +102,32 @@ options:
   description:
     description:
       - Specifies descriptive text that identifies the node.
+  timeout:
+    description:
+      - Number of seconds to wait for the FQDN of a new node to be
+        resolved. The node is created even if this time passes first.
+    default: 60
+    version_added: 2.5
+  nodes:
+    description:
+      - List of nodes to manage in a single task, instead of the one named
+        by C(name).
+      - Each item is a dictionary that can contain the C(name), C(address),
+        C(fqdn), C(description), C(monitor_type), C(quorum), C(monitors)
+        and C(state) options. C(name) is required. When C(state) is not
+        given, the C(state) of the task is used.
+      - The nodes in the partition are read in a single request. The nodes
+        that need to be created, updated or removed are then changed in
+        transactions of at most C(transaction_size) nodes each.
+      - The FQDN checks of all new nodes are waited on together, for at
+        most C(timeout) seconds.
+    version_added: 2.5
+  transaction_size:
+    description:
+      - Maximum number of nodes changed in each transaction when C(nodes)
+        is provided.
+    default: 100
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as
     pip install f5-sdk
@@ -180,6 +206,24 @@ EXAMPLES = '''
       fqdn: "foo.bar.com"
       name: "10.20.30.40"
   delegate_to: localhost
+
+- name: Add many nodes and remove an old one
+  bigip_node:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      partition: "Common"
+      nodes:
+          - name: "web1"
+            address: "10.20.30.41"
+          - name: "web2"
+            fqdn: "web2.mydomain.com"
+          - name: "web3"
+            address: "10.20.30.43"
+            state: "offline"
+          - name: "web0"
+            state: "absent"
+  delegate_to: localhost
 '''
 
 RETURN = '''
@@ -219,10 +263,25 @@ state:
     returned: changed and success
     type: string
     sample: "m_of_n"
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for
+        FQDN checks on a new node.
+    returned: changed
+    type: dict
+    sample: {"fqdn_checks": {"seconds": 1.6, "polls": 3, "waits": 1}}
+nodes:
+    description:
+      - What was done to each of the nodes in C(nodes). The status is one
+        of C(created), C(updated), C(unchanged), C(removed) or C(absent).
+    returned: changed and success
+    type: list
+    sample: [{"name": "web1", "status": "created"}]
 '''
 
 import os
 import re
+import random
 import time
 
 try:
@@ -240,6 +299,7 @@ from ansible.module_utils.f5_utils import defaultdict
 
 try:
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
+    from f5.bigip.contexts import TransactionContextManager
 except ImportError:
     HAS_F5SDK = False
 
@@ -504,6 +564,7 @@ class ModuleManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Changes()
+        self.wait_times = dict()
 
     def _set_changed_options(self):
         changed = {}
@@ -543,6 +604,38 @@ class ModuleManager(object):
                 version=warning['version']
             )
 
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for the device to resolve the FQDN of new nodes
+
+        The first checks are close together because the DNS lookup is
+        usually quick, and the delay doubles from there. The wait is given
+        up after a minute unless the module was given a timeout. The checks
+        made are counted in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 60
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
+
     def exec_module(self):
         changed = False
         result = dict()
@@ -560,6 +653,8 @@ class ModuleManager(object):
         result.update(**changes)
         result.update(dict(changed=changed))
         self._announce_deprecations()
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
         return result
 
     def present(self):
@@ -701,12 +796,15 @@ class ModuleManager(object):
         self._wait_for_fqdn_checks(resource)
 
     def _wait_for_fqdn_checks(self, resource):
-        while True:
+        def checked():
             if resource.state == 'fqdn-checking':
                 resource.refresh()
-                time.sleep(1)
-            else:
-                break
+                return resource.state != 'fqdn-checking'
+            return True
+
+        # The node exists at this point, so running out of time only
+        # means that its FQDN has not been resolved yet.
+        self._wait_until('fqdn_checks', checked, interval=0.25)
 
     def remove_from_device(self):
         result = self.client.api.tm.ltm.nodes.node.load(
@@ -717,11 +815,179 @@ class ModuleManager(object):
             result.delete()
 
 
+class BulkManager(ModuleManager):
+    """Manages all of the nodes in the nodes parameter
+
+    Rather than checking for, loading and changing each node in turn,
+    the nodes in the partition are read in a single request and compared
+    with the nodes parameter. This produces a plan of the nodes to create,
+    update and remove, which is applied in transactions of at most
+    transaction_size nodes each.
+    """
+    item_keys = [
+        'name', 'address', 'fqdn', 'description', 'monitor_type',
+        'quorum', 'monitors', 'state'
+    ]
+
+    def exec_module(self):
+        if self.want.transaction_size < 1:
+            raise F5ModuleError(
+                "The 'transaction_size' parameter must be at least 1."
+            )
+        try:
+            current = self.read_nodes_from_device()
+            plan, result = self.make_plan(current)
+            if not self.client.check_mode:
+                self.apply_plan(plan)
+        except iControlUnexpectedHTTPError as e:
+            raise F5ModuleError(str(e))
+        changed = any(x['status'] not in ['unchanged', 'absent'] for x in result)
+        result = dict(changed=changed, nodes=result)
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
+        return result
+
+    def get_manager(self, item):
+        if not isinstance(item, dict) or not item.get('name'):
+            raise F5ModuleError(
+                "Each of the nodes must have a name."
+            )
+        params = dict(self.client.module.params)
+        for key in self.item_keys:
+            params[key] = item.get(key, None)
+        if params['state'] is None or self.want.state == 'absent':
+            params['state'] = self.want.state
+        manager = ModuleManager(self.client)
+        manager.want = Parameters(params)
+        return manager
+
+    def make_plan(self, current):
+        """Works out what needs to be done to each node
+
+        :param current: Dictionary of node names to the nodes on the device.
+        :return: Tuple of the plan and the status of each node. The plan is
+                 a dictionary of the nodes to create, update, take offline
+                 and remove.
+        """
+        plan = dict(create=[], update=[], offline=[], remove=[])
+        result = []
+        for item in self.want.nodes:
+            manager = self.get_manager(item)
+            name = manager.want.name
+            resource = current.get(name, None)
+            if manager.want.state == 'absent':
+                if resource is None:
+                    status = 'absent'
+                else:
+                    plan['remove'].append(resource)
+                    status = 'removed'
+            elif resource is None:
+                manager._check_required_creation_vars()
+                manager._munge_creation_state_for_device()
+                plan['create'].append((name, manager.want.api_params()))
+                # Nodes cannot be created offline, so they are updated
+                # after they have been created.
+                if manager.want.is_offline:
+                    plan['offline'].append(name)
+                status = 'created'
+            else:
+                manager.have = Parameters(resource.attrs)
+                if manager.should_update():
+                    plan['update'].append((resource, manager.changes.api_params()))
+                    status = 'updated'
+                else:
+                    status = 'unchanged'
+            result.append(dict(name=name, status=status))
+        return plan, result
+
+    def apply_plan(self, plan):
+        # The nodes read from the device share the session of the
+        # transaction, so their changes are part of the transaction too.
+        for batch in self._batches(plan['remove']):
+            with self._transaction():
+                for resource in batch:
+                    resource.delete()
+        for batch in self._batches(plan['create']):
+            with self._transaction() as api:
+                for name, params in batch:
+                    api.tm.ltm.nodes.node.create(
+                        name=name,
+                        partition=self.want.partition,
+                        **params
+                    )
+        for batch in self._batches(plan['update']):
+            with self._transaction():
+                for resource, params in batch:
+                    resource.modify(**params)
+        for batch in self._batches(plan['offline']):
+            with self._transaction() as api:
+                for name in batch:
+                    resource = api.tm.ltm.nodes.node.load(
+                        name=name,
+                        partition=self.want.partition
+                    )
+                    resource.modify(session='user-disabled', state='user-down')
+        fqdns = [name for name, params in plan['create'] if params.get('fqdn')]
+        if fqdns:
+            self._wait_for_all_fqdn_checks(fqdns)
+
+    def _batches(self, items):
+        size = self.want.transaction_size
+        for index in range(0, len(items), size):
+            yield items[index:index + size]
+
+    def _transaction(self):
+        tx = self.client.api.tm.transactions.transaction
+        return TransactionContextManager(tx)
+
+    def _wait_for_all_fqdn_checks(self, names):
+        names = set(names)
+
+        def checked():
+            current = self.read_node_states_from_device()
+            return not any(
+                current[x] == 'fqdn-checking' for x in names if x in current
+            )
+
+        # The nodes exist at this point, so running out of time only
+        # means that some of their FQDNs have not been resolved yet.
+        self._wait_until('fqdn_checks', checked, interval=0.25)
+
+    def read_nodes_from_device(self):
+        """Returns every node in the partition by name
+
+        :return: Dictionary of node names to nodes.
+        """
+        params = "$filter=partition+eq+'{0}'".format(self.want.partition)
+        collection = self.client.api.tm.ltm.nodes.get_collection(
+            requests_params=dict(params=params)
+        )
+        result = dict((x.name, x) for x in collection)
+        return result
+
+    def read_node_states_from_device(self):
+        """Returns the state of every node in the partition by name
+
+        Only the name and state of each node are requested. As the kind is
+        not among them, the SDK returns each node as a plain dict.
+
+        :return: Dictionary of node names to states.
+        """
+        params = "$select=name,state&$filter=partition+eq+'{0}'".format(
+            self.want.partition
+        )
+        collection = self.client.api.tm.ltm.nodes.get_collection(
+            requests_params=dict(params=params)
+        )
+        result = dict((x['name'], x.get('state', None)) for x in collection)
+        return result
+
+
 class ArgumentSpec(object):
     def __init__(self):
         self.supports_check_mode = True
         self.argument_spec = dict(
-            name=dict(required=True),
+            name=dict(),
             address=dict(
                 aliases=['host', 'ip']
             ),
@@ -739,8 +1005,23 @@ class ArgumentSpec(object):
             state=dict(
                 choices=['absent', 'present', 'enabled', 'disabled', 'offline'],
                 default='present'
+            ),
+            timeout=dict(
+                type='int',
+                default=60
+            ),
+            nodes=dict(type='list'),
+            transaction_size=dict(
+                type='int',
+                default=100
             )
         )
+        self.mutually_exclusive = [
+            ['name', 'nodes']
+        ]
+        self.required_one_of = [
+            ['name', 'nodes']
+        ]
         self.f5_product_name = 'bigip'
 
 
@@ -750,6 +1031,8 @@ def main():
     client = AnsibleF5Client(
         argument_spec=spec.argument_spec,
         supports_check_mode=spec.supports_check_mode,
+        mutually_exclusive=spec.mutually_exclusive,
+        required_one_of=spec.required_one_of,
         f5_product_name=spec.f5_product_name
     )
     try:
@@ -759,7 +1042,10 @@ def main():
         if not HAS_NETADDR:
             raise F5ModuleError("The python netaddr module is required")
 
-        mm = ModuleManager(client)
+        if client.module.params['nodes']:
+            mm = BulkManager(client)
+        else:
+            mm = ModuleManager(client)
         results = mm.exec_module()
         client.module.exit_json(**results)
     except F5ModuleError as e:
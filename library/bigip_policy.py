@@ -153,12 +153,71 @@ EXAMPLES = '''
 import re
 
 from ansible.module_utils.f5_utils import *
+from bisect import bisect_left
 from distutils.version import LooseVersion
 from f5.bigip.contexts import TransactionContextManager
-from f5.sdk_exception import NonExtantPolicyRule
 from icontrol.exceptions import iControlUnexpectedHTTPError
 
 
+def plan_ordinals(wanted, current):
+    """Returns the ordinals that put rules in the wanted order
+
+    The longest run of rules whose ordinals on the device are already in
+    the wanted order keep them. The other rules are given a free ordinal
+    between those of their neighbours, so that only they need to be
+    changed. When there is no room between the neighbours, every rule is
+    numbered from zero instead.
+
+    :param wanted: List of rule names in the wanted order.
+    :param current: Dictionary of the ordinals of the rules on the device.
+    :return: Dictionary of the ordinals for the wanted rules.
+    """
+    existing = [x for x in wanted if x in current]
+
+    # Longest increasing subsequence of the existing ordinals
+    tails = []
+    tail_names = []
+    previous = dict()
+    for name in existing:
+        ordinal = current[name]
+        index = bisect_left(tails, ordinal)
+        previous[name] = tail_names[index - 1] if index > 0 else None
+        if index == len(tails):
+            tails.append(ordinal)
+            tail_names.append(name)
+        else:
+            tails[index] = ordinal
+            tail_names[index] = name
+    kept = set()
+    name = tail_names[-1] if tail_names else None
+    while name is not None:
+        kept.add(name)
+        name = previous[name]
+
+    wanted_names = set(wanted)
+    taken = set(v for k, v in iteritems(current) if k not in wanted_names)
+    taken.update(current[x] for x in kept)
+
+    result = dict()
+    low = -1
+    for index, name in enumerate(wanted):
+        if name in kept:
+            low = current[name]
+            result[name] = low
+            continue
+        following = [current[x] for x in wanted[index + 1:] if x in kept]
+        high = following[0] if following else None
+        ordinal = low + 1
+        while ordinal in taken:
+            ordinal += 1
+        if high is not None and ordinal >= high:
+            return dict((x, idx) for idx, x in enumerate(wanted))
+        taken.add(ordinal)
+        result[name] = ordinal
+        low = ordinal
+    return result
+
+
 class Parameters(AnsibleF5Parameters):
     api_attributes = [
         'strategy', 'description'
@@ -278,6 +337,8 @@ class BaseManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Changes()
+        self._policy = None
+        self._rules = None
 
     def _set_changed_options(self):
         changed = {}
@@ -319,22 +380,33 @@ class BaseManager(object):
             self.want.update(dict(strategy='first'))
 
     def _get_rule_names(self, resource):
-        rules = resource.rules_s.get_collection()
-        rules.sort(key=lambda x: x.ordinal)
+        self._rules = self._read_rules_from_device(resource)
+        rules = sorted(self._rules.values(), key=lambda x: int(x.ordinal))
         result = [x.name for x in rules]
         return result
 
+    def _read_rules_from_device(self, resource):
+        rules = resource.rules_s.get_collection()
+        result = dict((str(x.name), x) for x in rules)
+        return result
+
     def _upsert_policy_rules_on_device(self, policy):
+        # The rules read with the policy share the session of the
+        # transaction, so their changes are part of the transaction too.
+        # A rule is only sent to the device if it is created, or if its
+        # ordinal must change to put it in the wanted order.
         rules = self.changes.rules
         if rules is None:
             rules = []
-        for idx, rule in enumerate(rules):
-            try:
-                resource = policy.rules_s.rules.load(name=rule)
-                if int(resource.ordinal) != idx:
-                    resource.modify(ordinal=idx)
-            except NonExtantPolicyRule:
-                policy.rules_s.rules.create(name=rule, ordinal=idx)
+        current = dict(
+            (k, int(v.ordinal)) for k, v in iteritems(self._rules)
+        )
+        ordinals = plan_ordinals(rules, current)
+        for rule in rules:
+            if rule not in self._rules:
+                policy.rules_s.rules.create(name=rule, ordinal=ordinals[rule])
+            elif current[rule] != ordinals[rule]:
+                self._rules[rule].modify(ordinal=ordinals[rule])
 
 
 class SimpleManager(BaseManager):
@@ -364,6 +436,7 @@ class SimpleManager(BaseManager):
         rules = self._get_rule_names(resource)
         result = Parameters(resource.attrs)
         result.update(dict(rules=rules))
+        self._policy = resource
         return result
 
     def exists(self):
@@ -380,14 +453,10 @@ class SimpleManager(BaseManager):
         # by just patching the policy endpoint. You instead need to patch
         # each of the rule endpoints.
         tx = self.client.api.tm.transactions.transaction
-        with TransactionContextManager(tx) as api:
-            resource = api.tm.ltm.policys.policy.load(
-                name=self.want.name,
-                partition=self.want.partition
-            )
+        with TransactionContextManager(tx):
             if params:
-                resource.modify(**params)
-            self._upsert_policy_rules_on_device(resource)
+                self._policy.modify(**params)
+            self._upsert_policy_rules_on_device(self._policy)
 
     def create(self):
         self._validate_creation_parameters()
@@ -399,6 +468,7 @@ class SimpleManager(BaseManager):
 
     def create_on_device(self):
         params = self.want.api_params()
+        self._rules = dict()
 
         tx = self.client.api.tm.transactions.transaction
         with TransactionContextManager(tx) as api:
@@ -443,6 +513,10 @@ class SimpleManager(BaseManager):
 
 
 class ComplexManager(BaseManager):
+    def __init__(self, client):
+        super(ComplexManager, self).__init__(client)
+        self._exists = dict()
+
     def exec_module(self):
         changed = False
         result = dict()
@@ -493,6 +567,7 @@ class ComplexManager(BaseManager):
         if self.client.check_mode:
             return True
         self.remove_from_device()
+        self._exists.clear()
         if self.draft_exists() or self.policy_exists():
             raise F5ModuleError("Failed to delete the policy")
         return True
@@ -528,24 +603,29 @@ class ComplexManager(BaseManager):
         rules = self._get_rule_names(resource)
         result = Parameters(resource.attrs)
         result.update(dict(rules=rules))
+        self._policy = resource
         return result
 
     def policy_exists(self):
-        params = dict(
-            name=self.want.name,
-            partition=self.want.partition
-        )
-        result = self.client.api.tm.ltm.policys.policy.exists(**params)
-        return result
+        # Whether the policy and its draft exist is asked several times
+        # during a run, but only changes when this module changes it.
+        if 'policy' not in self._exists:
+            params = dict(
+                name=self.want.name,
+                partition=self.want.partition
+            )
+            self._exists['policy'] = self.client.api.tm.ltm.policys.policy.exists(**params)
+        return self._exists['policy']
 
     def draft_exists(self):
-        params = dict(
-            name=self.want.name,
-            partition=self.want.partition,
-            subPath='Drafts'
-        )
-        result = self.client.api.tm.ltm.policys.policy.exists(**params)
-        return result
+        if 'draft' not in self._exists:
+            params = dict(
+                name=self.want.name,
+                partition=self.want.partition,
+                subPath='Drafts'
+            )
+            self._exists['draft'] = self.client.api.tm.ltm.policys.policy.exists(**params)
+        return self._exists['draft']
 
     def _create_new_policy_draft(self):
         params = self.want.api_params()
@@ -555,34 +635,47 @@ class ComplexManager(BaseManager):
             subPath='Drafts',
             **params
         )
-        self.client.api.tm.ltm.policys.policy.create(**params)
+        self._policy = self.client.api.tm.ltm.policys.policy.create(**params)
+        self._rules = dict()
+        self._exists['draft'] = True
         return True
 
     def _create_existing_policy_draft(self):
-        params = dict(
-            name=self.want.name,
-            partition=self.want.partition,
-        )
-        resource = self.client.api.tm.ltm.policys.policy.load(**params)
+        resource = self._policy
+        if resource is None:
+            params = dict(
+                name=self.want.name,
+                partition=self.want.partition,
+            )
+            resource = self.client.api.tm.ltm.policys.policy.load(**params)
+
+        # The policy now refers to the draft, but the rules that were read
+        # still refer to the published policy.
         resource.draft()
+        self._policy = resource
+        self._rules = None
+        self._exists['draft'] = True
         return True
 
     def update_on_device(self):
         params = self.changes.api_params()
+        if self._policy is None:
+            self._policy = self.client.api.tm.ltm.policys.policy.load(
+                name=self.want.name,
+                partition=self.want.partition,
+                subPath='Drafts'
+            )
+        if self._rules is None:
+            self._rules = self._read_rules_from_device(self._policy)
 
         # Using a transaction because the rule ordering cannot be changed
         # by just patching the policy endpoint. You instead need to patch
         # each of the rule endpoints.
         tx = self.client.api.tm.transactions.transaction
-        with TransactionContextManager(tx) as api:
-            resource = api.tm.ltm.policys.policy.load(
-                name=self.want.name,
-                partition=self.want.partition,
-                subPath='Drafts'
-            )
+        with TransactionContextManager(tx):
             if params:
-                resource.modify(**params)
-            self._upsert_policy_rules_on_device(resource)
+                self._policy.modify(**params)
+            self._upsert_policy_rules_on_device(self._policy)
 
     def publish(self):
         resource = self.client.api.tm.ltm.policys.policy.load(
@@ -591,6 +684,7 @@ class ComplexManager(BaseManager):
             subPath='Drafts'
         )
         resource.publish()
+        self._exists.update(dict(draft=False, policy=True))
         return True
 
     def create(self):
@@ -674,7 +768,7 @@ class ModuleManager(object):
         return manager.exec_module()
 
     def get_manager(self, type):
-        if type == 'traffic':
+        if type == 'simple_traffic':
             return SimpleManager(self.client)
         elif type == 'complex_traffic':
             return ComplexManager(self.client)
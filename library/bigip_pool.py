@@ -122,6 +122,19 @@ options:
     required: False
     default: 'Common'
     version_added: 2.5
+  members:
+    description:
+      - List of pool members that the pool should contain. Each item is a
+        dictionary containing the C(address) and C(port) of the member, and
+        optionally its C(ratio), C(priority_group), C(connection_limit) and
+        C(description).
+      - When specified, the pool membership is reconciled against this list.
+        Members that are not in the list are removed, missing members are
+        added and members whose settings differ are modified. All of these
+        changes are sent to the device in a single request.
+      - An empty list removes all members from the pool.
+      - Mutually exclusive with the deprecated C(host) and C(port) options.
+    version_added: 2.5
 notes:
   - Requires BIG-IP software version >= 11.
   - F5 developed module 'F5-SDK' required (https://github.com/F5Networks/f5-common-python).
@@ -224,6 +237,22 @@ EXAMPLES = '''
           - tcp
   delegate_to: localhost
 
+- name: Set the complete list of pool members
+  bigip_pool:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      state: "present"
+      name: "my-pool"
+      partition: "Common"
+      members:
+          - address: 10.10.10.10
+            port: 80
+          - address: 10.10.10.11
+            port: 80
+            ratio: 2
+  delegate_to: localhost
+
 - name: Remove pool member from pool
   bigip_pool:
       server: "lb.mydomain.com"
@@ -298,6 +327,26 @@ reselect_tries:
     returned: changed
     type: int
     sample: 10
+members_added:
+    description: Names of the pool members that were added by C(members).
+    returned: changed
+    type: list
+    sample: ['10.10.10.11:80']
+members_removed:
+    description: Names of the pool members that were removed by C(members).
+    returned: changed
+    type: list
+    sample: ['10.10.10.12:80']
+members_modified:
+    description: Names of the pool members whose settings were changed by C(members).
+    returned: changed
+    type: list
+    sample: ['10.10.10.10:80']
+requests:
+    description: Number of requests made to the device.
+    returned: always
+    type: int
+    sample: 1
 '''
 
 import re
@@ -310,9 +359,19 @@ from ansible.module_utils.f5_utils import F5ModuleError
 from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 from ansible.module_utils.f5_utils import defaultdict
 from ansible.module_utils.f5_utils import iteritems
+from functools import wraps
 from netaddr import IPAddress, AddrFormatError
 
 
+def counted(method):
+    """Counts each call of a method that sends one request for the pool"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'loadBalancingMode': 'lb_method',
@@ -330,7 +389,8 @@ class Parameters(AnsibleF5Parameters):
     returnables = [
         'monitor_type', 'quorum', 'monitors', 'service_down_action',
         'description', 'lb_method', 'host', 'port', 'slow_ramp_time',
-        'reselect_tries', 'monitor', 'member_name', 'name', 'partition'
+        'reselect_tries', 'monitor', 'member_name', 'name', 'partition',
+        'members_added', 'members_removed', 'members_modified'
     ]
 
     updatables = [
@@ -339,6 +399,13 @@ class Parameters(AnsibleF5Parameters):
         'host', 'port'
     ]
 
+    member_api_map = {
+        'ratio': 'ratio',
+        'priority_group': 'priorityGroup',
+        'connection_limit': 'connectionLimit',
+        'description': 'description'
+    }
+
     def __init__(self, params=None):
         self._values = defaultdict(lambda: None)
         if params:
@@ -512,6 +579,51 @@ class Parameters(AnsibleF5Parameters):
         mname = str(self.host) + ':' + str(self.port)
         return mname
 
+    @property
+    def members(self):
+        members = self._values['members']
+        if members is None:
+            return None
+        result = []
+        names = set()
+        for member in members:
+            if not isinstance(member, dict):
+                raise F5ModuleError(
+                    "Each item in 'members' must be a dictionary containing 'address' and 'port'."
+                )
+            address = member.get('address', member.get('host'))
+            port = member.get('port')
+            if address is None or port is None:
+                raise F5ModuleError(
+                    "Each item in 'members' must be a dictionary containing 'address' and 'port'."
+                )
+            try:
+                IPAddress(address)
+            except AddrFormatError:
+                raise F5ModuleError(
+                    "'%s' is not a valid IP address" % address
+                )
+            try:
+                port = int(port)
+            except (TypeError, ValueError):
+                port = -1
+            if port < 0 or port > 65535:
+                raise F5ModuleError(
+                    "The provided port '%s' must be between 0 and 65535" % member.get('port')
+                )
+            name = '{0}:{1}'.format(address, port)
+            if name in names:
+                raise F5ModuleError(
+                    "The member '{0}' is specified more than once in 'members'.".format(name)
+                )
+            names.add(name)
+            item = dict(name=name, address=address)
+            for key, api_key in iteritems(self.member_api_map):
+                if member.get(key) is not None:
+                    item[api_key] = member[key]
+            result.append(item)
+        return result
+
     def to_return(self):
         result = {}
         for returnable in self.returnables:
@@ -603,12 +715,29 @@ class Difference(object):
             return self.want.monitors
 
 
+class PoolMember(object):
+    """A pool member that was read along with its pool"""
+    def __init__(self, attrs):
+        self.__dict__.update(attrs)
+
+
 class ModuleManager(object):
+    # Member attributes that are sent back to the device for members that
+    # already exist when the full member list is replaced.
+    member_carry_over = [
+        'address', 'connectionLimit', 'description', 'dynamicRatio',
+        'monitor', 'priorityGroup', 'rateLimit', 'ratio'
+    ]
+
     def __init__(self, client):
         self.client = client
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Changes()
+        self.member_plan = None
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def exec_module(self):
         changed = False
@@ -625,7 +754,7 @@ class ModuleManager(object):
 
         changes = self.changes.to_return()
         result.update(**changes)
-        result.update(dict(changed=changed))
+        result.update(dict(changed=changed, requests=self.requests))
         self._announce_deprecations()
         return result
 
@@ -677,6 +806,72 @@ class ModuleManager(object):
                 return False
         return True
 
+    def _plan_member_changes(self, members):
+        """Diffs the desired members against the pool's current members
+
+        The returned plan contains the names of the members that will be
+        added, removed and modified, as well as the complete list of members
+        that should be sent to the device to realize those changes.
+
+        :param members: The members currently in the pool.
+        :return: A dictionary describing the changes to make.
+        """
+        current = dict((member.name, member) for member in members)
+        desired = self.want.members
+        plan = dict(add=[], remove=[], modify=[], members=[])
+        for member in desired:
+            name = member['name']
+            item = dict(name=name, partition=self.want.partition)
+            existing = current.get(name, None)
+            if existing is None:
+                plan['add'].append(name)
+            else:
+                for key in self.member_carry_over:
+                    value = getattr(existing, key, None)
+                    if value is not None:
+                        item[key] = value
+                for key, value in iteritems(member):
+                    if key != 'name' and getattr(existing, key, None) != value:
+                        plan['modify'].append(name)
+                        break
+            item.update(member)
+            plan['members'].append(item)
+        names = set(member['name'] for member in desired)
+        plan['remove'] = sorted(name for name in current if name not in names)
+        return plan
+
+    def _update_member_changes(self, members):
+        if self.want.members is None:
+            return False
+        plan = self._plan_member_changes(members)
+        if not plan['add'] and not plan['remove'] and not plan['modify']:
+            return False
+        self.member_plan = plan
+        self.changes.update(dict(
+            members_added=plan['add'],
+            members_removed=plan['remove'],
+            members_modified=plan['modify']
+        ))
+        return True
+
+    def load_from_device(self):
+        """Returns the pool, with its members, loading it on first use
+
+        :return: The pool, or None if it does not exist.
+        """
+        if not self._loaded:
+            try:
+                self._resource = self.load_on_device()
+            except iControlUnexpectedHTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._resource = None
+            self._loaded = True
+        return self._resource
+
+    def exists(self):
+        return self.load_from_device() is not None
+
     def present(self):
         if self.exists():
             return self.update()
@@ -699,7 +894,9 @@ class ModuleManager(object):
         if not self.client.check_mode:
             if self._member_does_not_exist(members):
                 self.create_member_on_device(poolres)
-        if not self.should_update():
+        pool_changed = self.should_update()
+        members_changed = self._update_member_changes(members)
+        if not pool_changed and not members_changed:
             return False
         if self.client.check_mode:
             return True
@@ -734,6 +931,7 @@ class ModuleManager(object):
             )
 
         self._set_changed_options()
+        self._update_member_changes([])
         if self.client.check_mode:
             return True
         self.create_on_device()
@@ -743,65 +941,97 @@ class ModuleManager(object):
                 self.create_member_on_device(poolres)
         return True
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
+        if self.member_plan:
+            params['members'] = self.member_plan['members']
         self.client.api.tm.ltm.pools.pool.create(
             partition=self.want.partition, **params
         )
+        self._loaded = False
 
+    @counted
     def create_member_on_device(self, poolres):
         poolres.members_s.members.create(
             name=self.want.member_name,
             partition=self.want.partition
         )
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        result = self.client.api.tm.ltm.pools.pool.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        if self.member_plan is not None:
+            # Replacing the members subcollection in the same PATCH as the
+            # pool settings applies every member add, remove and modify in
+            # a single request.
+            params['members'] = self.member_plan['members']
+        result = self.load_from_device()
         result.modify(**params)
 
-    def exists(self):
-        return self.client.api.tm.ltm.pools.pool.exists(
+    @counted
+    def load_on_device(self):
+        # The members are read along with the pool
+        return self.client.api.tm.ltm.pools.pool.load(
             name=self.want.name,
-            partition=self.want.partition
+            partition=self.want.partition,
+            requests_params=dict(
+                params=dict(
+                    expandSubcollections='true'
+                )
+            )
         )
 
     def remove_from_device(self):
-        result = self.client.api.tm.ltm.pools.pool.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         if self.want.member_name and self.want.port and self.want.pool:
-            member = result.members_s.members.load(
-                name=self.want.member_name,
-                partition=self.want.partition
-            )
+            member = self.load_member_on_device(result)
             if member:
-                member.delete()
+                self.delete_on_device(member)
                 self.delete_node_on_device()
         else:
-            result.delete()
+            self.delete_on_device(result)
+        self._loaded = False
 
-    def read_current_from_device(self):
-        tmp_res = self.client.api.tm.ltm.pools.pool.load(
-            name=self.want.name,
+    @counted
+    def load_member_on_device(self, poolres):
+        return poolres.members_s.members.load(
+            name=self.want.member_name,
             partition=self.want.partition
         )
-        members = tmp_res.members_s.get_collection()
+
+    @counted
+    def delete_on_device(self, resource):
+        resource.delete()
+
+    def read_current_from_device(self):
+        tmp_res = self.load_from_device()
+        reference = tmp_res.attrs.get('membersReference', dict())
+        if 'items' in reference:
+            members = [PoolMember(x) for x in reference['items']]
+        else:
+            # Pools without members, and devices that do not expand
+            # subcollections, do not include the members
+            members = self.read_members_from_device(tmp_res)
 
         result = tmp_res.attrs
         return Parameters(result), members, tmp_res
 
-    def delete_node_on_device(self):
-        resource = self.client.api.tm.ltm.nodes.node.load(
+    @counted
+    def read_members_from_device(self, poolres):
+        return poolres.members_s.get_collection()
+
+    @counted
+    def load_node_on_device(self):
+        return self.client.api.tm.ltm.nodes.node.load(
             name=self.want.host,
             partition=self.want.partition
         )
+
+    def delete_node_on_device(self):
+        resource = self.load_node_on_device()
         try:
-            resource.delete()
+            self.delete_on_device(resource)
         except iControlUnexpectedHTTPError as e:
             # If we cannot remove it, it is in use, it is up to user to delete
             # it later.
@@ -899,8 +1129,15 @@ class ArgumentSpec(object):
             port=dict(
                 type='int',
                 removed_in_version='2.4'
+            ),
+            members=dict(
+                type='list'
             )
         )
+        self.mutually_exclusive = [
+            ['members', 'host'],
+            ['members', 'port']
+        ]
         self.f5_product_name = 'bigip'
 
 
@@ -913,6 +1150,7 @@ def main():
     client = AnsibleF5Client(
         argument_spec=spec.argument_spec,
         supports_check_mode=spec.supports_check_mode,
+        mutually_exclusive=spec.mutually_exclusive,
         f5_product_name=spec.f5_product_name
     )
 
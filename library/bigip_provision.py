@@ -75,6 +75,25 @@ options:
     choices:
       - present
       - absent
+  wait:
+    description:
+      - When C(no), the module changes the provisioning level and returns
+        straight away instead of waiting for the device to finish
+        provisioning the module. A C(task) handle is returned, which can be
+        given to the C(bigip_task_status) module to check on, or wait for,
+        the provisioning later.
+    default: yes
+    choices:
+      - yes
+      - no
+    version_added: 2.5
+  cache_dir:
+    description:
+      - Directory in which other modules, such as C(bigip_gtm_pool), keep a
+        record of what each device is capable of.
+      - When the provisioning of the device is changed, its record is
+        removed so that it is read from the device again by the next task.
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -105,6 +124,17 @@ EXAMPLES = '''
       user: "admin"
       validate_certs: "no"
   delegate_to: localhost
+
+- name: Start provisioning ASM without waiting for it to finish
+  bigip_provision:
+      server: "lb.mydomain.com"
+      module: "asm"
+      password: "secret"
+      user: "admin"
+      validate_certs: "no"
+      wait: no
+  register: provisioning
+  delegate_to: localhost
 '''
 
 RETURN = '''
@@ -113,9 +143,19 @@ level:
     returned: changed
     type: string
     sample: "minimum"
+task:
+    description:
+      - Handle of the provisioning started on the device when C(wait)
+        is C(no).
+    returned: changed
+    type: dict
+    sample: {"id": "8c3e5f0c0e8a4d4e9d2f5d4c3b2a1f0e", "server": "10.0.0.1", "server_port": 443, "operation": "provision", "module": "asm", "level": "nominal"}
 '''
 
+import os
+import re
 import time
+import uuid
 
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
@@ -126,6 +166,21 @@ from ansible.module_utils.f5_utils import (
 )
 
 
+def invalidate_capabilities(cache_dir, server, server_port):
+    """Removes the record of what a device is capable of
+
+    :param cache_dir: Directory that the record is kept in.
+    :param server: Address of the device.
+    :param server_port: Port of the device.
+    """
+    name = 'bigip-capabilities-{0}-{1}.json'.format(server, server_port)
+    name = re.sub(r'[^\w.-]', '_', name)
+    try:
+        os.remove(os.path.join(os.path.expanduser(cache_dir), name))
+    except OSError:
+        pass
+
+
 class Parameters(AnsibleF5Parameters):
     api_attributes = ['level']
 
@@ -166,6 +221,7 @@ class ModuleManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.task = None
 
     def _update_changed_options(self):
         changed = {}
@@ -196,11 +252,36 @@ class ModuleManager(object):
         except iControlUnexpectedHTTPError as e:
             raise F5ModuleError(str(e))
 
+        if changed and not self.client.check_mode:
+            if self.want.cache_dir:
+                invalidate_capabilities(
+                    self.want.cache_dir,
+                    self.client._connect_params['server'],
+                    self.client._connect_params['server_port']
+                )
+
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.task:
+            result.update(dict(task=self.task))
         return result
 
+    def _create_task(self, level):
+        """Returns a handle for provisioning that is not being waited on
+
+        The handle has everything the bigip_task_status module needs to
+        find the device and check on the module later.
+        """
+        return dict(
+            id=uuid.uuid4().hex,
+            server=self.client._connect_params['server'],
+            server_port=self.client._connect_params['server_port'],
+            operation='provision',
+            module=self.want.module,
+            level=level
+        )
+
     def exists(self):
         provision = self.client.api.tm.sys.provision
         resource = getattr(provision, self.want.module)
@@ -217,6 +298,9 @@ class ModuleManager(object):
         if self.client.check_mode:
             return True
         self.update_on_device()
+        if not self.want.wait:
+            self.task = self._create_task(self.want.level)
+            return True
         self._wait_for_module_provisioning()
         if self.want.module == 'vcmp':
             self._wait_for_reboot()
@@ -252,6 +336,9 @@ class ModuleManager(object):
         if self.client.check_mode:
             return True
         self.remove_from_device()
+        if not self.want.wait:
+            self.task = self._create_task('none')
+            return True
         self._wait_for_module_provisioning()
 
         # For vCMP, because it has to reboot, we also wait for mcpd to become available
@@ -351,6 +438,13 @@ class ArgumentSpec(object):
             state=dict(
                 default='present',
                 choices=['present', 'absent']
+            ),
+            wait=dict(
+                type='bool',
+                default='yes'
+            ),
+            cache_dir=dict(
+                type='path'
             )
         )
         self.mutually_exclusive = [
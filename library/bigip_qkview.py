@@ -87,6 +87,18 @@ options:
     choices:
       - yes
       - no
+  wait:
+    description:
+      - When C(no), the module starts creating the qkview and returns
+        straight away instead of waiting for it to be created and
+        downloaded. A C(task) handle is returned, which can be given to the
+        C(bigip_task_status) module to check on the qkview later. That
+        module downloads the qkview to C(dest) once it has been created.
+    default: yes
+    choices:
+      - yes
+      - no
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -107,6 +119,13 @@ EXAMPLES = '''
           - secure
       dest: "/tmp/localhost.localdomain.qkview"
   delegate_to: localhost
+
+- name: Start creating a qkview without waiting for it
+  bigip_qkview:
+      dest: "/tmp/localhost.localdomain.qkview"
+      wait: no
+  register: qkview
+  delegate_to: localhost
 '''
 
 RETURN = '''
@@ -124,6 +143,7 @@ stdout_lines:
 
 import re
 import os
+import uuid
 
 from distutils.version import LooseVersion
 
@@ -254,6 +274,7 @@ class BaseManager(object):
         self.client = client
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.task = None
 
     def _set_changed_options(self):
         changed = {}
@@ -279,8 +300,26 @@ class BaseManager(object):
 
         result.update(**self.changes.to_return())
         result.update(dict(changed=False))
+        if self.task:
+            result.update(dict(task=self.task))
         return result
 
+    def _create_task(self):
+        """Returns a handle for a qkview that is not being waited on
+
+        The handle has everything the bigip_task_status module needs to
+        find the device, check on the qkview and download it later.
+        """
+        return dict(
+            id=uuid.uuid4().hex,
+            server=self.client._connect_params['server'],
+            server_port=self.client._connect_params['server_port'],
+            operation='qkview',
+            filename=self.want.filename,
+            dest=self.want.dest,
+            location=os.path.basename(self.remote_dir)
+        )
+
     def present(self):
         if os.path.exists(self.want.dest) and not self.want.force:
             raise F5ModuleError(
@@ -310,6 +349,11 @@ class BaseManager(object):
             return False
 
     def execute(self):
+        if not self.want.wait:
+            self.task = self._create_task()
+            self.start_on_device(self.task)
+            return
+
         response = self.execute_on_device()
         result = self._move_qkview_to_download()
         if not result:
@@ -341,6 +385,29 @@ class BaseManager(object):
             'run', utilCmdArgs=tpath_name
         )
 
+    def start_on_device(self, task):
+        """Creates the qkview in the background on the device
+
+        Once created, the qkview is moved to the download location. The
+        outcome is written to a status file named after the task, and the
+        output of qkview to a log file next to it.
+        """
+        status = '/var/tmp/.ansible-task-{0}.status'.format(task['id'])
+        log = '/var/tmp/.ansible-task-{0}.log'.format(task['id'])
+        params = self.want.api_params().values()
+        command = (
+            "echo running > {0}; "
+            "( (/usr/bin/qkview {2} && mv /var/tmp/{3} {4}/{3}) > {1} 2>&1 "
+            "&& echo done > {0} || echo failed > {0} ) "
+            "< /dev/null > /dev/null 2>&1 &"
+        ).format(
+            status, log, ' '.join(params), self.want.filename, self.remote_dir
+        )
+        self.client.api.tm.util.bash.exec_cmd(
+            'run',
+            utilCmdArgs='-c "{0}"'.format(command)
+        )
+
     def execute_on_device(self):
         params = self.want.api_params().values()
         output = self.client.api.tm.util.qkview.exec_cmd(
@@ -436,6 +503,10 @@ class ArgumentSpec(object):
             dest=dict(
                 type='path',
                 required=True
+            ),
+            wait=dict(
+                type='bool',
+                default='yes'
             )
         )
         self.f5_product_name = 'bigip'
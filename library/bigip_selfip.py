@@ -251,6 +251,43 @@ except ImportError:
     HAS_NETADDR = False
 
 
+# Addresses parsed by parse_address, keyed by the value that was parsed
+_addresses = dict()
+
+
+def parse_address(value):
+    """Parses an address of the form address%route_domain/prefix
+
+    Both the route domain and the prefix are optional, and the prefix can
+    also be given as a netmask. The same addresses are read many times
+    while changes are worked out, so each value is only parsed once.
+
+    :param value: The address to parse.
+    :return: Tuple of the normalized address, the route domain and the
+             prefix length, or None if the value is not a valid address.
+             The route domain and prefix length are None when not given.
+    """
+    if value in _addresses:
+        return _addresses[value]
+    result = None
+    matches = re.match(r'^(?P<ip>[^%/]+)(%(?P<rd>\d+))?(/(?P<mask>[^%/]+))?$', value)
+    if matches:
+        ip, rd, mask = matches.group('ip', 'rd', 'mask')
+        try:
+            if mask is None:
+                address, prefix = str(IPAddress(ip)), None
+            else:
+                network = IPNetwork('{0}/{1}'.format(ip, mask))
+                address, prefix = str(network.ip), network.prefixlen
+            if rd is not None:
+                rd = int(rd)
+            result = (address, rd, prefix)
+        except (AddrFormatError, ValueError):
+            pass
+    _addresses[value] = result
+    return result
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'trafficGroup': 'traffic_group',
@@ -331,13 +368,12 @@ class Parameters(AnsibleF5Parameters):
     def ip(self):
         if self._values['ip'] is None:
             return None
-        try:
-            ip = str(IPAddress(self._values['ip']))
-            return ip
-        except AddrFormatError:
+        address = parse_address(self._values['ip'])
+        if address is None or address[1:] != (None, None):
             raise F5ModuleError(
                 'The provided address is not a valid IP address'
             )
+        return address[0]
 
     @property
     def traffic_group(self):
@@ -356,11 +392,10 @@ class Parameters(AnsibleF5Parameters):
     def netmask(self):
         if self._values['netmask'] is None:
             return None
-        try:
-            address = '0.0.0.0/' + self._values['netmask']
-            ip = IPNetwork(address)
-            result = ip.prefixlen
-        except (AddrFormatError, ValueError):
+        address = parse_address('0.0.0.0/{0}'.format(self._values['netmask']))
+        if address is not None:
+            result = address[2]
+        else:
             try:
                 result = int(self._values['netmask'])
             except ValueError:
@@ -455,21 +490,12 @@ class ApiParameters(Parameters):
 
     @address.setter
     def address(self, value):
-        pattern = '^(?P<ip>[0-9A-Fa-f:.]+)%?(?P<rd>\d+)?\/(?P<nm>\d+)$'
-        matches = re.match(pattern, value)
-        if not matches:
+        address = parse_address(value)
+        if address is None or address[2] is None:
             raise F5ModuleError(
                 "The specified address is malformed. Please see documentation."
             )
-        try:
-            ip = matches.group('ip')
-            self._values['ip'] = str(IPAddress(ip))
-        except AddrFormatError:
-            raise F5ModuleError(
-                'The provided address is not a valid IP address'
-            )
-        self._values['route_domain'] = matches.group('rd')
-        self._values['netmask'] = matches.group('nm')
+        self._values['ip'], self._values['route_domain'], self._values['netmask'] = address
 
     @property
     def allow_service(self):
@@ -704,44 +730,34 @@ class Difference(object):
     def netmask(self):
         if self.want.netmask is None:
             return None
-        try:
-            address = IPNetwork(self.have.ip)
-            if self.want.route_domain is not None:
-                nipnet = "{0}%{1}/{2}".format(address.ip, self.want.route_domain, self.want.netmask)
-                cipnet = "{0}%{1}/{2}".format(address.ip, self.want.route_domain, self.have.netmask)
-            elif self.have.route_domain is not None:
-                nipnet = "{0}%{1}/{2}".format(address.ip, self.have.route_domain, self.want.netmask)
-                cipnet = "{0}%{1}/{2}".format(address.ip, self.have.route_domain, self.have.netmask)
-            else:
-                nipnet = "{0}/{1}".format(address.ip, self.want.netmask)
-                cipnet = "{0}/{1}".format(address.ip, self.have.netmask)
-            if nipnet != cipnet:
-                return nipnet
-        except AddrFormatError:
-            raise F5ModuleError(
-                'The provided address/netmask value was invalid'
-            )
+        address = self.have.ip
+        if self.want.route_domain is not None:
+            nipnet = "{0}%{1}/{2}".format(address, self.want.route_domain, self.want.netmask)
+            cipnet = "{0}%{1}/{2}".format(address, self.want.route_domain, self.have.netmask)
+        elif self.have.route_domain is not None:
+            nipnet = "{0}%{1}/{2}".format(address, self.have.route_domain, self.want.netmask)
+            cipnet = "{0}%{1}/{2}".format(address, self.have.route_domain, self.have.netmask)
+        else:
+            nipnet = "{0}/{1}".format(address, self.want.netmask)
+            cipnet = "{0}/{1}".format(address, self.have.netmask)
+        if nipnet != cipnet:
+            return nipnet
 
     @property
     def route_domain(self):
         if self.want.route_domain is None:
             return None
-        try:
-            address = IPNetwork(self.have.ip)
-
-            if self.want.netmask is not None:
-                nipnet = "{0}%{1}/{2}".format(address.ip, self.want.route_domain, self.want.netmask)
-                cipnet = "{0}%{1}/{2}".format(address.ip, self.have.route_domain, self.want.netmask)
-            elif self.have.netmask is not None:
-                nipnet = "{0}%{1}/{2}".format(address.ip, self.want.route_domain, self.have.netmask)
-                cipnet = "{0}%{1}/{2}".format(address.ip, self.have.route_domain, self.have.netmask)
-
-            if nipnet != cipnet:
-                return nipnet
-        except AddrFormatError:
-            raise F5ModuleError(
-                'The provided address/netmask value was invalid'
-            )
+        address = self.have.ip
+
+        if self.want.netmask is not None:
+            nipnet = "{0}%{1}/{2}".format(address, self.want.route_domain, self.want.netmask)
+            cipnet = "{0}%{1}/{2}".format(address, self.have.route_domain, self.want.netmask)
+        elif self.have.netmask is not None:
+            nipnet = "{0}%{1}/{2}".format(address, self.want.route_domain, self.have.netmask)
+            cipnet = "{0}%{1}/{2}".format(address, self.have.route_domain, self.have.netmask)
+
+        if nipnet != cipnet:
+            return nipnet
 
     @property
     def traffic_group(self):
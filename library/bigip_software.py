@@ -157,6 +157,66 @@ options:
        - This parameter also makes the C(software_md5sum) and C(hotfix_md5sum)
          mandatory when C(state is C(present), C(activated) or C(installed).
     default: 'no'
+  timeout:
+    description:
+      - Maximum number of seconds to wait for each long running operation,
+        such as an image appearing on the device after an upload, a software
+        install, or a reboot into the new volume, before failing.
+      - The device is polled with an exponentially increasing delay between
+        checks, so quick operations are noticed quickly and slow operations
+        are not polled more often than every 30 seconds.
+    default: 3600
+    version_added: 2.5
+  targets:
+    description:
+      - List of devices to manage software on in a single task. Each item is
+        either the address of a device, or a dictionary containing its
+        C(server) and, optionally, the C(server_port), C(user), C(password)
+        and C(volume) to use for that device. Values not given for a device
+        are taken from the task.
+      - Up to C(max_concurrent_targets) devices are handled at the same
+        time. Uploads and downloads of images are further limited by
+        C(max_concurrent_transfers).
+      - A failure on one device is reported in its result in C(targets),
+        and does not stop the others from being managed.
+      - When specified, the C(server) of the task is only used as a default
+        for the credentials and is not managed itself unless it is listed.
+    version_added: 2.5
+  max_concurrent_transfers:
+    description:
+      - Maximum number of devices in C(targets) that images are uploaded to,
+        or downloaded by, at the same time.
+    default: 2
+    version_added: 2.5
+  max_concurrent_targets:
+    description:
+      - Maximum number of devices in C(targets) that software is managed on
+        at the same time.
+    default: 10
+    version_added: 2.5
+  wait:
+    description:
+      - When C(no), the module starts the install, or the reboot into the
+        new volume, and returns straight away instead of waiting for it to
+        finish. A C(task) handle is returned, which can be given to the
+        C(bigip_task_status) module to check on, or wait for, the operation
+        later.
+      - Uploads and downloads of images always finish before the module
+        returns.
+    default: yes
+    choices:
+      - yes
+      - no
+    version_added: 2.5
+  cache_dir:
+    description:
+      - Directory in which other modules, such as C(bigip_gtm_pool), keep a
+        record of what each device is capable of.
+      - When a volume is activated on a device, its record is removed so
+        that it is read from the device again by the next task.
+      - The version and build read from local ISO images are also kept
+        here, so that an image is only read again once it has changed.
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host.
     This is as easy as pip install f5-sdk
@@ -378,6 +438,33 @@ EXAMPLES = '''
       remote_src: "yes"
       state: "present"
   delegate_to: localhost
+
+- name: Install software on several devices at once
+  bigip_software:
+      server: "bigip.localhost.localdomain"
+      user: "admin"
+      password: "admin"
+      software: "/root/BIGIP-11.6.0.0.0.401.iso"
+      state: "activated"
+      targets:
+        - server: "bigip1.localhost.localdomain"
+          volume: "HD1.2"
+        - server: "bigip2.localhost.localdomain"
+          volume: "HD1.3"
+      max_concurrent_transfers: 1
+  delegate_to: localhost
+
+- name: Start upgrading a device without waiting for the install to finish
+  bigip_software:
+      server: "bigip.localhost.localdomain"
+      user: "admin"
+      password: "admin"
+      software: "/root/BIGIP-11.6.0.0.0.401.iso"
+      volume: "HD1.2"
+      state: "activated"
+      wait: no
+  register: upgrade
+  delegate_to: localhost
 '''
 
 RETURN = '''
@@ -436,10 +523,66 @@ volume:
     returned: changed
     type: string
     sample: "HD1.2"
+targets:
+    description:
+      - Results for each device when C(targets) is used, including the
+        time taken for that device in C(seconds).
+      - A device that could not be managed has C(failed) set and the error
+        in C(msg).
+    returned: changed
+    type: list
+    sample: [{"server": "10.0.0.1", "changed": true, "seconds": 1532.1}]
+failed_targets:
+    description:
+      - Number of devices in C(targets) that could not be managed.
+    returned: changed
+    type: int
+    sample: 1
+downloads:
+    description:
+      - Progress of each image downloaded by the device when C(remote_src)
+        is used.
+    returned: changed
+    type: dict
+    sample: {"BIGIP-12.1.2.iso": {"bytes": 2016411648, "seconds": 402.1, "bytes_per_second": 5014701}}
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, for each
+        kind of long running operation. An operation that is waited for
+        more than once, such as the images of a base image and a hotfix,
+        has the times of all of its waits added together.
+    returned: changed
+    type: dict
+    sample: {"images": {"seconds": 41.2, "polls": 9, "waits": 2}}
+task:
+    description:
+      - Handle of the install or activation started on the device when
+        C(wait) is C(no).
+    returned: changed
+    type: dict
+    sample:
+      id: 8c3e5f0c0e8a4d4e9d2f5d4c3b2a1f0e
+      server: 10.0.0.1
+      server_port: 443
+      operation: software
+      volume: HD1.2
+      version: 12.1.2
+      build: 0.0.249
+      activate: true
 '''
 
+import hashlib
 import io
 import isoparser
+import json
+import mmap
+import random
+import re
+import struct
+import tempfile
+import threading
+import uuid
+from multiprocessing.pool import ThreadPool
 from ansible.module_utils.f5_utils import AnsibleF5Parameters
 from ansible.module_utils.f5_utils import AnsibleF5Client
 from ansible.module_utils.f5_utils import defaultdict
@@ -451,12 +594,159 @@ from ansible.module_utils.f5_utils import os
 from ansible.module_utils.f5_utils import time
 from lxml import etree
 from requests.exceptions import ConnectionError
+from requests.exceptions import RequestException
+
+try:
+    from f5.bigip import ManagementRoot
+except ImportError:
+    HAS_F5SDK = False
 
 try:
     import urlparse
 except ImportError:
     from urllib import parse as urlparse
 
+ISO_SECTOR_SIZE = 2048
+
+
+def read_iso_record(path, names):
+    """Reads a file from the root directory of an ISO9660 image
+
+    Only the volume descriptors and the root directory of the image are
+    read, so the time taken does not depend on the size of the image.
+
+    :param path: Path to the ISO image.
+    :param names: Names of the files to look for, in order of preference.
+    :return: Content of the first file found, or None.
+    """
+    wanted = [x.upper() for x in names]
+    with open(path, 'rb') as fh:
+        iso = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            root = None
+            offset = 16 * ISO_SECTOR_SIZE
+            while offset + ISO_SECTOR_SIZE <= len(iso):
+                vd_type = struct.unpack_from('<B', iso, offset)[0]
+                if iso[offset + 1:offset + 6] != b'CD001' or vd_type == 255:
+                    break
+                if vd_type == 1:
+                    root = offset + 156
+                    break
+                offset += ISO_SECTOR_SIZE
+            if root is None:
+                return None
+
+            block_size = struct.unpack_from('<H', iso, root - 28)[0]
+            extent, size = struct.unpack_from('<I4xI', iso, root + 2)
+            offset = extent * block_size
+            end = offset + size
+            found = dict()
+            while offset < end:
+                length = struct.unpack_from('<B', iso, offset)[0]
+                if length == 0:
+                    # Records do not cross sectors; skip the padding
+                    offset = (offset // block_size + 1) * block_size
+                    continue
+                extent, size = struct.unpack_from('<I4xI', iso, offset + 2)
+                name_len = struct.unpack_from('<B', iso, offset + 32)[0]
+                name = iso[offset + 33:offset + 33 + name_len]
+                name = name.decode('ascii', 'replace').split(';')[0].rstrip('.').upper()
+                if name in wanted:
+                    start = extent * block_size
+                    found[name] = iso[start:start + size]
+                offset += length
+            for name in wanted:
+                if name in found:
+                    return found[name]
+        finally:
+            iso.close()
+    return None
+
+
+def file_checksum(fileobj, chunk_size=1024 * 1024):
+    """Returns the size and MD5 sum of a file, reading it only once"""
+    md5 = hashlib.md5()
+    size = 0
+    fileobj.seek(0)
+    while True:
+        data = fileobj.read(chunk_size)
+        if not data:
+            break
+        md5.update(data)
+        size += len(data)
+    fileobj.seek(0)
+    return size, md5.hexdigest()
+
+
+def remote_file_matches(api, remote_path, size, checksum):
+    """Checks whether a file on the device has the given size and MD5 sum
+
+    The sum is only computed on the device when the size matches.
+    """
+    cmd = '-c "[ $(stat -c %s {0} 2>/dev/null) = {1} ] && md5sum {0} | cut -c1-32"'.format(
+        remote_path, size
+    )
+    output = api.tm.util.bash.exec_cmd('run', utilCmdArgs=cmd)
+    result = str(getattr(output, 'commandResult', '')).strip()
+    return result == checksum
+
+
+def invalidate_capabilities(cache_dir, server, server_port):
+    """Removes the record of what a device is capable of
+
+    :param cache_dir: Directory that the record is kept in.
+    :param server: Address of the device.
+    :param server_port: Port of the device.
+    """
+    name = 'bigip-capabilities-{0}-{1}.json'.format(server, server_port)
+    name = re.sub(r'[^\w.-]', '_', name)
+    try:
+        os.remove(os.path.join(os.path.expanduser(cache_dir), name))
+    except OSError:
+        pass
+
+
+class IsoMetadataCache(object):
+    """On-disk record of the version and build of local ISO images
+
+    A record is keyed by the path of the image, and is only used while
+    the size and modification time of the image are the ones it was
+    written with, so an image that is replaced is read again.
+    """
+    def __init__(self, cache_dir):
+        self.path = os.path.join(
+            os.path.expanduser(cache_dir), 'bigip-iso-metadata.json'
+        )
+
+    def read(self):
+        try:
+            with open(self.path) as fh:
+                return json.load(fh)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def get(self, iso, stat):
+        record = self.read().get(iso)
+        if record is None:
+            return None
+        if record.get('size') != stat.st_size or record.get('mtime') != stat.st_mtime:
+            return None
+        return record['version'], record['build']
+
+    def set(self, iso, stat, version, build):
+        records = self.read()
+        records[iso] = dict(
+            size=stat.st_size, mtime=stat.st_mtime,
+            version=version, build=build
+        )
+        directory = os.path.dirname(self.path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, 'w') as fh:
+            json.dump(records, fh)
+        os.rename(tmp, self.path)
+
 
 class Parameters(AnsibleF5Parameters):
     def __init__(self, params=None):
@@ -666,17 +956,38 @@ class Parameters(AnsibleF5Parameters):
         self._values['build'] = value
 
     def use_iso(self, iso):
-        iso = isoparser.parse(iso)
-        content = self._find_iso_content(iso)
+        if self._values['cache_dir']:
+            cache = IsoMetadataCache(self._values['cache_dir'])
+            path = os.path.abspath(iso)
+            stat = os.stat(path)
+            metadata = cache.get(path, stat)
+            if metadata is None:
+                metadata = self._read_iso_metadata(iso)
+                cache.set(path, stat, *metadata)
+            version, build = metadata
+        else:
+            version, build = self._read_iso_metadata(iso)
+        if version is not None:
+            self._values['version'] = version
+        if build is not None:
+            self._values['build'] = build
+
+    def _read_iso_metadata(self, iso):
+        content = read_iso_record(iso, ['METADATA.XML'])
+        if content is None:
+            content = self._find_iso_content(isoparser.parse(iso))
         content = io.BytesIO(content)
         context = etree.iterparse(content)
+        version = None
+        build = None
         for action, elem in context:
             if elem.text:
                 text = elem.text
             if elem.tag == 'version':
-                self._values['version'] = text
+                version = text
             elif elem.tag == 'buildNumber':
-                self._values['build'] = text
+                build = text
+        return version, build
 
     def _find_iso_content(self, iso):
         paths = ['/METADATA.XML', 'metadata.xml']
@@ -762,6 +1073,42 @@ class Parameters(AnsibleF5Parameters):
         return result
 
 
+class TargetClient(object):
+    """Client for one of the devices listed in the targets parameter
+
+    This provides the parts of AnsibleF5Client that the managers use, but
+    connected to a different device than the one the task was given. The
+    connection parameters are read from the module parameters, and then
+    replaced by any that the target gives.
+    """
+    def __init__(self, module, target):
+        self.module = module
+        self.check_mode = module.check_mode
+        self._connect_params = dict(
+            server=module.params['server'],
+            server_port=module.params['server_port'],
+            user=module.params['user'],
+            password=module.params['password'],
+            validate_certs=module.params['validate_certs']
+        )
+        if isinstance(target, dict):
+            for key in ['server', 'server_port', 'user', 'password']:
+                if target.get(key) is not None:
+                    self._connect_params[key] = target[key]
+        else:
+            self._connect_params['server'] = target
+        self.api = self._get_mgmt_root('bigip', **self._connect_params)
+
+    def _get_mgmt_root(self, type, **kwargs):
+        return ManagementRoot(
+            kwargs['server'],
+            kwargs['user'],
+            kwargs['password'],
+            port=kwargs['server_port'],
+            token='tmos'
+        )
+
+
 class ModuleManager(object):
     def __init__(self, client):
         self.client = client
@@ -770,6 +1117,9 @@ class ModuleManager(object):
         self.want.update(self.client.module.params)
 
     def exec_module(self):
+        if self.want.targets:
+            return self.exec_targets()
+
         if self.want.remote_src:
             manager = self.get_manager('remote')
         else:
@@ -777,11 +1127,58 @@ class ModuleManager(object):
 
         return manager.exec_module()
 
-    def get_manager(self, target):
+    def exec_targets(self):
+        """Manages software on all of the devices in targets concurrently
+
+        :return: Dictionary containing the result for each device.
+        """
+        targets = self.want.targets
+        transfers = threading.BoundedSemaphore(
+            self.want.max_concurrent_transfers or 1
+        )
+
+        def run(target):
+            start = time.time()
+            server = target.get('server') if isinstance(target, dict) else target
+            try:
+                client = TargetClient(self.client.module, target)
+                if self.want.remote_src:
+                    manager = self.get_manager('remote', client)
+                else:
+                    manager = self.get_manager('local', client)
+                if isinstance(target, dict) and target.get('volume'):
+                    manager.want.update(dict(volume=target['volume']))
+                manager.transfers = transfers
+                result = manager.exec_module()
+            except (iControlUnexpectedHTTPError, F5ModuleError, RequestException) as ex:
+                # A failure on one device is reported in its result, so
+                # that the others are still managed.
+                result = dict(changed=False, failed=True, msg=str(ex))
+            result.update(dict(
+                server=server,
+                seconds=round(time.time() - start, 1)
+            ))
+            return result
+
+        workers = min(self.want.max_concurrent_targets or 1, len(targets))
+        pool = ThreadPool(workers)
+        try:
+            results = pool.map(run, targets)
+        finally:
+            pool.close()
+            pool.join()
+
+        failed = [x for x in results if x.get('failed')]
+        changed = any(x['changed'] for x in results)
+        return dict(changed=changed, targets=results, failed_targets=len(failed))
+
+    def get_manager(self, target, client=None):
+        if client is None:
+            client = self.client
         if target == 'remote':
-            return RemoteManager(self.client)
+            return RemoteManager(client)
         if target == 'local':
-            return LocalManager(self.client)
+            return LocalManager(client)
 
 
 class BaseManager(object):
@@ -792,6 +1189,10 @@ class BaseManager(object):
         self.want.client = self.client
         self.want.update(self.client.module.params)
         self.changes = Parameters()
+        self.wait_times = dict()
+        self.downloads = dict()
+        self.transfers = None
+        self.task = None
 
     def exec_module(self):
         changed = False
@@ -810,11 +1211,42 @@ class BaseManager(object):
         except iControlUnexpectedHTTPError as e:
             raise F5ModuleError(str(e))
 
+        if changed and state == 'activated' and not self.client.check_mode:
+            if self.want.cache_dir:
+                invalidate_capabilities(
+                    self.want.cache_dir,
+                    self.client._connect_params['server'],
+                    self.client._connect_params['server_port']
+                )
+
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
+        if self.downloads:
+            result.update(dict(downloads=self.downloads))
+        if self.task:
+            result.update(dict(task=self.task))
         return result
 
+    def _create_task(self, activate=False):
+        """Returns a handle for an install that is not being waited on
+
+        The handle has everything the bigip_task_status module needs to
+        find the device and check on the volume later.
+        """
+        return dict(
+            id=uuid.uuid4().hex,
+            server=self.client._connect_params['server'],
+            server_port=self.client._connect_params['server_port'],
+            operation='software',
+            volume=self.want.volume,
+            version=self.want.version,
+            build=self.want.build,
+            activate=activate
+        )
+
     def _set_changed_options(self):
         changed = {}
         for key in Parameters.returnables:
@@ -843,7 +1275,8 @@ class BaseManager(object):
             return self.activate()
         else:
             self.install_volume()
-            self.wait_for_device_reboot()
+            if self.want.wait:
+                self.wait_for_device_reboot()
             return True
 
     def is_activated(self):
@@ -873,7 +1306,10 @@ class BaseManager(object):
         if self.client.check_mode:
             return True
         self.reboot_volume_on_device()
-        self.wait_for_device_reboot()
+        if self.want.wait:
+            self.wait_for_device_reboot()
+        else:
+            self.task = self._create_task(activate=True)
         return True
 
     def present(self):
@@ -912,7 +1348,12 @@ class BaseManager(object):
             else:
                 raise F5ModuleError('Base image of version: {0} must exist to install this hotfix.'.format(version))
 
-        self.wait_for_software_install_on_device()
+        if self.want.wait:
+            self.wait_for_software_install_on_device()
+        else:
+            self.task = self._create_task(
+                activate=self.want.state == 'activated'
+            )
 
     def upload(self):
         software_path = self.want.software
@@ -925,17 +1366,25 @@ class BaseManager(object):
 
         if software_path and not self.image_exists_on_device():
             if self.want.remote_src:
-                self.download_iso_on_device()
-            else:
-                self.upload_to_device(software_path)
-            self.wait_for_images(image_list)
+                self._transfer(self.download_iso_on_device)
+                self.wait_for_images(image_list)
+            elif self._transfer(self.upload_to_device, software_path):
+                self.wait_for_images(image_list)
 
         if hotfix_path and not self.hotfix_exists_on_device():
             if self.want.remote_src:
-                self.download_iso_on_device(True)
-            else:
-                self.upload_to_device(hotfix_path)
-            self.wait_for_images(hotfix_list, True)
+                self._transfer(self.download_iso_on_device, True)
+                self.wait_for_images(hotfix_list, True)
+            elif self._transfer(self.upload_to_device, hotfix_path):
+                self.wait_for_images(hotfix_list, True)
+
+    def _transfer(self, func, *args):
+        # When several devices are handled at once, only a limited number
+        # of them may be transferring an image at the same time.
+        if self.transfers is None:
+            return func(*args)
+        with self.transfers:
+            return func(*args)
 
     def remove(self):
         software_path = self.want.software
@@ -983,63 +1432,106 @@ class BaseManager(object):
     def _device_reconnect(self):
         self.client.api = self.client._get_mgmt_root('bigip', **self.client._connect_params)
 
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for an image, volume, download or reboot on the device
+
+        The delay between checks doubles from interval, up to 30 seconds.
+        Random jitter keeps devices that are upgraded together from polling
+        in lock step. The wait is given up after the timeout of the module,
+        or an hour. The time and checks of each wait are added to those of
+        earlier waits for the same operation in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 3600
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
+
     def wait_for_images(self, count, hotfix=False):
         current = len(count)
         if hotfix:
-            while True:
-                if len(self.list_hotfixes_on_device()) != current:
-                    break
-            time.sleep(1)
+            listing = self.list_hotfixes_on_device
         else:
-            while True:
-                if len(self.list_images_on_device()) != current:
-                    break
-            time.sleep(1)
+            listing = self.list_images_on_device
+        if not self._wait_until('images', lambda: len(listing()) != current):
+            raise F5ModuleError(
+                'Timed out waiting for the image list on the device to change.'
+            )
 
     def wait_for_device_reboot(self):
         vol = self.want.volume
-        while True:
-            time.sleep(5)
+
+        def is_active():
             try:
                 self._device_reconnect()
                 volume = self.client.api.tm.sys.software.volumes.volume.load(
                     name=vol
                 )
                 if hasattr(volume, 'active') and volume.active is True:
-                    break
+                    return True
             except Exception:
                 # Handle all exceptions because if the system is offline (for a
                 # reboot) the REST client will raise exceptions about
                 # connections
                 pass
+            return False
+
+        if not self._wait_until('reboot', is_active, interval=5):
+            raise F5ModuleError(
+                'Timed out waiting for the device to boot into volume {0}.'.format(vol)
+            )
 
     def wait_for_software_install_on_device(self):
-        # We need to delay this slightly in case the the volume needs to be
-        # created first
-        for count in range(10):
+        def volume_exists():
             try:
-                if self.volume_exists_on_device():
-                    break
+                return self.volume_exists_on_device()
             except ConnectionError:
-                pass
-            time.sleep(5)
+                return False
+
+        # We need to delay this slightly in case the the volume needs to be
+        # created first
+        self._wait_until('volume', volume_exists, timeout=50)
         progress = self.load_volume_on_device()
-        while True:
-            time.sleep(10)
+
+        def install_complete():
             progress.refresh()
             status = progress.status
             if 'complete' in status:
-                break
+                return True
             elif 'failed' in status:
                 raise F5ModuleError(status)
+            return False
+
+        if not self._wait_until('install', install_complete, interval=5):
+            raise F5ModuleError(
+                'Timed out waiting for software to install on volume {0}.'.format(self.want.volume)
+            )
 
     def delete_volume_on_device(self):
         volume = self.load_volume_on_device()
         volume.delete()
-        for count in range(10):
-            time.sleep(5)
-            if not self.volume_exists_on_device():
-                break
+        self._wait_until(
+            'delete_volume', lambda: not self.volume_exists_on_device(),
+            timeout=50
+        )
 
     def get_current_active(self):
         volumes = self.list_volumes_on_device()
@@ -1079,9 +1571,15 @@ class LocalManager(BaseManager):
         )
 
     def upload_to_device(self, filepath):
-        self.client.api.cm.autodeploy.software_image_uploads.upload_image(
-            filepath
-        )
+        name = os.path.basename(filepath)
+        uploads = self.client.api.cm.autodeploy.software_image_uploads
+        with open(filepath, 'rb') as fileobj:
+            size, checksum = file_checksum(fileobj)
+            remote_path = '/shared/images/{0}'.format(name)
+            if remote_file_matches(self.client.api, remote_path, size, checksum):
+                return False
+        uploads.upload_image(filepath)
+        return True
 
     def list_images_on_device(self):
         images = self.client.api.tm.sys.software.images.get_collection()
@@ -1177,8 +1675,6 @@ class RemoteManager(BaseManager):
         self.want.build = info.build
 
     def prepare_command(self, url, name):
-        # We will add file download resume, multiple file download,
-        # ftp/ftps in next iterations. We need to test this simple solution first
         secure = self.want.secure
         if secure:
             cmd = '-c "curl {0} -k -o /shared/images/{1}"'.format(url, name)
@@ -1186,6 +1682,48 @@ class RemoteManager(BaseManager):
             cmd = '-c "curl {0} -o /shared/images/{1}"'.format(url, name)
         return cmd
 
+    def prepare_download_command(self, url, name, checksum):
+        """Builds the command that downloads an image in the background
+
+        The image is written to a .part file and fetched with HTTP range
+        requests, so an interrupted download, including one left behind
+        by an earlier run, continues where it stopped. The MD5 sum is
+        computed as the data arrives rather than by reading the image
+        again afterwards. If the sum does not match, the partial file is
+        discarded and the download starts over, unless curl stopped with
+        a transfer error that the next try can resume from. A .part file
+        that is already complete but wrong makes the server reject the
+        range with a 416, which curl reports as an HTTP error (22), so it
+        is discarded too.
+
+        The outcome is written to a status file that is polled by
+        wait_for_download().
+        """
+        part = '/shared/images/{0}.part'.format(name)
+        status = '/shared/images/.{0}.status'.format(name)
+        insecure = '-k ' if self.want.secure else ''
+        script = (
+            "exec 9>{part}.lock; flock -n 9 || exit 0; set -o pipefail; "
+            "for try in 1 2 3 4 5 6 7 8 9 10; do "
+            "size=$(stat -c %s {part} 2>/dev/null || echo 0); "
+            "sum=$({{ cat {part} 2>/dev/null; "
+            "curl -sSf {insecure}-r $size- '{url}' | tee -a {part}; }} "
+            "| md5sum | cut -c1-32); rc=$?; "
+            "if [ $sum = {checksum} ]; then "
+            "mv -f {part} /shared/images/{name}; rm -f {part}.lock; "
+            "echo done > {status}; exit 0; "
+            "fi; if [ $rc -eq 0 ] || [ $rc -eq 22 ]; then rm -f {part}; fi; "
+            "sleep 10; "
+            "done; rm -f {part}.lock; echo failed > {status}"
+        ).format(
+            part=part, status=status, insecure=insecure, url=url,
+            checksum=checksum, name=name
+        )
+        cmd = '-c "rm -f {0}; ( {1} ) </dev/null >/dev/null 2>&1 &"'.format(
+            status, script
+        )
+        return cmd
+
     def name_match(self, url, name, hotfix=False):
         # To ensure that the ISO name matches the one in MD5 sum file,
         # If not we will change it so the ISO is saved with proper name for
@@ -1195,6 +1733,7 @@ class RemoteManager(BaseManager):
         cat = '-c "cat /shared/images/{0}"'.format(name)
         output = self.run_command_on_device(cat)
         result = output.commandResult
+        self.checksum = str(result.split()[0])
         tmp_name = str(result.rsplit()[1])
         if hotfix:
             if tmp_name != self.want.hotfix_name:
@@ -1205,37 +1744,62 @@ class RemoteManager(BaseManager):
                 self.want.software_name = tmp_name
             return self.want.software_name
 
-    def does_checksum_match(self, md5name, filename):
-        cmd = '-c "cd /shared/images; md5sum -c /shared/images/{0}"'.format(
-            md5name
-        )
-        output = self.run_command_on_device(cmd)
-        result = str(output.commandResult).rstrip()
-        expected = "{0}: OK".format(filename)
-        if result == expected:
-            return True
-        else:
-            return False
-
     def download_iso_on_device(self, hotfix=False):
         if hotfix:
             md5name = self.want.hfmd5_name
             md5_url = self.want.hotfix_md5sum
             name = self.name_match(md5_url, md5name, True)
             url = self.want.hotfix
-            cmd = self.prepare_command(url, name)
-            self.run_command_on_device(cmd)
-            if not self.does_checksum_match(md5name, name):
-                raise F5ModuleError('ISO download failed from remote host.')
         else:
             md5name = self.want.imgmd5_name
             md5_url = self.want.software_md5sum
             name = self.name_match(md5_url, md5name)
             url = self.want.software
-            cmd = self.prepare_command(url, name)
-            self.run_command_on_device(cmd)
-            if not self.does_checksum_match(md5name, name):
-                raise F5ModuleError('ISO download failed from remote host.')
+        cmd = self.prepare_download_command(url, name, self.checksum)
+        self.run_command_on_device(cmd)
+        self.wait_for_download(name)
+
+    def read_download_status(self, name):
+        cmd = '-c "cat /shared/images/.{0}.status 2>/dev/null; ' \
+              'stat -c %s /shared/images/{0}.part 2>/dev/null"'.format(name)
+        output = self.run_command_on_device(cmd)
+        result = str(getattr(output, 'commandResult', '')).split()
+        if result and result[0] in ['done', 'failed']:
+            return result[0], None
+        if result and result[0].isdigit():
+            return 'running', int(result[0])
+        return 'running', None
+
+    def wait_for_download(self, name):
+        progress = dict(bytes=0, seconds=0, bytes_per_second=0)
+        self.downloads[name] = progress
+        start = time.time()
+        state = dict(status='running', first=None)
+
+        def finished():
+            status, size = self.read_download_status(name)
+            state['status'] = status
+            if size is not None:
+                if state['first'] is None:
+                    # Bytes already present were resumed, not downloaded now
+                    state['first'] = size
+                elapsed = time.time() - start
+                progress['bytes'] = size
+                progress['seconds'] = round(elapsed, 1)
+                if elapsed > 0:
+                    progress['bytes_per_second'] = int(
+                        (size - state['first']) / elapsed
+                    )
+            return status != 'running'
+
+        if not self._wait_until('download', finished, interval=5):
+            raise F5ModuleError(
+                'Timed out downloading {0}. The download will resume '
+                'where it stopped when the task is run again.'.format(name)
+            )
+        progress['seconds'] = round(time.time() - start, 1)
+        if state['status'] != 'done':
+            raise F5ModuleError('ISO download failed from remote host.')
 
     def name_check(self, name, hotfix=False):
         if hotfix:
@@ -1381,7 +1945,29 @@ class ArgumentSpec(object):
             software_md5sum=dict(),
             hotfix_md5sum=dict(),
             version=dict(),
-            build=dict()
+            build=dict(),
+            timeout=dict(
+                type='int',
+                default=3600
+            ),
+            targets=dict(
+                type='list'
+            ),
+            max_concurrent_transfers=dict(
+                type='int',
+                default=2
+            ),
+            max_concurrent_targets=dict(
+                type='int',
+                default=10
+            ),
+            wait=dict(
+                type='bool',
+                default='yes'
+            ),
+            cache_dir=dict(
+                type='path'
+            )
         )
         self.f5_product_name = 'bigip'
 
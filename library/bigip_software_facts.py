@@ -48,6 +48,35 @@ options:
       - Filter responses based on the attribute and value provided. Valid filters
         are required to be in C(key:value) format, with keys being one of the
         following; name, build, version, status, active.
+  targets:
+    description:
+      - List of devices to collect facts from in a single task. Each item
+        is either the address of a device, or a dictionary containing its
+        C(server) and, optionally, the C(server_port), C(user) and
+        C(password) to use for that device. Values not given for a device
+        are taken from the task.
+      - Each device is logged in to once, and all of the requested facts
+        are collected over that connection.
+      - When specified, the C(server) of the task is only used as a default
+        for the credentials and is not collected from unless it is listed.
+    version_added: 2.5
+  max_concurrent_targets:
+    description:
+      - Maximum number of devices in C(targets) that facts are collected
+        from at the same time.
+    default: 10
+    version_added: 2.5
+  dest:
+    description:
+      - File to write the facts of each device in C(targets) to, as
+        JSON Lines. Each line is a JSON object with the C(server) and
+        C(server_port) of one device and its facts, or the C(msg) of the
+        error collecting them.
+      - Lines are written as each device finishes, so the facts of all of
+        the devices are never held in memory at once. The file is only
+        put in place once every device has been handled.
+      - When set, the facts are not included in the result of the task.
+    version_added: 2.5
 notes:
    - Requires the f5-sdk Python package on the host. This is as easy as
      pip install f5-sdk
@@ -67,6 +96,18 @@ EXAMPLES = '''
       include: "image"
       filter: "version:12.1.1"
   delegate_to: localhost
+
+- name: Collect software facts from every device into a JSON Lines file
+  bigip_software_facts:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      include: "volume"
+      targets: "{{ groups['bigip'] }}"
+      max_concurrent_targets: 25
+      dest: "/var/lib/cmdb/software-facts.jsonl"
+  run_once: true
+  delegate_to: localhost
 '''
 
 RETURN = '''
@@ -109,16 +150,41 @@ volumes:
               product: BIG-IP,
               status: complete,
               version: 12.1.1
+targets:
+    description:
+      - Results for each device when C(targets) is used, including the
+        time taken for that device in C(seconds). The facts of each
+        device are left out when C(dest) is set.
+      - A device that facts could not be collected from has C(failed) set
+        and the error in C(msg). The other devices are still collected.
+    returned: changed
+    type: list
+    sample: [{"server": "10.0.0.1", "server_port": 443, "seconds": 1.2, "volumes": []}]
+failed_targets:
+    description:
+      - Number of devices in C(targets) that facts could not be collected
+        from.
+    returned: changed
+    type: int
+    sample: 1
 '''
 
+import json
+import os
+import tempfile
+import time
+
+from multiprocessing.pool import ThreadPool
 
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
     AnsibleF5Parameters,
     HAS_F5SDK,
     F5ModuleError,
+    iControlUnexpectedHTTPError,
     iteritems
 )
+from requests.exceptions import RequestException
 
 
 class Parameters(AnsibleF5Parameters):
@@ -166,6 +232,29 @@ class Parameters(AnsibleF5Parameters):
         return key, value
 
 
+class TargetClient(object):
+    """Client for one of the devices listed in the targets parameter
+
+    This provides the parts of AnsibleF5Client that the managers use, but
+    connected to a different device than the one the task was given.
+    """
+    def __init__(self, client, target):
+        self._client = client
+        self.module = client.module
+        self.check_mode = client.check_mode
+        self._connect_params = dict(client._connect_params)
+        if isinstance(target, dict):
+            for key in ['server', 'server_port', 'user', 'password']:
+                if target.get(key) is not None:
+                    self._connect_params[key] = target[key]
+        else:
+            self._connect_params['server'] = target
+        self.api = self._get_mgmt_root('bigip', **self._connect_params)
+
+    def _get_mgmt_root(self, type, **kwargs):
+        return self._client._get_mgmt_root(type, **kwargs)
+
+
 class ModuleManager(object):
     def __init__(self, client):
         self.client = client
@@ -173,14 +262,84 @@ class ModuleManager(object):
         self.include = self.want.include
 
     def exec_module(self):
+        if self.want.targets:
+            return self.exec_targets()
+        return self.exec_device(self.client)
+
+    def exec_device(self, client):
         if 'all' in self.include:
             names = ['image', 'hotfix', 'volume']
         else:
             names = self.include
-        managers = [self.get_manager(name) for name in names]
+        managers = [self.get_manager(name, client) for name in names]
         result = self.execute_managers(managers)
         return result
 
+    def exec_target(self, target):
+        start = time.time()
+        if isinstance(target, dict):
+            server = target.get('server')
+            server_port = target.get('server_port')
+        else:
+            server, server_port = target, None
+        result = dict(
+            server=server,
+            server_port=server_port or self.client._connect_params['server_port']
+        )
+        try:
+            client = TargetClient(self.client, target)
+            facts = self.exec_device(client)
+            facts.pop('changed', None)
+            result.update(facts)
+        except (iControlUnexpectedHTTPError, F5ModuleError, RequestException) as ex:
+            # Errors are recorded against the device they happened on, so
+            # that one unreachable device does not stop the others from
+            # being collected.
+            result.update(dict(failed=True, msg=str(ex)))
+        return result, round(time.time() - start, 1)
+
+    def exec_targets(self):
+        """Collects facts from every device in targets concurrently
+
+        :return: Dictionary containing the result for each device.
+        """
+        targets = self.want.targets
+        dest = self.want.dest
+        workers = min(self.want.max_concurrent_targets or 1, len(targets))
+        results = []
+
+        fh = None
+        if dest:
+            directory = os.path.dirname(os.path.abspath(dest))
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            fd, tmp = tempfile.mkstemp(dir=directory)
+            fh = os.fdopen(fd, 'w')
+
+        pool = ThreadPool(workers)
+        try:
+            for facts, seconds in pool.imap_unordered(self.exec_target, targets):
+                if fh is not None:
+                    fh.write(json.dumps(facts, sort_keys=True) + '\n')
+                    facts = dict(
+                        (k, v) for k, v in iteritems(facts)
+                        if k in ['server', 'server_port', 'failed', 'msg']
+                    )
+                facts['seconds'] = seconds
+                results.append(facts)
+        finally:
+            pool.close()
+            pool.join()
+            if fh is not None:
+                fh.close()
+        if fh is not None:
+            os.rename(tmp, dest)
+
+        order = [x.get('server') if isinstance(x, dict) else x for x in targets]
+        results.sort(key=lambda x: order.index(x['server']))
+        failed = [x for x in results if x.get('failed')]
+        return dict(changed=True, targets=results, failed_targets=len(failed))
+
     def execute_managers(self, managers):
         results = dict(changed=False)
         for manager in managers:
@@ -193,16 +352,20 @@ class ModuleManager(object):
                     results[k] = v
         return results
 
-    def get_manager(self, which):
+    def get_manager(self, which, client=None):
+        if client is None:
+            client = self.client
         if 'image' == which:
-            return ImageFactManager(self.client)
+            return ImageFactManager(client)
         if 'hotfix' == which:
-            return HotfixFactManager(self.client)
+            return HotfixFactManager(client)
         if 'volume' == which:
-            return VolumeFactManager(self.client)
+            return VolumeFactManager(client)
 
 
 class BaseManager(object):
+    page_size = 100
+
     def __init__(self, client):
         self.client = client
         self.want = Parameters(self.client.module.params)
@@ -224,6 +387,23 @@ class BaseManager(object):
                 filtered[str(k)] = str(v)
         return filtered
 
+    def iterate_collection(self, collection):
+        """Yields the resources in a collection one page at a time
+
+        :param collection: The SDK collection to read from.
+        """
+        skip = 0
+        while True:
+            params = '$top={0}&$skip={1}'.format(self.page_size, skip)
+            items = collection.get_collection(
+                requests_params=dict(params=params)
+            )
+            for item in items:
+                yield item
+            if len(items) < self.page_size:
+                break
+            skip += self.page_size
+
     def collection_parser(self, collection):
         output = list()
         if self.filter is None:
@@ -250,7 +430,7 @@ class ImageFactManager(BaseManager):
         return to_return
 
     def get_facts_from_device(self):
-        images = self.client.api.tm.sys.software.images.get_collection()
+        images = self.iterate_collection(self.client.api.tm.sys.software.images)
         return images
 
 
@@ -263,7 +443,7 @@ class HotfixFactManager(BaseManager):
         return to_return
 
     def get_facts_from_device(self):
-        hotfixes = self.client.api.tm.sys.software.hotfix_s.get_collection()
+        hotfixes = self.iterate_collection(self.client.api.tm.sys.software.hotfix_s)
         return hotfixes
 
 
@@ -276,7 +456,7 @@ class VolumeFactManager(BaseManager):
         return to_return
 
     def get_facts_from_device(self):
-        volumes = self.client.api.tm.sys.software.volumes.get_collection()
+        volumes = self.iterate_collection(self.client.api.tm.sys.software.volumes)
         return volumes
 
 
@@ -288,7 +468,17 @@ class ArgumentSpec(object):
                 type='list',
                 default=['all'],
             ),
-            filter=dict()
+            filter=dict(),
+            targets=dict(
+                type='list'
+            ),
+            max_concurrent_targets=dict(
+                type='int',
+                default=10
+            ),
+            dest=dict(
+                type='path'
+            )
         )
         self.f5_product_name = 'bigip'
 
@@ -61,7 +61,7 @@ options:
         when importing a certificate/key into the F5. It also
         determines the filenames of the objects on the LTM
         (:Partition:name.cer_11111_1 and :Partition_name.key_11111_1).
-    required: True
+      - Required unless C(certificates) is used.
   cert_src:
     description:
       - This is the local filename of the certificate. Either one of C(key_src),
@@ -75,6 +75,20 @@ options:
   passphrase:
     description:
       - Passphrase on certificate private key
+  certificates:
+    description:
+      - List of certificates, and optionally their keys, to manage in a
+        single task. Each item is a dictionary with the C(name) of the
+        certificate and its C(cert_content), C(key_content) and
+        C(passphrase), which have the same meaning as the parameters of
+        this module.
+      - The SHA1 checksums of all of the certificates, and of all of the
+        keys, in the partition are read from the device with one request
+        each. Only the certificates and keys whose content has a different
+        checksum are uploaded.
+      - When C(state) is C(absent), the certificates and keys of every
+        C(name) in the list are removed.
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -124,6 +138,20 @@ EXAMPLES = '''
       cert_content: "{{ lookup('file', '/path/to/ca-chain.crt') }}"
   delegate_to: localhost
 
+- name: Keep many certificates and keys in sync with local PEM files
+  bigip_ssl_certificate:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      state: "present"
+      certificates:
+        - name: "site1"
+          cert_content: "{{ lookup('file', '/path/to/site1.crt') }}"
+          key_content: "{{ lookup('file', '/path/to/site1.key') }}"
+        - name: "site2"
+          cert_content: "{{ lookup('file', '/path/to/site2.crt') }}"
+  delegate_to: localhost
+
 - name: "Delete Certificate"
   bigip_ssl_certificate:
       name: "certificate-name"
@@ -176,6 +204,21 @@ cert_source_path:
     returned: created
     type: string
     sample: "/var/config/rest/downloads/cert1.crt"
+certificates:
+    description:
+      - What was done to each certificate, and key, when C(certificates)
+        is used. The action is one of C(created), C(updated), C(unchanged),
+        C(removed) or C(absent).
+    returned: changed
+    type: list
+    sample:
+      - name: "site1"
+        cert_filename: "site1.crt"
+        cert_checksum: "f7ff9e8b7bb2e09b70935a5d785e0cc5d9d0abf0"
+        cert: "updated"
+        key_filename: "site1.key"
+        key_checksum: "cf23df2207d99a74fbe169e3eba035e633b65d94"
+        key: "unchanged"
 '''
 
 
@@ -188,6 +231,7 @@ try:
 except ImportError:
     from io import StringIO
 
+from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
 from ansible.module_utils.f5_utils import AnsibleF5Parameters
 from ansible.module_utils.f5_utils import HAS_F5SDK
@@ -222,14 +266,7 @@ class Parameters(AnsibleF5Parameters):
         return result
 
     def _get_hash(self, content):
-        k = hashlib.sha1()
-        s = StringIO(content)
-        while True:
-            data = s.read(1024)
-            if not data:
-                break
-            k.update(data.encode('utf-8'))
-        return k.hexdigest()
+        return hashlib.sha1(to_bytes(content)).hexdigest()
 
     @property
     def checksum(self):
@@ -356,6 +393,9 @@ class ModuleManager(object):
         self.client = client
 
     def exec_module(self):
+        if self.client.module.params['certificates']:
+            manager = BulkManager(self.client)
+            return manager.exec_module()
         manager1 = self.get_manager('certificate')
         manager2 = self.get_manager('key')
         result = self.execute_managers([manager1, manager2])
@@ -652,13 +692,133 @@ class KeyManager(BaseManager):
         return result
 
 
+class BulkManager(object):
+    """Manages all of the certificates and keys in the certificates parameter
+
+    Rather than loading each certificate and key to compare it, the
+    checksums of every certificate and key in the partition are read
+    in a single request each. Each item is then handled by a regular
+    CertificateManager and KeyManager, but only when its checksum differs.
+    """
+    item_keys = ['name', 'cert_content', 'key_content', 'passphrase']
+
+    def __init__(self, client):
+        self.client = client
+        self.want = Parameters(self.client.module.params)
+
+    def exec_module(self):
+        try:
+            if self.want.state == 'absent':
+                result = self.absent()
+            else:
+                result = self.present()
+        except iControlUnexpectedHTTPError as e:
+            raise F5ModuleError(str(e))
+        changed = any(
+            x.get(k) not in [None, 'unchanged', 'absent']
+            for x in result for k in ['cert', 'key']
+        )
+        return dict(changed=changed, certificates=result)
+
+    def get_managers(self, item):
+        if not isinstance(item, dict) or not item.get('name'):
+            raise F5ModuleError(
+                "Each of the certificates must have a name."
+            )
+        params = dict(self.client.module.params)
+        params.update(dict(cert_src=None, key_src=None))
+        for key in self.item_keys:
+            params[key] = item.get(key, None)
+
+        cert = CertificateManager(self.client)
+        cert.want = CertParameters(params)
+        key = KeyManager(self.client)
+        key.want = KeyParameters(params)
+        return cert, key
+
+    def present(self):
+        certs = self.read_checksums_from_device(self.client.api.tm.sys.file.ssl_certs)
+        keys = self.read_checksums_from_device(self.client.api.tm.sys.file.ssl_keys)
+        result = []
+        for item in self.want.certificates:
+            cert, key = self.get_managers(item)
+            report = dict(name=item['name'])
+            if cert.want.cert_content is not None:
+                checksum = cert.want.cert_checksum
+                report.update(dict(
+                    cert_filename=cert.want.cert_filename,
+                    cert_checksum=checksum,
+                    cert=self.sync(cert, cert.want.cert_filename, checksum, certs)
+                ))
+            if key.want.key_content is not None:
+                checksum = key.want.key_checksum
+                report.update(dict(
+                    key_filename=key.want.key_filename,
+                    key_checksum=checksum,
+                    key=self.sync(key, key.want.key_filename, checksum, keys)
+                ))
+            result.append(report)
+        return result
+
+    def sync(self, manager, filename, checksum, current):
+        if filename not in current:
+            if not self.client.check_mode:
+                manager.create_on_device()
+            return 'created'
+        if current[filename] == checksum:
+            return 'unchanged'
+        if not self.client.check_mode:
+            manager.update_on_device()
+        return 'updated'
+
+    def absent(self):
+        certs = self.read_checksums_from_device(self.client.api.tm.sys.file.ssl_certs)
+        keys = self.read_checksums_from_device(self.client.api.tm.sys.file.ssl_keys)
+        result = []
+        for item in self.want.certificates:
+            cert, key = self.get_managers(item)
+            report = dict(
+                name=item['name'],
+                cert_filename=cert.want.cert_filename,
+                cert=self.remove(cert, cert.want.cert_filename, certs),
+                key_filename=key.want.key_filename,
+                key=self.remove(key, key.want.key_filename, keys)
+            )
+            result.append(report)
+        return result
+
+    def remove(self, manager, filename, current):
+        if filename not in current:
+            return 'absent'
+        if not self.client.check_mode:
+            manager.remove_from_device()
+        return 'removed'
+
+    def read_checksums_from_device(self, collection):
+        """Returns the SHA1 checksum of every file in the partition by name
+
+        Only the name and checksum of each file are requested. As the kind
+        is not among them, the SDK returns each file as a plain dict.
+
+        :param collection: The SDK collection of certificates or keys.
+        :return: Dictionary of file names to checksums.
+        """
+        params = "$select=name,checksum&$filter=partition+eq+'{0}'".format(
+            self.want.partition
+        )
+        items = collection.get_collection(requests_params=dict(params=params))
+        result = dict()
+        for item in items:
+            checksum = item.get('checksum', None)
+            result[item['name']] = Parameters(dict(checksum=checksum)).checksum
+        return result
+
+
 class ArgumentSpec(object):
     def __init__(self):
         self.supports_check_mode = True
         self.argument_spec = dict(
-            name=dict(
-                required=True
-            ),
+            name=dict(),
             cert_content=dict(aliases=['content']),
             cert_src=dict(
                 type='path',
@@ -675,11 +835,18 @@ class ArgumentSpec(object):
             state=dict(
                 default='present',
                 choices=['absent', 'present']
+            ),
+            certificates=dict(
+                type='list'
             )
         )
         self.mutually_exclusive = [
             ['key_content', 'key_src'],
-            ['cert_content', 'cert_src']
+            ['cert_content', 'cert_src'],
+            ['name', 'certificates']
+        ]
+        self.required_one_of = [
+            ['name', 'certificates']
         ]
         self.f5_product_name = 'bigip'
 
@@ -693,6 +860,7 @@ def main():
     client = AnsibleF5Client(
         argument_spec=spec.argument_spec,
         mutually_exclusive=spec.mutually_exclusive,
+        required_one_of=spec.required_one_of,
         supports_check_mode=spec.supports_check_mode,
         f5_product_name=spec.f5_product_name
     )
@@ -147,6 +147,8 @@ reject:
 '''
 
 
+import re
+
 try:
     import netaddr
     HAS_NETADDR = True
@@ -163,6 +165,43 @@ from ansible.module_utils.f5_utils import (
 )
 
 
+# Addresses parsed by parse_address, keyed by the value that was parsed
+_addresses = dict()
+
+
+def parse_address(value):
+    """Parses an address of the form address%route_domain/prefix
+
+    Both the route domain and the prefix are optional, and the prefix can
+    also be given as a netmask. The same addresses are read many times
+    while changes are worked out, so each value is only parsed once.
+
+    :param value: The address to parse.
+    :return: Tuple of the normalized address, the route domain and the
+             prefix length, or None if the value is not a valid address.
+             The route domain and prefix length are None when not given.
+    """
+    if value in _addresses:
+        return _addresses[value]
+    result = None
+    matches = re.match(r'^(?P<ip>[^%/]+)(%(?P<rd>\d+))?(/(?P<mask>[^%/]+))?$', value)
+    if matches:
+        ip, rd, mask = matches.group('ip', 'rd', 'mask')
+        try:
+            if mask is None:
+                address, prefix = str(netaddr.IPAddress(ip)), None
+            else:
+                network = netaddr.IPNetwork('{0}/{1}'.format(ip, mask))
+                address, prefix = str(network.ip), network.prefixlen
+            if rd is not None:
+                rd = int(rd)
+            result = (address, rd, prefix)
+        except (netaddr.core.AddrFormatError, ValueError):
+            pass
+    _addresses[value] = result
+    return result
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'tmInterface': 'vlan',
@@ -215,13 +254,15 @@ class Parameters(AnsibleF5Parameters):
     def gateway_address(self):
         if self._values['gateway_address'] is None:
             return None
-        try:
-            ip = netaddr.IPNetwork(self._values['gateway_address'])
-            return str(ip.ip)
-        except netaddr.core.AddrFormatError:
+        address = parse_address(self._values['gateway_address'])
+        if address is None:
             raise F5ModuleError(
                 "The provided gateway_address is not an IP address"
             )
+        ip, rd, prefix = address
+        if rd is not None:
+            return '{0}%{1}'.format(ip, rd)
+        return ip
 
     @property
     def reject(self):
@@ -237,13 +278,17 @@ class Parameters(AnsibleF5Parameters):
             return None
         if self._values['destination'] == 'default':
             self._values['destination'] = '0.0.0.0/0'
-        try:
-            ip = netaddr.IPNetwork(self._values['destination'])
-            return '{0}/{1}'.format(ip.ip, ip.prefixlen)
-        except netaddr.core.AddrFormatError:
+        address = parse_address(self._values['destination'])
+        if address is None:
             raise F5ModuleError(
                 "The provided destination is not an IP address"
             )
+        ip, rd, prefix = address
+        if prefix is None:
+            prefix = 128 if ':' in ip else 32
+        if rd is not None:
+            return '{0}%{1}/{2}'.format(ip, rd, prefix)
+        return '{0}/{1}'.format(ip, prefix)
 
 
 class ModuleManager(object):
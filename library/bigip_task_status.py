@@ -0,0 +1,549 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 F5 Networks Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+ANSIBLE_METADATA = {
+    'status': ['preview'],
+    'supported_by': 'community',
+    'metadata_version': '1.1'
+}
+
+DOCUMENTATION = '''
+---
+module: bigip_task_status
+short_description: Check on long running operations started on BIG-IPs.
+description:
+  - Checks on, and optionally waits for, operations that were started with
+    C(wait) set to C(no) in the C(bigip_software), C(bigip_provision),
+    C(bigip_ucs) and C(bigip_qkview) modules.
+  - Many task handles, on many devices, can be checked in a single call.
+    Each device is connected to once and all devices are checked at the
+    same time.
+version_added: "2.5"
+options:
+  tasks:
+    description:
+      - List of task handles, as returned in the C(task) value of the
+        modules that started them.
+      - The C(server) and C(server_port) in each handle are used to connect
+        to the device. The C(user), C(password) and C(validate_certs) of
+        this task are used for all devices.
+    required: true
+  wait:
+    description:
+      - When C(yes), keep checking until every task has finished, or until
+        C(timeout) is reached.
+      - When C(no), check every task once and return its status.
+    default: no
+    choices:
+      - yes
+      - no
+  timeout:
+    description:
+      - Maximum number of seconds to wait for the tasks to finish when
+        C(wait) is C(yes).
+      - Devices are polled with an exponentially increasing delay between
+        checks, up to 30 seconds.
+    default: 3600
+notes:
+  - Requires the f5-sdk Python package on the host. This is as easy as pip
+    install f5-sdk.
+  - The C(server) given to this module is connected to when the module
+    starts, like in all F5 modules, so it must be reachable. The devices
+    checked are the ones named in the task handles.
+  - A qkview is downloaded to the C(dest) given to C(bigip_qkview) once it
+    has been created, replacing any file already there, and is then removed
+    from the device.
+requirements:
+  - f5-sdk >= 2.2.3
+extends_documentation_fragment: f5
+author:
+  - Tim Rupp (@caphrim007)
+'''
+
+EXAMPLES = '''
+- name: Start upgrading each device without waiting for the installs
+  bigip_software:
+      server: "{{ inventory_hostname }}"
+      user: "admin"
+      password: "secret"
+      software: "/root/BIGIP-12.1.2.iso"
+      volume: "HD1.2"
+      state: "activated"
+      wait: no
+  register: upgrade
+  delegate_to: localhost
+
+- name: Wait for all of the upgrades to finish
+  bigip_task_status:
+      server: "{{ ansible_play_hosts | first }}"
+      user: "admin"
+      password: "secret"
+      tasks: "{{ ansible_play_hosts | map('extract', hostvars, ['upgrade', 'task']) | list }}"
+      wait: yes
+      timeout: 7200
+  run_once: true
+  delegate_to: localhost
+
+- name: Check on a provisioning run
+  bigip_task_status:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      tasks:
+        - "{{ provisioning.task }}"
+  register: result
+  until: result.finished
+  retries: 30
+  delay: 60
+  delegate_to: localhost
+'''
+
+RETURN = '''
+tasks:
+    description:
+      - The task handles that were checked, each with its C(status) of
+        C(running), C(finished) or C(failed), and a C(msg) describing why a
+        task is not finished when one is known.
+    returned: always
+    type: list
+    sample: [{"id": "8c3e5f0c0e8a4d4e9d2f5d4c3b2a1f0e", "server": "10.0.0.1", "operation": "provision", "status": "finished"}]
+finished:
+    description: Whether every task has finished.
+    returned: always
+    type: bool
+    sample: True
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for the tasks on
+        each device when C(wait) is C(yes).
+    returned: changed
+    type: dict
+    sample: {"10.0.0.1": {"seconds": 612.3, "polls": 26, "waits": 1}}
+'''
+
+import os
+import random
+import re
+
+from multiprocessing.pool import ThreadPool
+from ansible.module_utils.f5_utils import (
+    AnsibleF5Client,
+    AnsibleF5Parameters,
+    HAS_F5SDK,
+    F5ModuleError,
+    iControlUnexpectedHTTPError
+)
+from ansible.module_utils.f5_utils import time
+from requests.exceptions import RequestException
+
+
+class Parameters(AnsibleF5Parameters):
+    operations = ['software', 'provision', 'ucs', 'qkview']
+
+    returnables = ['tasks', 'finished']
+
+    def to_return(self):
+        result = {}
+        for returnable in self.returnables:
+            result[returnable] = getattr(self, returnable)
+        result = self._filter_params(result)
+        return result
+
+    @property
+    def tasks(self):
+        tasks = self._values['tasks']
+        if tasks is None:
+            return None
+        for task in tasks:
+            if not isinstance(task, dict):
+                raise F5ModuleError(
+                    "Each of the tasks must be a task handle returned by a module."
+                )
+            missing = [x for x in ['id', 'server', 'operation'] if not task.get(x)]
+            if missing:
+                raise F5ModuleError(
+                    "The task handle is missing {0}.".format(', '.join(missing))
+                )
+            if task['operation'] not in self.operations:
+                raise F5ModuleError(
+                    "The '{0}' operation of task {1} is not supported.".format(
+                        task['operation'], task['id']
+                    )
+                )
+        return tasks
+
+
+class TaskClient(object):
+    """Client for the device that a task handle was started on
+
+    This provides the parts of AnsibleF5Client that the managers use, but
+    connected to the server and port in the task handle. Connecting is
+    deferred until the api is first used because the device may be
+    rebooting when it is checked.
+    """
+    def __init__(self, client, server, server_port):
+        self._client = client
+        self.module = client.module
+        self.check_mode = client.check_mode
+        self._connect_params = dict(client._connect_params)
+        self._connect_params['server'] = server
+        if server_port is not None:
+            self._connect_params['server_port'] = server_port
+        self._api = None
+
+    @property
+    def api(self):
+        if self._api is None:
+            self._api = self._client._get_mgmt_root(
+                'bigip', **self._connect_params
+            )
+        return self._api
+
+    def reconnect(self):
+        self._api = None
+
+
+class ModuleManager(object):
+    def __init__(self, client):
+        self.client = client
+        self.want = Parameters(self.client.module.params)
+        self.changes = Parameters()
+
+    def exec_module(self):
+        devices = []
+        tasks = dict()
+        for task in self.want.tasks:
+            key = (task['server'], task.get('server_port'))
+            if key not in tasks:
+                devices.append(key)
+                tasks[key] = []
+            tasks[key].append(task)
+
+        def run(device):
+            manager = self.get_manager(device, tasks[device])
+            manager.check()
+            return manager
+
+        pool = ThreadPool(len(devices) or 1)
+        try:
+            managers = pool.map(run, devices)
+        finally:
+            pool.close()
+            pool.join()
+
+        results = dict()
+        wait_times = dict()
+        for manager in managers:
+            results.update(manager.results)
+            wait_times.update(manager.wait_times)
+
+        checked = [results[x['id']] for x in self.want.tasks]
+        failed = [x for x in checked if x['status'] == 'failed']
+        if failed:
+            raise F5ModuleError('; '.join(
+                '{0} {1} on {2}: {3}'.format(
+                    x['operation'], x['id'], x['server'], x.get('msg')
+                ) for x in failed
+            ))
+        finished = all(x['status'] == 'finished' for x in checked)
+        if self.want.wait and not finished:
+            raise F5ModuleError(
+                "Timed out waiting for tasks {0} to finish.".format(', '.join(
+                    x['id'] for x in checked if x['status'] != 'finished'
+                ))
+            )
+
+        self.changes = Parameters(dict(tasks=checked, finished=finished))
+        result = self.changes.to_return()
+        result.update(dict(
+            changed=any(x.get('downloaded') for x in checked)
+        ))
+        if wait_times:
+            result.update(dict(wait_times=wait_times))
+        return result
+
+    def get_manager(self, device, tasks):
+        client = TaskClient(self.client, *device)
+        return DeviceManager(client, self.want, tasks)
+
+
+class DeviceManager(object):
+    def __init__(self, client, want, tasks):
+        self.client = client
+        self.want = want
+        self.tasks = tasks
+        self.results = dict()
+        self.wait_times = dict()
+
+    def check(self):
+        for task in self.tasks:
+            self.results[task['id']] = dict(task, status='running')
+        if self.want.wait:
+            self._wait_until(
+                self.client._connect_params['server'], self.check_pending,
+                interval=5
+            )
+        else:
+            self.check_pending()
+
+    def check_pending(self):
+        """Checks each of the tasks that is still running
+
+        :return: True when none of the tasks are still running.
+        """
+        pending = [x for x in self.tasks if self.results[x['id']]['status'] == 'running']
+        for task in pending:
+            result = self.results[task['id']]
+            check = getattr(self, 'check_{0}'.format(task['operation']))
+            try:
+                status, msg = check(task)
+            except (iControlUnexpectedHTTPError, RequestException) as ex:
+                # Operations such as installing a UCS, or rebooting into a
+                # new volume, restart the REST API or the whole device. It
+                # is not known whether the task failed until the device is
+                # back.
+                self.client.reconnect()
+                status, msg = 'running', str(ex)
+            result['status'] = status
+            if msg:
+                result['msg'] = msg
+            else:
+                result.pop('msg', None)
+        return all(self.results[x['id']]['status'] != 'running' for x in self.tasks)
+
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for the tasks started on one device to finish
+
+        The delay between checks doubles from interval, up to 30 seconds,
+        with jitter so that several devices are not checked in lock step.
+        The wait is given up after the timeout of the module, or an hour.
+        The time spent on the device is kept in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 3600
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
+
+    def check_software(self, task):
+        volumes = self.client.api.tm.sys.software.volumes.get_collection()
+        volume = None
+        for item in volumes:
+            if item.name == task.get('volume'):
+                volume = item
+                break
+        if volume is None:
+            return 'running', 'The volume has not been created yet.'
+        status = str(getattr(volume, 'status', ''))
+        if 'failed' in status:
+            return 'failed', status
+        if 'complete' not in status:
+            return 'running', status
+        for key in ['version', 'build']:
+            if task.get(key) and str(getattr(volume, key, '')) != task[key]:
+                return 'running', 'The volume has {0} {1} installed.'.format(
+                    key, getattr(volume, key, None)
+                )
+        if task.get('activate') and getattr(volume, 'active', False) is not True:
+            return 'running', 'The device has not booted into the volume yet.'
+        return 'finished', None
+
+    def check_provision(self, task):
+        if self._is_mprov_running_on_device():
+            return 'running', 'Modules are being provisioned.'
+        provision = self.client.api.tm.sys.provision
+        resource = getattr(provision, task['module'])
+        resource = resource.load()
+        level = str(resource.attrs['level'])
+        if level != task['level']:
+            return 'running', 'The module is provisioned at {0}.'.format(level)
+        return 'finished', None
+
+    def check_ucs(self, task):
+        status, msg = self.read_task_status_on_device(task)
+        if status != 'finished':
+            return status, msg
+        output = self.client.api.tm.util.bash.exec_cmd(
+            'run',
+            utilCmdArgs='-c "tmsh show sys mcp-state"'
+        )
+        if not hasattr(output, 'commandResult'):
+            return 'running', 'The configuration is being reloaded.'
+        result = output.commandResult
+        if self._is_config_reloading_failed_on_device(result):
+            return 'failed', (
+                "Failed to reload the configuration. This may be due "
+                "to a cross-version incompatibility. {0}".format(result)
+            )
+        if self._is_config_reloading_success_on_device(result):
+            if self._is_config_reloading_running_on_device(result):
+                return 'finished', None
+        return 'running', 'The configuration is being reloaded.'
+
+    def check_qkview(self, task):
+        status, msg = self.read_task_status_on_device(task)
+        if status != 'finished':
+            return status, msg
+        if not self.qkview_exists_on_device(task):
+            # The qkview is removed from the device once it is downloaded,
+            # so an earlier check of this task has already saved it.
+            if os.path.exists(task['dest']):
+                return 'finished', None
+            return 'failed', 'The qkview is no longer on the device.'
+        if os.path.exists(task['dest']):
+            os.remove(task['dest'])
+        location = getattr(self.client.api.shared.file_transfer, task['location'])
+        location.download_file(task['filename'], task['dest'])
+        if not os.path.exists(task['dest']):
+            return 'failed', 'Failed to save the qkview to local disk'
+        self.client.api.tm.util.unix_rm.exec_cmd(
+            'run',
+            utilCmdArgs='/var/config/rest/{0}/{1}'.format(
+                task['location'], task['filename']
+            )
+        )
+        self.results[task['id']]['downloaded'] = True
+        return 'finished', None
+
+    def qkview_exists_on_device(self, task):
+        ls = self.client.api.tm.util.unix_ls.exec_cmd(
+            'run',
+            utilCmdArgs='/var/config/rest/{0}'.format(task['location'])
+        )
+
+        # Empty directories return nothing to the commandResult
+        if not hasattr(ls, 'commandResult'):
+            return False
+        return task['filename'] in ls.commandResult
+
+    def read_task_status_on_device(self, task):
+        """Reads the status file written by a task run in the background
+
+        :return: Tuple of the status of the task and a message.
+        """
+        status = '/var/tmp/.ansible-task-{0}.status'.format(task['id'])
+        output = self.client.api.tm.util.bash.exec_cmd(
+            'run',
+            utilCmdArgs='-c "cat {0}"'.format(status)
+        )
+        if not hasattr(output, 'commandResult'):
+            return 'failed', 'The task was not found on the device.'
+        result = str(output.commandResult).strip()
+        if result == 'done':
+            return 'finished', None
+        elif result == 'running':
+            return 'running', None
+        elif result == 'failed':
+            return 'failed', 'See /var/tmp/.ansible-task-{0}.log on the device.'.format(
+                task['id']
+            )
+        return 'failed', 'The task was not found on the device.'
+
+    def _is_mprov_running_on_device(self):
+        output = self.client.api.tm.util.bash.exec_cmd(
+            'run',
+            utilCmdArgs='-c "ps aux | grep \'[m]prov\'"'
+        )
+        if hasattr(output, 'commandResult'):
+            return True
+        return False
+
+    def _is_config_reloading_success_on_device(self, output):
+        succeed = r'Last Configuration Load Status\s+full-config-load-succeed'
+        matches = re.search(succeed, output)
+        if matches:
+            return True
+        return False
+
+    def _is_config_reloading_running_on_device(self, output):
+        running = r'Running Phase\s+running'
+        matches = re.search(running, output)
+        if matches:
+            return True
+        return False
+
+    def _is_config_reloading_failed_on_device(self, output):
+        failed = r'Last Configuration Load Status\s+base-config-load-failed'
+        matches = re.search(failed, output)
+        if matches:
+            return True
+        return False
+
+
+class ArgumentSpec(object):
+    def __init__(self):
+        self.supports_check_mode = False
+        self.argument_spec = dict(
+            tasks=dict(
+                type='list',
+                required=True
+            ),
+            wait=dict(
+                type='bool',
+                default='no'
+            ),
+            timeout=dict(
+                type='int',
+                default=3600
+            )
+        )
+        self.f5_product_name = 'bigip'
+
+
+def main():
+    if not HAS_F5SDK:
+        raise F5ModuleError("The python f5-sdk module is required")
+
+    spec = ArgumentSpec()
+
+    client = AnsibleF5Client(
+        argument_spec=spec.argument_spec,
+        supports_check_mode=spec.supports_check_mode,
+        f5_product_name=spec.f5_product_name
+    )
+
+    try:
+        mm = ModuleManager(client)
+        results = mm.exec_module()
+        client.module.exit_json(**results)
+    except (F5ModuleError, iControlUnexpectedHTTPError) as e:
+        client.module.fail_json(msg=str(e))
+
+
+if __name__ == '__main__':
+    main()
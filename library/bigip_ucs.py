@@ -98,6 +98,19 @@ options:
       - absent
       - installed
       - present
+  wait:
+    description:
+      - When C(no), the module starts installing the UCS and returns
+        straight away instead of waiting for the configuration to be
+        reloaded. A C(task) handle is returned, which can be given to the
+        C(bigip_task_status) module to check on, or wait for, the install
+        later.
+      - Uploading the UCS always finishes before the module returns.
+    default: yes
+    choices:
+      - yes
+      - no
+    version_added: 2.5
 notes:
    - Requires the f5-sdk Python package on the host. This is as easy as
      pip install f5-sdk.
@@ -178,6 +191,17 @@ EXAMPLES = '''
       passphrase: "MyPassphrase1234"
   delegate_to: localhost
 
+- name: Start installing a UCS without waiting for it to finish
+  bigip_ucs:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      ucs: "/root/bigip.localhost.localdomain.ucs"
+      state: "installed"
+      wait: no
+  register: restore
+  delegate_to: localhost
+
 - name: Remove uploaded UCS file
   bigip_ucs:
       server: "lb.mydomain.com"
@@ -189,12 +213,18 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-# only common fields returned
+task:
+    description:
+      - Handle of the install started on the device when C(wait) is C(no).
+    returned: changed
+    type: dict
+    sample: {"id": "8c3e5f0c0e8a4d4e9d2f5d4c3b2a1f0e", "server": "10.0.0.1", "server_port": 443, "operation": "ucs", "ucs": "bigip.localhost.localdomain.ucs"}
 '''
 
 import os
 import re
 import time
+import uuid
 
 from collections import OrderedDict
 from distutils.version import LooseVersion
@@ -329,6 +359,7 @@ class BaseManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.task = None
 
     def exec_module(self):
         changed = False
@@ -346,8 +377,24 @@ class BaseManager(object):
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.task:
+            result.update(dict(task=self.task))
         return result
 
+    def _create_task(self):
+        """Returns a handle for an install that is not being waited on
+
+        The handle has everything the bigip_task_status module needs to
+        find the device and check on the install later.
+        """
+        return dict(
+            id=uuid.uuid4().hex,
+            server=self.client._connect_params['server'],
+            server_port=self.client._connect_params['server_port'],
+            operation='ucs',
+            ucs=self.want.basename
+        )
+
     def present(self):
         if self.exists():
             return self.update()
@@ -516,7 +563,30 @@ class V1Manager(BaseManager):
                 return True
         return False
 
+    def start_install_on_device(self, task):
+        """Runs the install in the background on the device
+
+        The outcome of the install is written to a status file named after
+        the task, and its output to a log file next to it, so that they
+        can be read after the module has returned.
+        """
+        status = '/var/tmp/.ansible-task-{0}.status'.format(task['id'])
+        log = '/var/tmp/.ansible-task-{0}.log'.format(task['id'])
+        command = (
+            "echo running > {0}; "
+            "( ({2}) > {1} 2>&1 && echo done > {0} || echo failed > {0} ) "
+            "< /dev/null > /dev/null 2>&1 &"
+        ).format(status, log, self.want.install_command)
+        self.client.api.tm.util.bash.exec_cmd(
+            'run',
+            utilCmdArgs='-c "{0}"'.format(command)
+        )
+
     def install_on_device(self):
+        if not self.want.wait:
+            self.task = self._create_task()
+            self.start_install_on_device(self.task)
+            return True
         try:
             self.client.api.tm.util.bash.exec_cmd(
                 'run',
@@ -585,7 +655,11 @@ class ArgumentSpec(object):
                 default='present',
                 choices=['absent', 'installed', 'present']
             ),
-            ucs=dict(required=True)
+            ucs=dict(required=True),
+            wait=dict(
+                type='bool',
+                default='yes'
+            )
         )
         self.f5_product_name = 'bigip'
 
@@ -45,7 +45,7 @@ options:
     description:
       - Name of the user to create, remove or modify. There is a special case
         that exists for the user C(root).
-    required: True
+      - Either this or C(users) is required.
     aliases:
       - name
   password_credential:
@@ -86,6 +86,19 @@ options:
     choices:
       - always
       - on_create
+  users:
+    description:
+      - List of users to manage in a single task, instead of the one named
+        by C(username_credential).
+      - Each item is a dictionary that can contain the C(name),
+        C(password_credential), C(full_name), C(shell), C(partition_access),
+        C(update_password) and C(state) options. C(name) is required, and
+        may not be C(root). Options that are not given are taken from the
+        task.
+      - The users in the partition are read in a single request, and only
+        the users that need to be created, updated or removed are sent to
+        the device.
+    version_added: 2.5
 notes:
    - Requires the f5-sdk Python package on the host. This is as easy as
      pip install f5-sdk.
@@ -170,6 +183,24 @@ EXAMPLES = '''
       password_credential: "NewSecretPassword"
   delegate_to: localhost
 
+- name: Add several users, and remove another, in one task
+  bigip_user:
+      server: "lb.mydomain.com"
+      user: "admin"
+      password: "secret"
+      update_password: "on_create"
+      users:
+        - name: "johnd"
+          password_credential: "password"
+          full_name: "John Doe"
+          partition_access: "all:admin"
+        - name: "janed"
+          password_credential: "password"
+          partition_access: "Common:operator"
+        - name: "olduser"
+          state: "absent"
+  delegate_to: localhost
+
 - name: Change the root user's password
   bigip_user:
       server: "lb.mydomain.com"
@@ -199,12 +230,25 @@ shell:
     returned: changed and success
     type: string
     sample: "tmsh"
+users:
+    description:
+      - What was done to each of the users in C(users). The status is one
+        of C(created), C(updated), C(unchanged), C(removed) or C(absent).
+    returned: changed and success
+    type: list
+    sample: [{"name": "johnd", "status": "created"}]
+requests:
+    description: Number of requests made to the device.
+    returned: success
+    type: int
+    sample: 1
 '''
 
 import os
 import tempfile
 
 from distutils.version import LooseVersion
+from functools import wraps
 from ansible.module_utils.f5_utils import AnsibleF5Client
 from ansible.module_utils.f5_utils import AnsibleF5Parameters
 from ansible.module_utils.f5_utils import defaultdict
@@ -212,6 +256,7 @@ from ansible.module_utils.f5_utils import HAS_F5SDK
 from ansible.module_utils.f5_utils import F5ModuleError
 from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 from ansible.module_utils.f5_utils import iteritems
+from ansible.module_utils.six import string_types
 
 try:
     from StringIO import StringIO
@@ -219,6 +264,15 @@ except ImportError:
     from io import StringIO
 
 
+def counted(method):
+    """Counts each call of a method that sends one request for a user"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'partitionAccess': 'partition_access',
@@ -337,7 +391,9 @@ class ModuleManager(object):
         self.client = client
 
     def exec_module(self):
-        if self.is_root_username_credential():
+        if self.client.module.params.get('users'):
+            manager = BulkManager(self.client)
+        elif self.is_root_username_credential():
             manager = RootUserManager(self.client)
         elif self.is_version_less_than_13():
             manager = UnparitionedManager(self.client)
@@ -372,6 +428,9 @@ class BaseManager(object):
             self.have = None
             self.want = Parameters(self.client.module.params)
             self.changes = Parameters()
+            self.requests = 0
+            self._resource = None
+            self._loaded = False
 
         def exec_module(self):
             changed = False
@@ -388,7 +447,7 @@ class BaseManager(object):
 
             changes = self.changes.to_return()
             result.update(**changes)
-            result.update(dict(changed=changed))
+            result.update(dict(changed=changed, requests=self.requests))
             return result
 
         def _set_changed_options(self):
@@ -453,6 +512,33 @@ class BaseManager(object):
                 if not any(r['role'] for r in want if r['role'] in permit):
                     raise F5ModuleError(err)
 
+        def load_from_device(self):
+            """Returns the user, loading it on first use
+
+            :return: The user, or None if it does not exist.
+            """
+            if not self._loaded:
+                try:
+                    self._resource = self.load_on_device()
+                except iControlUnexpectedHTTPError as e:
+                    if e.response.status_code != 404:
+                        raise
+                    self._resource = None
+                self._loaded = True
+            return self._resource
+
+        def exists(self):
+            return self.load_from_device() is not None
+
+        @counted
+        def delete_on_device(self, resource):
+            resource.delete()
+
+        def read_current_from_device(self):
+            resource = self.load_from_device()
+            result = resource.attrs
+            return Parameters(result)
+
         def present(self):
             if self.exists():
                 return self.update()
@@ -499,6 +585,7 @@ class BaseManager(object):
             if self.client.check_mode:
                 return True
             self.remove_from_device()
+            self._loaded = False
             if self.exists():
                 raise F5ModuleError("Failed to delete the user")
             return True
@@ -515,59 +602,50 @@ class BaseManager(object):
 
 
 class UnparitionedManager(BaseManager):
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.auth.users.user.create(**params)
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        result = self.client.api.tm.auth.users.user.load(name=self.want.name)
-        result.modify(**params)
+        resource = self.load_from_device()
+        resource.modify(**params)
 
-    def read_current_from_device(self):
-        tmp_res = self.client.api.tm.auth.users.user.load(name=self.want.name)
-        result = tmp_res.attrs
-        return Parameters(result)
-
-    def exists(self):
-        return self.client.api.tm.auth.users.user.exists(name=self.want.name)
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.auth.users.user.load(name=self.want.name)
 
     def remove_from_device(self):
-        result = self.client.api.tm.auth.users.user.load(name=self.want.name)
-        if result:
-            result.delete()
+        resource = self.load_from_device()
+        if resource:
+            self.delete_on_device(resource)
 
 
 class PartitionedManager(BaseManager):
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.auth.users.user.create(
             partition=self.want.partition, **params
         )
 
-    def _read_one_resource_from_collection(self):
-        collection = self.client.api.tm.auth.users.get_collection(
-            requests_params=dict(
-                params="$filter=partition+eq+'{0}'".format(self.want.partition)
-            )
-        )
-        collection = [x for x in collection if x.name == self.want.name]
-        if len(collection) == 1:
-            resource = collection.pop()
-            return resource
-        elif len(collection) == 0:
-            raise F5ModuleError(
-                "No accounts with the provided name were found"
-            )
-        else:
-            raise F5ModuleError(
-                "Multiple users with the provided name were found!"
-            )
-
+    @counted
+    def load_on_device(self):
+        # User names are unique on the device, whatever their partition,
+        # so the user is read by name. A user in another partition is
+        # treated as absent from this one.
+        resource = self.client.api.tm.auth.users.user.load(name=self.want.name)
+        if getattr(resource, 'partition', self.want.partition) != self.want.partition:
+            return None
+        return resource
+
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
         try:
-            resource = self._read_one_resource_from_collection()
+            resource = self.load_from_device()
             resource.modify(**params)
         except iControlUnexpectedHTTPError as ex:
             # TODO: Patch this in the F5 SDK so that I dont need this check
@@ -576,32 +654,10 @@ class PartitionedManager(BaseManager):
                     "Failed to update the specified user"
                 )
 
-    def read_current_from_device(self):
-        resource = self._read_one_resource_from_collection()
-        result = resource.attrs
-        return Parameters(result)
-
-    def exists(self):
-        collection = self.client.api.tm.auth.users.get_collection(
-            requests_params=dict(
-                params="$filter=partition+eq+'{0}'".format(self.want.partition)
-            )
-        )
-        collection = [x for x in collection if x.name == self.want.name]
-        if len(collection) == 1:
-            result = True
-        elif len(collection) == 0:
-            result = False
-        else:
-            raise F5ModuleError(
-                "Multiple users with the provided name were found!"
-            )
-        return result
-
     def remove_from_device(self):
-        resource = self._read_one_resource_from_collection()
+        resource = self.load_from_device()
         if resource:
-            resource.delete()
+            self.delete_on_device(resource)
 
 
 class RootUserManager(BaseManager):
@@ -665,12 +721,102 @@ class RootUserManager(BaseManager):
         )
 
 
+class BulkManager(ModuleManager):
+    """Manages all of the users in the users parameter
+
+    The users are read from the device in a single request. Each user is
+    then handled by the same manager that would handle it if it had been
+    given to the module on its own, but without reading it again.
+    """
+    item_keys = [
+        'name', 'password_credential', 'full_name', 'shell',
+        'partition_access', 'update_password', 'state'
+    ]
+
+    def __init__(self, client):
+        super(BulkManager, self).__init__(client)
+        self.want = Parameters(self.client.module.params)
+        self.requests = 0
+
+    def exec_module(self):
+        try:
+            current = self.read_users_from_device()
+            result = [self.reconcile(item, current) for item in self.want.users]
+        except iControlUnexpectedHTTPError as e:
+            raise F5ModuleError(str(e))
+        changed = any(x['status'] not in ['unchanged', 'absent'] for x in result)
+        return dict(changed=changed, users=result, requests=self.requests)
+
+    def get_manager(self, item):
+        if not isinstance(item, dict) or not item.get('name'):
+            raise F5ModuleError(
+                "Each of the users must have a name."
+            )
+        if item['name'] == 'root':
+            raise F5ModuleError(
+                "The root user cannot be managed with the 'users' option."
+            )
+        params = dict(self.client.module.params)
+        for key in self.item_keys:
+            if item.get(key, None) is not None:
+                params[key] = item[key]
+        if isinstance(params['partition_access'], string_types):
+            params['partition_access'] = [params['partition_access']]
+        if self.want.state == 'absent':
+            params['state'] = 'absent'
+        if self.is_version_less_than_13():
+            manager = UnparitionedManager(self.client)
+        else:
+            manager = PartitionedManager(self.client)
+        manager.want = Parameters(params)
+        return manager
+
+    def reconcile(self, item, current):
+        """Creates, updates or removes one of the users
+
+        :param item: The user from the users parameter.
+        :param current: Dictionary of user names to the users on the device.
+        :return: Dictionary of the name of the user and what was done to it.
+        """
+        manager = self.get_manager(item)
+        name = manager.want.name
+        manager._resource = current.get(name, None)
+        manager._loaded = True
+        if manager.want.state == 'absent':
+            changed = manager.absent()
+            status = 'removed' if changed else 'absent'
+        elif manager._resource is None:
+            manager.present()
+            status = 'created'
+        else:
+            changed = manager.present()
+            status = 'updated' if changed else 'unchanged'
+        self.requests += manager.requests
+        return dict(name=name, status=status)
+
+    @counted
+    def read_users_from_device(self):
+        """Returns every user that can be managed, by name
+
+        :return: Dictionary of user names to users.
+        """
+        if self.is_version_less_than_13():
+            collection = self.client.api.tm.auth.users.get_collection()
+        else:
+            collection = self.client.api.tm.auth.users.get_collection(
+                requests_params=dict(
+                    params="$filter=partition+eq+'{0}'".format(self.want.partition)
+                )
+            )
+        result = dict((str(x.name), x) for x in collection)
+        return result
+
+
 class ArgumentSpec(object):
     def __init__(self):
         self.supports_check_mode = True
         self.argument_spec = dict(
             name=dict(
-                required=True,
                 aliases=['username_credential']
             ),
             password_credential=dict(
@@ -686,8 +832,40 @@ class ArgumentSpec(object):
             update_password=dict(
                 default='always',
                 choices=['always', 'on_create']
+            ),
+            users=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    name=dict(
+                        required=True,
+                        aliases=['username_credential']
+                    ),
+                    password_credential=dict(
+                        no_log=True,
+                    ),
+                    partition_access=dict(
+                        type='list'
+                    ),
+                    full_name=dict(),
+                    shell=dict(
+                        choices=['none', 'bash', 'tmsh']
+                    ),
+                    update_password=dict(
+                        choices=['always', 'on_create']
+                    ),
+                    state=dict(
+                        choices=['present', 'absent']
+                    )
+                )
             )
         )
+        self.mutually_exclusive = [
+            ['name', 'users']
+        ]
+        self.required_one_of = [
+            ['name', 'users']
+        ]
         self.f5_product_name = 'bigip'
 
 
@@ -700,6 +878,8 @@ def main():
     client = AnsibleF5Client(
         argument_spec=spec.argument_spec,
         supports_check_mode=spec.supports_check_mode,
+        mutually_exclusive=spec.mutually_exclusive,
+        required_one_of=spec.required_one_of,
         f5_product_name=spec.f5_product_name
     )
 
@@ -196,6 +196,8 @@ state:
     sample: disabled
 '''
 
+import re
+
 try:
     import netaddr
     HAS_NETADDR = True
@@ -213,6 +215,43 @@ from ansible.module_utils.f5_utils import (
 )
 
 
+# Addresses parsed by parse_address, keyed by the value that was parsed
+_addresses = dict()
+
+
+def parse_address(value):
+    """Parses an address of the form address%route_domain/prefix
+
+    Both the route domain and the prefix are optional, and the prefix can
+    also be given as a netmask. The same addresses are read many times
+    while changes are worked out, so each value is only parsed once.
+
+    :param value: The address to parse.
+    :return: Tuple of the normalized address, the route domain and the
+             prefix length, or None if the value is not a valid address.
+             The route domain and prefix length are None when not given.
+    """
+    if value in _addresses:
+        return _addresses[value]
+    result = None
+    matches = re.match(r'^(?P<ip>[^%/]+)(%(?P<rd>\d+))?(/(?P<mask>[^%/]+))?$', value)
+    if matches:
+        ip, rd, mask = matches.group('ip', 'rd', 'mask')
+        try:
+            if mask is None:
+                address, prefix = str(netaddr.IPAddress(ip)), None
+            else:
+                network = netaddr.IPNetwork('{0}/{1}'.format(ip, mask))
+                address, prefix = str(network.ip), network.prefixlen
+            if rd is not None:
+                rd = int(rd)
+            result = (address, rd, prefix)
+        except (netaddr.core.AddrFormatError, ValueError):
+            pass
+    _addresses[value] = result
+    return result
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'routeAdvertisement': 'use_route_advertisement',
@@ -284,25 +323,26 @@ class Parameters(AnsibleF5Parameters):
     def address(self):
         if self._values['address'] is None:
             return None
-        try:
-            ip = netaddr.IPAddress(self._values['address'])
-            return str(ip)
-        except netaddr.core.AddrFormatError:
+        address = parse_address(self._values['address'])
+        if address is None or address[2] is not None:
             raise F5ModuleError(
                 "The provided 'address' is not a valid IP address"
             )
+        ip, rd, prefix = address
+        if rd is not None:
+            return '{0}%{1}'.format(ip, rd)
+        return ip
 
     @property
     def netmask(self):
         if self._values['netmask'] is None:
             return None
-        try:
-            ip = netaddr.IPAddress(self._values['netmask'])
-            return str(ip)
-        except netaddr.core.AddrFormatError:
+        address = parse_address(self._values['netmask'])
+        if address is None or address[1:] != (None, None):
             raise F5ModuleError(
                 "The provided 'netmask' is not a valid IP address"
             )
+        return address[0]
 
     @property
     def auto_delete(self):
@@ -182,12 +182,19 @@ deleted:
     returned: changed
     type: string
     sample: "my-virtual-server"
+requests:
+    description: Number of requests made to the device.
+    returned: always
+    type: int
+    sample: 1
 '''
 
 
 import netaddr
 import re
 
+from functools import wraps
+
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
     AnsibleF5Parameters,
@@ -199,6 +206,52 @@ from ansible.module_utils.f5_utils import (
 )
 
 
+# Addresses parsed by parse_address, keyed by the value that was parsed
+_addresses = dict()
+
+
+def parse_address(value):
+    """Parses an address of the form address%route_domain/prefix
+
+    Both the route domain and the prefix are optional, and the prefix can
+    also be given as a netmask. The same addresses are read many times
+    while changes are worked out, so each value is only parsed once.
+
+    :param value: The address to parse.
+    :return: Tuple of the normalized address, the route domain and the
+             prefix length, or None if the value is not a valid address.
+             The route domain and prefix length are None when not given.
+    """
+    if value in _addresses:
+        return _addresses[value]
+    result = None
+    matches = re.match(r'^(?P<ip>[^%/]+)(%(?P<rd>\d+))?(/(?P<mask>[^%/]+))?$', value)
+    if matches:
+        ip, rd, mask = matches.group('ip', 'rd', 'mask')
+        try:
+            if mask is None:
+                address, prefix = str(netaddr.IPAddress(ip)), None
+            else:
+                network = netaddr.IPNetwork('{0}/{1}'.format(ip, mask))
+                address, prefix = str(network.ip), network.prefixlen
+            if rd is not None:
+                rd = int(rd)
+            result = (address, rd, prefix)
+        except (netaddr.core.AddrFormatError, ValueError):
+            pass
+    _addresses[value] = result
+    return result
+
+
+def counted(method):
+    """Counts each call of a method that sends one request for the virtual server or address"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.requests += 1
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Parameters(AnsibleF5Parameters):
     def __init__(self, params=None):
         self._values = defaultdict(lambda: None)
@@ -233,10 +286,8 @@ class Parameters(AnsibleF5Parameters):
     def destination(self):
         if self._values['destination'] is None:
             return None
-        destination = self._values['destination']
-        try:
-            netaddr.IPAddress(destination.split("%")[0])
-        except netaddr.core.AddrFormatError:
+        address = parse_address(self._values['destination'])
+        if address is None or address[2] is not None:
             raise F5ModuleError(
                 "The provided destination is not a valid IP address"
             )
@@ -581,36 +632,38 @@ class ModuleManager(object):
 
     def exec_module(self):
         managers = list()
-        managers.append(self.get_manager('virtual_server'))
+        vsm = self.get_manager('virtual_server')
+        managers.append(vsm)
         if self.client.module.params['route_advertisement_state'] is not None:
+            self.set_name_of_virtual_address(vsm)
             managers.append(self.get_manager('virtual_address'))
         result = self.execute_managers(managers)
         return result
 
     def execute_managers(self, managers):
-        results = dict(changed=False)
+        results = dict(changed=False, requests=0)
         for manager in managers:
             result = manager.exec_module()
             for k, v in iteritems(result):
                 if k == 'changed':
                     if v is True:
                         results['changed'] = True
+                elif k == 'requests':
+                    results['requests'] += v
                 else:
                     results[k] = v
         return results
 
     def get_manager(self, type):
-        vsm = VirtualServerManager(self.client)
         if type == 'virtual_server':
-            return vsm
+            return VirtualServerManager(self.client)
         elif type == 'virtual_address':
-            self.set_name_of_virtual_address()
-            result = VirtualAddressManager(self.client)
-            return result
+            return VirtualAddressManager(self.client)
 
-    def set_name_of_virtual_address(self):
-        mgr = VirtualServerManager(self.client)
-        params = mgr.read_current_from_device()
+    def set_name_of_virtual_address(self, manager):
+        # The virtual server manager keeps the virtual server that is read
+        # here, so it is not read again when the manager is run.
+        params = manager.read_current_from_device()
         name = params.destination_address
         self.client.module.params['name'] = name
 
@@ -619,6 +672,9 @@ class BaseManager(object):
     def __init__(self, client):
         self.client = client
         self.have = None
+        self.requests = 0
+        self._resource = None
+        self._loaded = False
 
     def exec_module(self):
         changed = False
@@ -635,7 +691,7 @@ class BaseManager(object):
 
         changes = self.changes.to_return()
         result.update(**changes)
-        result.update(dict(changed=changed))
+        result.update(dict(changed=changed, requests=self.requests))
         self._announce_deprecations()
         return result
 
@@ -651,6 +707,28 @@ class BaseManager(object):
                 version=warning['version']
             )
 
+    def load_from_device(self):
+        """Returns the virtual server or address, loading it on first use
+
+        :return: The resource, or None if it does not exist.
+        """
+        if not self._loaded:
+            try:
+                self._resource = self.load_on_device()
+            except iControlUnexpectedHTTPError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._resource = None
+            self._loaded = True
+        return self._resource
+
+    def exists(self):
+        return self.load_from_device() is not None
+
+    @counted
+    def delete_on_device(self, resource):
+        resource.delete()
+
     def present(self):
         if self.exists():
             return self.update()
@@ -721,13 +799,6 @@ class VirtualServerManager(BaseManager):
             return True
         return False
 
-    def exists(self):
-        result = self.client.api.tm.ltm.virtuals.virtual.exists(
-            name=self.want.name,
-            partition=self.want.partition
-        )
-        return result
-
     def create(self):
         required_resources = ['destination', 'port']
 
@@ -742,16 +813,15 @@ class VirtualServerManager(BaseManager):
             )
         return super(VirtualServerManager, self).create()
 
+    @counted
     def update_on_device(self):
         params = self.changes.api_params()
-        resource = self.client.api.tm.ltm.virtuals.virtual.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.modify(**params)
 
-    def read_current_from_device(self):
-        result = self.client.api.tm.ltm.virtuals.virtual.load(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.ltm.virtuals.virtual.load(
             name=self.want.name,
             partition=self.want.partition,
             requests_params=dict(
@@ -760,9 +830,13 @@ class VirtualServerManager(BaseManager):
                 )
             )
         )
+
+    def read_current_from_device(self):
+        result = self.load_from_device()
         result = VirtualServerParameters(result.attrs)
         return result
 
+    @counted
     def create_on_device(self):
         params = self.want.api_params()
         self.client.api.tm.ltm.virtuals.virtual.create(
@@ -770,14 +844,13 @@ class VirtualServerManager(BaseManager):
             partition=self.want.partition,
             **params
         )
+        self._loaded = False
 
     def remove_from_device(self):
-        resource = self.client.api.tm.ltm.virtuals.virtual.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         if resource:
-            resource.delete()
+            self.delete_on_device(resource)
+            self._loaded = False
 
 
 class VirtualAddressManager(BaseManager):
@@ -811,27 +884,22 @@ class VirtualAddressManager(BaseManager):
         return False
 
     def read_current_from_device(self):
-        result = self.client.api.tm.ltm.virtual_address_s.virtual_address.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        result = self.load_from_device()
         result = VirtualAddressParameters(result.attrs)
         return result
 
+    @counted
     def update_on_device(self):
         params = self.want.api_params()
-        resource = self.client.api.tm.ltm.virtual_address_s.virtual_address.load(
-            name=self.want.name,
-            partition=self.want.partition
-        )
+        resource = self.load_from_device()
         resource.modify(**params)
 
-    def exists(self):
-        result = self.client.api.tm.ltm.virtual_address_s.virtual_address.exists(
+    @counted
+    def load_on_device(self):
+        return self.client.api.tm.ltm.virtual_address_s.virtual_address.load(
             name=self.want.name,
             partition=self.want.partition
         )
-        return result
 
 
 class ArgumentSpec(object):
@@ -53,6 +53,11 @@ options:
     choices:
       - present
       - absent
+  timeout:
+    description:
+      - Number of seconds to wait for a device to become active on iWorkflow.
+    default: 1800
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -77,9 +82,16 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for
+        the device to become active.
+    returned: changed
+    type: dict
+    sample: {"activate": {"seconds": 41.2, "polls": 6, "waits": 1}}
 '''
 
+import random
 import time
 from ansible.module_utils.f5_utils import (
     AnsibleF5Client,
@@ -135,6 +147,7 @@ class ModuleManager(object):
         self.have = None
         self.want = Parameters(self.client.module.params)
         self.changes = Parameters()
+        self.wait_times = dict()
 
     def _set_changed_options(self):
         changed = {}
@@ -157,6 +170,37 @@ class ModuleManager(object):
             return True
         return False
 
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for a newly discovered device to become active
+
+        The delay between checks doubles from interval, up to 30 seconds.
+        The wait is given up after the timeout of the module, or 30 minutes.
+        Activation time is reported in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 1800
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
+
     def exec_module(self):
         changed = False
         result = dict()
@@ -175,6 +219,8 @@ class ModuleManager(object):
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
         return result
 
     def exists(self):
@@ -256,14 +302,17 @@ class ModuleManager(object):
 
     def _wait_for_state_to_activate(self, resource):
         error_values = ['POST_FAILED', 'VALIDATION_FAILED']
-        # Wait no more than half an hour
-        for x in range(1, 180):
+
+        def active():
             resource.refresh()
-            if resource.state == 'ACTIVE':
-                break
-            elif resource.state in error_values:
+            if resource.state in error_values:
                 raise F5ModuleError(resource.errors)
-            time.sleep(10)
+            return resource.state == 'ACTIVE'
+
+        if not self._wait_until('activate', active):
+            raise F5ModuleError(
+                "Timed out waiting for the device to become active"
+            )
 
     def absent(self):
         if self.exists():
@@ -300,6 +349,10 @@ class ArgumentSpec(object):
                 required=False,
                 default='present',
                 choices=['absent', 'present', 'rediscover']
+            ),
+            timeout=dict(
+                type='int',
+                default=1800
             )
         )
         self.required_if = [
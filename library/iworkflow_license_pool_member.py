@@ -47,6 +47,11 @@ options:
     choices:
       - present
       - absent
+  timeout:
+    description:
+      - Number of seconds to wait for a device to be licensed.
+    default: 1800
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the host. This is as easy as pip
     install f5-sdk.
@@ -63,9 +68,16 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for
+        the device to be licensed.
+    returned: changed
+    type: dict
+    sample: {"license": {"seconds": 23.4, "polls": 5, "waits": 1}}
 '''
 
+import random
 import time
 
 from ansible.module_utils.f5_utils import (
@@ -194,6 +206,7 @@ class ModuleManager(object):
         self.want.client = self.client
         self.want.update(self.client.module.params)
         self.changes = Parameters()
+        self.wait_times = dict()
 
     def _load_pool_by_name(self):
         collection = self.client.api.cm.shared.licensing.pools_s.get_collection(
@@ -214,14 +227,48 @@ class ModuleManager(object):
 
     def _wait_for_pool_member_state_to_license(self, member):
         error_values = ['FAILED']
-        # Wait no more than half an hour
-        for x in range(1, 180):
+
+        def licensed():
             member.refresh()
-            if member.state == 'LICENSED':
-                break
-            elif member.state in error_values:
+            if member.state in error_values:
                 raise F5ModuleError(member.errorText)
-            time.sleep(10)
+            return member.state == 'LICENSED'
+
+        if not self._wait_until('license', licensed):
+            raise F5ModuleError(
+                "Timed out waiting for the device to be licensed"
+            )
+
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for the device to be licensed from the pool
+
+        The delay between checks doubles from interval, up to 30 seconds.
+        The wait is given up after the timeout of the module, or 30 minutes.
+        Licensing time is reported in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 1800
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
 
     def exec_module(self):
         changed = False
@@ -239,6 +286,8 @@ class ModuleManager(object):
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
         return result
 
     def exists(self):
@@ -347,6 +396,10 @@ class ArgumentSpec(object):
             state=dict(
                 default='present',
                 choices=['absent', 'present']
+            ),
+            timeout=dict(
+                type='int',
+                default=1800
             )
         )
         self.f5_product_name = 'iworkflow'
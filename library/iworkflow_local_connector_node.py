@@ -44,6 +44,9 @@ options:
   device:
     description:
       - Managed device to create node for.
+      - This can be the hostname, discovered address or management address
+        of the device. Hostnames are matched first, then discovered
+        addresses, then management addresses.
     required: True
   key_content:
     description:
@@ -180,6 +183,70 @@ from ansible.module_utils.f5_utils import (
 )
 
 
+SELF_LINK = re.compile(r'([0-9-a-z]+\-){4}[0-9-a-z]+', re.I)
+
+
+class CollectionIndex(object):
+    """Lookup of the resources in an iWorkflow collection
+
+    The collection is read once and indexed by each of the given
+    attributes. A value that is not found causes the collection to be
+    read again, because the resource may have been added since.
+    """
+    def __init__(self, loader, keys):
+        self.loader = loader
+        self.keys = keys
+        self.indexes = None
+
+    def build(self):
+        self.indexes = dict((key, dict()) for key in self.keys)
+        for resource in self.loader():
+            for key in self.keys:
+                value = getattr(resource, key, None)
+                if value is not None:
+                    self.indexes[key].setdefault(str(value), resource)
+
+    def find(self, value, *keys):
+        """Returns the resource with value in one of keys, or None
+
+        The keys are tried in order over the whole collection, so a match
+        on the first key always wins over a match on a later one.
+        """
+        built = self.indexes is None
+        if built:
+            self.build()
+        resource = self._find(value, keys)
+        if resource is None and not built:
+            self.build()
+            resource = self._find(value, keys)
+        return resource
+
+    def _find(self, value, keys):
+        for key in keys:
+            resource = self.indexes[key].get(str(value))
+            if resource is not None:
+                return resource
+        return None
+
+
+def get_collection_index(client, name, loader, keys):
+    """Returns the index of a collection, creating it if needed
+
+    Indexes are kept on the client, so that every lookup made while the
+    module runs shares a read of the collection.
+    """
+    indexes = getattr(client, 'collection_indexes', None)
+    if indexes is not None and name in indexes:
+        return indexes[name]
+    index = CollectionIndex(loader, keys)
+    if client is not None:
+        if indexes is None:
+            indexes = dict()
+            client.collection_indexes = indexes
+        indexes[name] = index
+    return index
+
+
 class Device(object):
     def __init__(self, *args, **kwargs):
         self.client = kwargs.pop('client', None)
@@ -187,65 +254,67 @@ class Device(object):
 
     def update(self, params=None):
         params = str(params)
-        resource = None
-        collection = self._get_device_collection()
-        if re.search(r'([0-9-a-z]+\-){4}[0-9-a-z]+', params, re.I):
+        index = get_collection_index(
+            self.client, 'devices', self._get_bigip_devices,
+            ['selfLink', 'hostname', 'address', 'managementAddress']
+        )
+        if SELF_LINK.search(params):
             # Handle cases where the REST API sent us self links
-            for device in collection:
-                if str(device.product) != "BIG-IP":
-                    continue
-                if str(device.selfLink) != params:
-                    continue
-                resource = device
-                break
+            resource = index.find(params, 'selfLink')
         else:
-            # Handle the case where a user sends us a list of connector names
-            for device in collection:
-                if str(device.product) != "BIG-IP":
-                    continue
-
-                # The supplied device can be in several formats.
-                if str(device.hostname) == params:
-                    # Hostname
-                    #
-                    # The hostname as was detected by iWorkflow. This is the
-                    # name that iWorkflow displays when you view the Devices
-                    # blade.
-                    #
-                    # Example:
-                    #     sdb-test-bigip-1.localhost.localdoman
-                    resource = device
-                    break
-                elif str(device.address) == params:
-                    # Address
-                    #
-                    # This is the address that iWorkflow discovered the device
-                    # on. This may be the management address, but it could also
-                    # be a Self IP on the BIG-IP. This address is usually
-                    # displayed next to the specific device in the Devices blade
-                    #
-                    # Example:
-                    #     131.225.23.53
-                    resource = device
-                    break
-                elif str(device.managementAddress) == params:
-                    # Management Address
-                    #
-                    # This is the management address of the BIG-IP.
-                    #
-                    # Example:
-                    #     192.168.10.100
-                    resource = device
-                    break
+            # The supplied device can be in several formats.
+            #
+            # Hostname
+            #
+            # The hostname as was detected by iWorkflow. This is the
+            # name that iWorkflow displays when you view the Devices
+            # blade.
+            #
+            # Example:
+            #     sdb-test-bigip-1.localhost.localdoman
+            #
+            # Address
+            #
+            # This is the address that iWorkflow discovered the device
+            # on. This may be the management address, but it could also
+            # be a Self IP on the BIG-IP. This address is usually
+            # displayed next to the specific device in the Devices blade
+            #
+            # Example:
+            #     131.225.23.53
+            #
+            # Management Address
+            #
+            # This is the management address of the BIG-IP.
+            #
+            # Example:
+            #     192.168.10.100
+            #
+            # Every hostname is tried before any address, then before any
+            # management address. A device whose hostname matches is found
+            # even when another device, earlier in the collection, has the
+            # value as its address.
+            resource = index.find(
+                params, 'hostname', 'address', 'managementAddress'
+            )
         if not resource:
             raise F5ModuleError(
                 "Device {0} was not found".format(params)
             )
         self._values['resource'] = resource
 
+    def _get_bigip_devices(self):
+        collection = self._get_device_collection()
+        return [x for x in collection if str(x.product) == "BIG-IP"]
+
     def _get_device_collection(self):
         dg = self.client.api.shared.resolver.device_groups
-        return dg.cm_cloud_managed_devices.devices_s.get_collection()
+        # Without the kind, the SDK returns plain dicts instead of resources
+        return dg.cm_cloud_managed_devices.devices_s.get_collection(
+            requests_params=dict(
+                params='$select=kind,selfLink,product,hostname,address,managementAddress'
+            )
+        )
 
     @property
     def selfLink(self):
@@ -273,26 +342,16 @@ class Connector(object):
 
     def update(self, params=None):
         params = str(params)
-        resource = None
-        collection = self._get_connector_collection()
-        if re.search(r'([0-9-a-z]+\-){4}[0-9-a-z]+', params, re.I):
+        index = get_collection_index(
+            self.client, 'connectors', self._get_bigip_connectors,
+            ['selfLink', 'name']
+        )
+        if SELF_LINK.search(params):
             # Handle cases where the REST API sent us self links
-            for connector in collection:
-                if str(connector.displayName) != "BIG-IP":
-                    continue
-                if str(connector.selfLink) != params:
-                    continue
-                resource = connector
-                break
+            resource = index.find(params, 'selfLink')
         else:
             # Handle the case where a user sends us a list of connector names
-            for connector in collection:
-                if str(connector.displayName) != "BIG-IP":
-                    continue
-                if str(connector.name) != params:
-                    continue
-                resource = connector
-                break
+            resource = index.find(params, 'name')
         if not resource:
             raise F5ModuleError(
                 "Connector {0} was not found".format(params)
@@ -301,8 +360,17 @@ class Connector(object):
         self._values['selfLink'] = resource.selfLink
         self._values['resource'] = resource
 
+    def _get_bigip_connectors(self):
+        collection = self._get_connector_collection()
+        return [x for x in collection if str(x.displayName) == "BIG-IP"]
+
     def _get_connector_collection(self):
-        return self.client.api.cm.cloud.connectors.locals.get_collection()
+        # Without the kind, the SDK returns plain dicts instead of resources
+        return self.client.api.cm.cloud.connectors.locals.get_collection(
+            requests_params=dict(
+                params='$select=kind,name,selfLink,displayName'
+            )
+        )
 
     @property
     def name(self):
@@ -63,6 +63,11 @@ options:
     description:
       - The Service Template that you want to base this L4/L7 Service off of.
         This option is required when C(state) is C(present).
+  timeout:
+    description:
+      - Number of seconds to wait for a service to be placed on its devices.
+    default: 1800
+    version_added: 2.5
 notes:
   - Requires the f5-sdk Python package on the remote host. This is as easy as
     pip install f5-sdk.
@@ -80,14 +85,86 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
-
+wait_times:
+    description:
+      - Time spent, number of checks made and number of waits, waiting for
+        the service to be placed.
+    returned: changed
+    type: dict
+    sample: {"activate": {"seconds": 95.7, "polls": 8, "waits": 1}}
 '''
 
+import re
+import random
 import time
 
 from ansible.module_utils.f5_utils import *
 
 
+SELF_LINK = re.compile(r'([0-9-a-z]+\-){4}[0-9-a-z]+', re.I)
+
+
+class CollectionIndex(object):
+    """Lookup of the resources in an iWorkflow collection
+
+    The collection is read once and indexed by each of the given
+    attributes. A value that is not found causes the collection to be
+    read again, because the resource may have been added since.
+    """
+    def __init__(self, loader, keys):
+        self.loader = loader
+        self.keys = keys
+        self.indexes = None
+
+    def build(self):
+        self.indexes = dict((key, dict()) for key in self.keys)
+        for resource in self.loader():
+            for key in self.keys:
+                value = getattr(resource, key, None)
+                if value is not None:
+                    self.indexes[key].setdefault(str(value), resource)
+
+    def find(self, value, *keys):
+        """Returns the resource with value in one of keys, or None
+
+        The keys are tried in order over the whole collection, so a match
+        on the first key always wins over a match on a later one.
+        """
+        built = self.indexes is None
+        if built:
+            self.build()
+        resource = self._find(value, keys)
+        if resource is None and not built:
+            self.build()
+            resource = self._find(value, keys)
+        return resource
+
+    def _find(self, value, keys):
+        for key in keys:
+            resource = self.indexes[key].get(str(value))
+            if resource is not None:
+                return resource
+        return None
+
+
+def get_collection_index(client, name, loader, keys):
+    """Returns the index of a collection, creating it if needed
+
+    Indexes are kept on the client, so that every lookup made while the
+    module runs shares a read of the collection.
+    """
+    indexes = getattr(client, 'collection_indexes', None)
+    if indexes is not None and name in indexes:
+        return indexes[name]
+    index = CollectionIndex(loader, keys)
+    if client is not None:
+        if indexes is None:
+            indexes = dict()
+            client.collection_indexes = indexes
+        indexes[name] = index
+    return index
+
+
 class Parameters(AnsibleF5Parameters):
     api_map = {
         'properties': 'connector'
@@ -129,17 +206,27 @@ class Parameters(AnsibleF5Parameters):
                     # If the mapped value is not a @property
                     self._values[map_key] = v
 
+    def _get_bigip_connectors(self):
+        collection = self._get_connector_collection()
+        return [x for x in collection if str(x.displayName) == "BIG-IP"]
+
     def _get_connector_collection(self):
-        return self.client.api.cm.cloud.connectors.locals.get_collection()
-
-    def _get_connector_selflink(self, connector, collection):
-        for resource in collection:
-            if str(resource.displayName) != "BIG-IP":
-                continue
-            if str(resource.name) != connector:
-                continue
-            return str(resource.selfLink)
-        return None
+        # Without the kind, the SDK returns plain dicts instead of resources
+        return self.client.api.cm.cloud.connectors.locals.get_collection(
+            requests_params=dict(
+                params='$select=kind,name,selfLink,displayName'
+            )
+        )
+
+    def _get_connector_selflink(self, connector):
+        index = get_collection_index(
+            self.client, 'connectors', self._get_bigip_connectors,
+            ['selfLink', 'name']
+        )
+        resource = index.find(connector, 'name')
+        if resource is None:
+            return None
+        return str(resource.selfLink)
 
     def to_return(self):
         result = {}
@@ -270,9 +357,7 @@ class Parameters(AnsibleF5Parameters):
         if self._values['connector'] is None:
             return None
         elif isinstance(self._values['connector'], basestring):
-            collection = self._get_connector_collection()
-            result = self._get_connector_selflink(str(self._values['connector']), collection)
-            connector = result
+            connector = self._get_connector_selflink(str(self._values['connector']))
         elif 'provider' in self._values['connector'][0]:
             # Case for the REST API
             item = self._values['connector'][0]['provider']
@@ -307,6 +392,7 @@ class ModuleManager(object):
         self.want.client = self.client
         self.want.update(self.client.module.params)
         self.changes = Parameters()
+        self.wait_times = dict()
 
     def _set_changed_options(self):
         changed = {}
@@ -318,6 +404,37 @@ class ModuleManager(object):
             self.changes.client = self.client
             self.changes.update(changed)
 
+    def _wait_until(self, operation, condition, interval=1, timeout=None):
+        """Waits for the service to be placed on its connector
+
+        The delay between checks doubles from interval, up to 30 seconds.
+        The wait is given up after the timeout of the module, or 30 minutes.
+        Placement time is reported in wait_times.
+        """
+        if timeout is None:
+            timeout = self.want.timeout
+        if timeout is None:
+            timeout = 1800
+        start = time.time()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            done = condition()
+            now = time.time()
+            if done or now >= deadline:
+                break
+            delay = min(interval, 30) * random.uniform(0.9, 1.1)
+            time.sleep(min(delay, deadline - now))
+            interval *= 2
+        record = self.wait_times.setdefault(
+            operation, dict(seconds=0, polls=0, waits=0)
+        )
+        record['seconds'] = round(record['seconds'] + time.time() - start, 1)
+        record['polls'] += polls
+        record['waits'] += 1
+        return bool(done)
+
     def exec_module(self):
         changed = False
         result = dict()
@@ -334,6 +451,8 @@ class ModuleManager(object):
         changes = self.changes.to_return()
         result.update(**changes)
         result.update(dict(changed=changed))
+        if self.wait_times:
+            result.update(dict(wait_times=self.wait_times))
         return result
 
     def exists(self):
@@ -368,8 +487,7 @@ class ModuleManager(object):
         self._wait_for_state_to_activate(resource)
 
     def _wait_for_state_to_activate(self, resource):
-        # Wait no more than half an hour
-        for x in range(1, 180):
+        def placed():
             resource.refresh()
             try:
                 stats = resource.stats.load()
@@ -377,14 +495,19 @@ class ModuleManager(object):
                 placement = int(attrs['entries']['health.placement']['value'])
                 description = str(attrs['entries']['health.placement']['description'])
                 if placement == 1:
-                    break
+                    return True
                 elif placement == 0 and 'Failed' in description:
                     raise F5ModuleError(
                         str(resource.error)
                     )
             except KeyError:
                 pass
-            time.sleep(10)
+            return False
+
+        if not self._wait_until('activate', placed):
+            raise F5ModuleError(
+                "Timed out waiting for the service to be placed"
+            )
 
     def absent(self):
         if self.exists():
@@ -420,6 +543,10 @@ class ArgumentSpec(object):
             state=dict(
                 default='present',
                 choices=['absent', 'present']
+            ),
+            timeout=dict(
+                type='int',
+                default=1800
             )
         )
         self.f5_product_name = 'iworkflow'
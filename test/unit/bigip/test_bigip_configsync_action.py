@@ -22,6 +22,7 @@ __metaclass__ = type
 
 import os
 import json
+import pytest
 import sys
 
 from nose.plugins.skip import SkipTest
@@ -33,17 +34,18 @@ from ansible.compat.tests.mock import patch, Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
+from ansible.module_utils.f5_utils import F5ModuleError
 
 try:
-    from library.bigip_configsync_actions import Parameters
-    from library.bigip_configsync_actions import ModuleManager
-    from library.bigip_configsync_actions import ArgumentSpec
+    from library.bigip_configsync_action import Parameters
+    from library.bigip_configsync_action import ModuleManager
+    from library.bigip_configsync_action import ArgumentSpec
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 except ImportError:
     try:
-        from ansible.modules.network.f5.bigip_configsync_actions import Parameters
-        from ansible.modules.network.f5.bigip_configsync_actions import ModuleManager
-        from ansible.modules.network.f5.bigip_configsync_actions import ArgumentSpec
+        from ansible.modules.network.f5.bigip_configsync_action import Parameters
+        from ansible.modules.network.f5.bigip_configsync_action import ModuleManager
+        from ansible.modules.network.f5.bigip_configsync_action import ArgumentSpec
         from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
     except ImportError:
         raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
@@ -140,3 +142,71 @@ class TestManager(unittest.TestCase):
         results = mm.exec_module()
 
         assert results['changed'] is True
+
+    @patch('library.bigip_configsync_action.time.sleep')
+    def test_sync_wait_times(self, sleep, *args):
+        set_module_args(dict(
+            sync_device_to_group='yes',
+            device_group="foo",
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+
+        # Override methods to force specific logic in the module to happen
+        mm._device_group_exists = Mock(return_value=True)
+        mm._sync_to_group_required = Mock(return_value=False)
+        mm.execute_on_device = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=None)
+
+        mm._get_status_from_resource = Mock()
+        mm._get_status_from_resource.side_effect = [
+            'Changes Pending', 'Not All Devices Synced',
+            'Not All Devices Synced', 'In Sync'
+        ]
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['wait_times']['sync']['polls'] == 3
+        delays = [x[0][0] for x in sleep.call_args_list]
+        assert len(delays) == 2
+        assert delays[0] < delays[1]
+
+    @patch('library.bigip_configsync_action.time.sleep')
+    def test_sync_timeout(self, sleep, *args):
+        set_module_args(dict(
+            sync_device_to_group='yes',
+            device_group="foo",
+            timeout=0,
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+
+        # Override methods to force specific logic in the module to happen
+        mm._device_group_exists = Mock(return_value=True)
+        mm._sync_to_group_required = Mock(return_value=False)
+        mm.execute_on_device = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=None)
+        mm._get_status_from_resource = Mock(
+            return_value='Not All Devices Synced'
+        )
+
+        with pytest.raises(F5ModuleError) as err:
+            mm.exec_module()
+        assert 'Timed out' in str(err.value)
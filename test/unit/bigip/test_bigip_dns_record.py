@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 F5 Networks Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import json
+import pytest
+import sys
+
+from nose.plugins.skip import SkipTest
+if sys.version_info < (2, 7):
+    raise SkipTest("F5 Ansible modules require Python >= 2.7")
+
+from ansible.compat.tests import unittest
+from ansible.compat.tests.mock import patch, Mock
+
+try:
+    from library.bigip_dns_record import ZoneImporter
+    from library.bigip_dns_record import ResourceRecordException
+    from library.bigip_dns_record import read_zone
+except ImportError:
+    try:
+        from ansible.modules.network.f5.bigip_dns_record import ZoneImporter
+        from ansible.modules.network.f5.bigip_dns_record import ResourceRecordException
+        from ansible.modules.network.f5.bigip_dns_record import read_zone
+    except ImportError:
+        raise SkipTest("F5 Ansible modules require the bigsuds Python library")
+
+fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def get_params(**kwargs):
+    params = dict(
+        server='localhost',
+        user='admin',
+        password='password',
+        validate_certs=False,
+        server_port=443,
+        state='present',
+        check_mode=False,
+        zone='organization.com',
+        view='external',
+        ttl=60,
+        zone_file=None,
+        records=None,
+        batch_size=500
+    )
+    params.update(kwargs)
+    return params
+
+
+class TestReadZone(unittest.TestCase):
+    def test_read_zone_file(self):
+        with open(os.path.join(fixture_path, 'organization.com.zone')) as fh:
+            records = list(read_zone(fh, 'example.com.'))
+
+        assert [x[0] for x in records] == [
+            'SOA', 'NS', 'MX', 'A', 'A', 'AAAA', 'CNAME', 'SRV', 'TXT'
+        ]
+        soa = records[0][1]
+        assert soa['domain_name'] == 'organization.com.'
+        assert soa['primary'] == 'ns1.organization.com.'
+        assert soa['refresh'] == 10800
+        assert soa['expire'] == 604800
+        assert soa['neg_ttl'] == 300
+        assert soa['ttl'] == 3600
+        assert records[4][1] == dict(
+            domain_name='elliot.organization.com.', ip_address='10.1.1.1', ttl=300
+        )
+        assert records[5][1]['domain_name'] == 'elliot.organization.com.'
+        assert records[6][1]['cname'] == 'elliot.organization.com.'
+        assert records[7][1]['port'] == 5060
+        assert records[8][1]['text'] == '"v=spf1 mx -all"'
+
+    def test_read_records_from_device(self):
+        lines = [
+            'organization.com.\t3600\tIN\tNS\tns1.organization.com.',
+            '1.1.1.10.in-addr.arpa. 60 IN PTR elliot.organization.com.',
+        ]
+        records = list(read_zone(lines, 'organization.com.'))
+        assert records[0] == ('NS', dict(
+            domain_name='organization.com.', host_name='ns1.organization.com.', ttl=3600
+        ))
+        assert records[1][1]['ip_address'] == '10.1.1.1'
+
+    def test_unsupported_record(self):
+        with pytest.raises(ResourceRecordException) as ex:
+            list(read_zone(['foo 60 IN LOC 1 2 3'], 'organization.com.'))
+        assert 'LOC' in str(ex)
+
+    def test_skip_unsupported_record(self):
+        lines = ['foo 60 IN LOC 1 2 3', 'bar 60 IN A 10.1.1.1']
+        records = list(read_zone(lines, 'organization.com.', skip_unsupported=True))
+        assert [x[0] for x in records] == ['A']
+
+
+@patch('library.bigip_dns_record.bigip_api')
+class TestZoneImporter(unittest.TestCase):
+    def device_records(self):
+        return [[
+            'organization.com.  3600 IN SOA ns1.organization.com. hostmaster.organization.com. '
+            '2017100100 10800 900 604800 300',
+            'organization.com.  3600 IN NS ns1.organization.com.',
+            'ns1.organization.com.  3600 IN A 10.1.1.2',
+            'old.organization.com.  3600 IN A 10.1.1.9',
+            'organization.com.  3600 IN SPF "v=spf1 mx -all"',
+        ]]
+
+    def test_import_zone_file(self, bigip_api):
+        client = bigip_api.return_value
+        client.Management.ResourceRecord.get_rrs.return_value = self.device_records()
+        params = get_params(
+            zone_file=os.path.join(fixture_path, 'organization.com.zone'),
+            batch_size=1
+        )
+
+        importer = ZoneImporter(**params)
+        results = importer.flush()
+
+        assert results['changed'] is True
+        assert results['unchanged'] == 2
+        assert results['created'] == 6
+        assert results['updated'] == 1
+        assert results['deleted'] == 1
+        api = client.Management.ResourceRecord
+        assert api.get_rrs.call_count == 1
+        assert api.update_soa.call_count == 1
+        assert api.delete_a.call_args[1]['a_records'] == [[dict(
+            domain_name='old.organization.com.', ip_address='10.1.1.9', ttl=3600
+        )]]
+        assert api.add_a.call_args[1]['sync_ptrs'] == [0]
+        assert api.add_mx.call_count == 1
+        assert api.add_txt.call_count == 1
+
+    def test_add_records_in_batches(self, bigip_api):
+        client = bigip_api.return_value
+        client.Management.ResourceRecord.get_rrs.return_value = self.device_records()
+        records = ['host%s IN A 10.2.0.%s' % (x, x) for x in range(5)]
+        records.append('ns1 3600 IN A 10.1.1.2')
+        params = get_params(records=records, batch_size=2)
+
+        importer = ZoneImporter(**params)
+        results = importer.flush()
+
+        assert results['created'] == 5
+        assert results['deleted'] == 0
+        assert results['unchanged'] == 1
+        api = client.Management.ResourceRecord
+        assert [len(x[1]['a_records'][0]) for x in api.add_a.call_args_list] == [2, 2, 1]
+        assert api.add_a.call_args[1]['a_records'][0][0]['ttl'] == 60
+        assert api.delete_a.call_count == 0
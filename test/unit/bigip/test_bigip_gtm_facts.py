@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 F5 Networks Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import pytest
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from nose.plugins.skip import SkipTest
+if sys.version_info < (2, 7):
+    raise SkipTest("F5 Ansible modules require Python >= 2.7")
+
+from ansible.compat.tests import unittest
+from ansible.compat.tests.mock import patch, Mock
+from ansible.module_utils.f5_utils import F5ModuleError
+from requests.exceptions import ConnectionError
+
+try:
+    from library.bigip_gtm_facts import BigIpGtmFactsManager
+    from library.bigip_gtm_facts import BigIpGtmFactsFleetManager
+    from library.bigip_gtm_facts import BigIpGtmFactsPools
+    from library.bigip_gtm_facts import map_concurrently
+    from library.bigip_gtm_facts import parse_filter
+    from library.bigip_gtm_facts import FactCache
+except ImportError:
+    try:
+        from ansible.modules.network.f5.bigip_gtm_facts import BigIpGtmFactsManager
+        from ansible.modules.network.f5.bigip_gtm_facts import BigIpGtmFactsFleetManager
+        from ansible.modules.network.f5.bigip_gtm_facts import BigIpGtmFactsPools
+        from ansible.modules.network.f5.bigip_gtm_facts import map_concurrently
+        from ansible.modules.network.f5.bigip_gtm_facts import parse_filter
+        from ansible.modules.network.f5.bigip_gtm_facts import FactCache
+    except ImportError:
+        raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
+
+
+class TestMapConcurrently(unittest.TestCase):
+    def test_results_keep_order(self):
+        result = map_concurrently(lambda x: x * 2, [3, 1, 2], 3)
+        assert result == [6, 2, 4]
+
+    def test_serial(self):
+        result = map_concurrently(lambda x: x * 2, [3, 1, 2], 1)
+        assert result == [6, 2, 4]
+
+    def test_no_items(self):
+        assert map_concurrently(lambda x: x, [], 4) == []
+
+
+class TestParseFilter(unittest.TestCase):
+    def test_no_filter(self):
+        assert parse_filter(None) == (None, None)
+
+    def test_name_only(self):
+        partition, regex = parse_filter('web-.*')
+        assert partition is None
+        assert regex.match('web-pool')
+        assert not regex.match('app-pool')
+
+    def test_partition_and_name(self):
+        partition, regex = parse_filter('/Common/web-.*')
+        assert partition == 'Common'
+        assert regex.match('web-pool')
+
+    def test_partition_only(self):
+        assert parse_filter('/Common/') == ('Common', None)
+        assert parse_filter('/Common/.*') == ('Common', None)
+
+
+class TestFactCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_round_trip(self):
+        cache = FactCache(self.cache_dir, 'lb.example.com', 443)
+        cache.load()
+        cache.set('/mgmt/tm/gtm/server|', [2, 10], [dict(name='foo')])
+        cache.save()
+
+        cache = FactCache(self.cache_dir, 'lb.example.com', 443)
+        cache.load()
+        assert cache.get('/mgmt/tm/gtm/server|', [2, 10]) == [dict(name='foo')]
+        assert cache.get('/mgmt/tm/gtm/server|', [2, 11]) is None
+        assert cache.get('/mgmt/tm/gtm/pool|', [2, 10]) is None
+
+    def test_cached_collection_is_not_read(self):
+        cache = FactCache(self.cache_dir, 'lb.example.com', 443)
+        cache.set('/mgmt/tm/gtm/server|', [1, 5], [dict(name='foo')])
+
+        servers = BigIpGtmFactsPools(concurrency=1)
+        servers.cache = cache
+        servers.get_collection_fingerprint = Mock(return_value=[1, 5])
+        servers.iterate_collection = Mock()
+        collection = Mock()
+        collection._meta_data = dict(uri='/mgmt/tm/gtm/server')
+
+        result = servers.get_facts_from_collection(collection)
+
+        assert result == [dict(name='foo')]
+        assert servers.iterate_collection.call_count == 0
+
+
+class TestFactsPools(unittest.TestCase):
+    def test_get_facts_with_types_deterministic(self):
+        pools = BigIpGtmFactsPools(concurrency=4)
+        pools.get_all_facts_by_type = Mock(
+            side_effect=lambda key, type: [] if key == 'mxs' else [type]
+        )
+
+        result = pools.get_facts_with_types()
+
+        assert result == [['a'], ['aaaa'], ['cname'], ['naptr'], ['srv']]
+
+    def test_iterate_collection_pages(self):
+        pools = BigIpGtmFactsPools(concurrency=1)
+        pools.page_size = 2
+        collection = Mock()
+        collection.get_collection = Mock(side_effect=[[1, 2], [3, 4], [5]])
+
+        result = list(pools.iterate_collection(collection))
+
+        assert result == [1, 2, 3, 4, 5]
+        assert collection.get_collection.call_count == 3
+        params = collection.get_collection.call_args[1]['requests_params']['params']
+        assert params == 'expandSubcollections=true&$top=2&$skip=4'
+
+    def test_iterate_collection_partition_filter(self):
+        pools = BigIpGtmFactsPools(concurrency=1, filter='/Common/web-.*')
+        collection = Mock()
+        collection.get_collection = Mock(return_value=[])
+
+        result = list(pools.iterate_collection(collection))
+
+        assert result == []
+        params = collection.get_collection.call_args[1]['requests_params']['params']
+        assert params.endswith("&$filter=partition+eq+'Common'")
+        assert pools.filter_matches_name('web-pool') is True
+        assert pools.filter_matches_name('app-pool') is False
+
+    def test_fingerprint_includes_members(self):
+        pools = BigIpGtmFactsPools(concurrency=1)
+        session = Mock()
+        pools.api = Mock(_meta_data=dict(icr_session=session))
+        pool = dict(
+            generation=10,
+            membersReference=dict(items=[dict(generation=5), dict(generation=12)])
+        )
+        session.get.return_value.json.return_value = dict(items=[pool])
+        collection = Mock()
+        collection._meta_data = dict(uri='/mgmt/tm/gtm/pool/a')
+
+        before = pools.get_collection_fingerprint(collection)
+        pool['membersReference']['items'][0]['generation'] = 14
+        after = pools.get_collection_fingerprint(collection)
+
+        assert before == [1, 10, 2, 12]
+        assert after == [1, 10, 2, 14]
+        params = session.get.call_args[1]['params']
+        assert params == 'expandSubcollections=true&$select=generation,membersReference&$top=1000&$skip=0'
+
+
+class TestManager(unittest.TestCase):
+    @patch('library.bigip_gtm_facts.ManagementRoot')
+    def test_includes_share_connection(self, mgmt_root):
+        mm = BigIpGtmFactsManager(
+            server='localhost',
+            user='admin',
+            password='password',
+            server_port=443,
+            include=['virtual_server', 'pool', 'wide_ip'],
+            concurrency=3
+        )
+        apis = []
+
+        def collect(name):
+            def get_facts(collector):
+                apis.append(collector.api)
+                return [name]
+            return get_facts
+
+        with patch.object(BigIpGtmFactsPools, 'get_facts', collect('pool')):
+            with patch('library.bigip_gtm_facts.BigIpGtmFactsWideIps.get_facts', collect('wide_ip')):
+                with patch('library.bigip_gtm_facts.BigIpGtmFactsVirtualServers.get_facts', collect('virtual_server')):
+                    results = mm.get_facts()
+
+        assert mgmt_root.call_count == 1
+        assert len(apis) == 3
+        assert all(x is mgmt_root.return_value for x in apis)
+        assert results['pool'] == ['pool']
+        assert results['wide_ip'] == ['wide_ip']
+        assert results['virtual_server'] == ['virtual_server']
+
+    @patch('library.bigip_gtm_facts.ManagementRoot')
+    def test_concurrency_bounds_all_categories(self, mgmt_root):
+        mgmt_root.return_value.tmos_version = '13.0.0'
+        mm = BigIpGtmFactsManager(
+            server='localhost',
+            user='admin',
+            password='password',
+            server_port=443,
+            include=['pool', 'wide_ip', 'virtual_server'],
+            concurrency=2
+        )
+        lock = threading.Lock()
+        calls = dict(active=0, most=0, total=0)
+
+        def read(collector, collection, collection_type=None):
+            with lock:
+                calls['active'] += 1
+                calls['total'] += 1
+                calls['most'] = max(calls['most'], calls['active'])
+            time.sleep(0.01)
+            with lock:
+                calls['active'] -= 1
+            return []
+
+        with patch('library.bigip_gtm_facts.BigIpGtmFactsCommon.read_facts_from_collection', read):
+            mm.get_facts()
+
+        assert calls['total'] == 13
+        assert calls['most'] <= 2
+
+
+class TestFleetManager(unittest.TestCase):
+    def setUp(self):
+        self.dest_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dest_dir)
+
+    def get_manager(self, **kwargs):
+        params = dict(
+            server='localhost',
+            user='admin',
+            password='password',
+            server_port=443,
+            include=['pool'],
+            concurrency=1,
+            targets=['10.0.0.1', dict(server='10.0.0.2', server_port=8443)],
+            max_concurrent_targets=2
+        )
+        params.update(kwargs)
+        return BigIpGtmFactsFleetManager(**params)
+
+    @patch('library.bigip_gtm_facts.ManagementRoot')
+    def test_one_connection_per_target(self, mgmt_root):
+        mm = self.get_manager()
+
+        with patch.object(BigIpGtmFactsPools, 'get_facts', lambda x: [x.params['server']]):
+            results = mm.get_facts()
+
+        assert mgmt_root.call_count == 2
+        calls = sorted((x[0][0], x[1]['port']) for x in mgmt_root.call_args_list)
+        assert calls == [('10.0.0.1', 443), ('10.0.0.2', 8443)]
+        assert [x['server'] for x in results['targets']] == ['10.0.0.1', '10.0.0.2']
+        assert results['targets'][0]['pool'] == ['10.0.0.1']
+        assert results['targets'][1]['server_port'] == 8443
+
+    @patch('library.bigip_gtm_facts.ManagementRoot')
+    def test_write_json_lines(self, mgmt_root):
+        dest = os.path.join(self.dest_dir, 'facts.jsonl')
+        mm = self.get_manager(dest=dest)
+
+        with patch.object(BigIpGtmFactsPools, 'get_facts', lambda x: [x.params['server']]):
+            results = mm.get_facts()
+
+        with open(dest) as fh:
+            lines = [json.loads(x) for x in fh]
+        lines.sort(key=lambda x: x['server'])
+        assert lines[0] == dict(server='10.0.0.1', server_port=443, pool=['10.0.0.1'])
+        assert lines[1] == dict(server='10.0.0.2', server_port=8443, pool=['10.0.0.2'])
+        assert 'pool' not in results['targets'][0]
+        assert 'seconds' in results['targets'][0]
+
+    @patch('library.bigip_gtm_facts.ManagementRoot')
+    def test_failed_target(self, mgmt_root):
+        dest = os.path.join(self.dest_dir, 'facts.jsonl')
+        mm = self.get_manager(dest=dest)
+
+        def get_facts(collector):
+            if collector.params['server'] == '10.0.0.2':
+                raise ConnectionError('Connection refused')
+            return []
+
+        with patch.object(BigIpGtmFactsPools, 'get_facts', get_facts):
+            results = mm.get_facts()
+
+        assert results['failed_targets'] == 1
+        assert 'failed' not in results['targets'][0]
+        assert results['targets'][1]['failed'] is True
+        assert results['targets'][1]['msg'] == 'Connection refused'
+        with open(dest) as fh:
+            lines = [json.loads(x) for x in fh]
+        assert len(lines) == 2
+        failed = [x for x in lines if x.get('failed')]
+        assert failed[0]['msg'] == 'Connection refused'
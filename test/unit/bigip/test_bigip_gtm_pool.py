@@ -22,7 +22,9 @@ __metaclass__ = type
 
 import os
 import json
+import shutil
 import sys
+import tempfile
 
 from nose.plugins.skip import SkipTest
 if sys.version_info < (2, 7):
@@ -326,3 +328,66 @@ class TestTypedManager(unittest.TestCase):
         results = mm.exec_module()
 
         assert results['changed'] is True
+
+
+@patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
+       return_value=True)
+class TestCapabilityCache(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def get_manager(self, version='12.1.0'):
+        set_module_args(dict(
+            name='foo',
+            cache_dir=self.cache_dir,
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        client.api.tmos_version = version
+        client.api.tm.sys.provision.get_collection.return_value = [
+            dict(name='gtm', level='nominal'),
+            dict(name='ltm', level='nominal'),
+            dict(name='asm', level='none')
+        ]
+        return ModuleManager(client)
+
+    def test_provisioning_is_read_once(self, *args):
+        mm = self.get_manager()
+        assert mm.gtm_provisioned() is True
+
+        mm = self.get_manager()
+        assert mm.gtm_provisioned() is True
+        assert mm.client.api.tm.sys.provision.get_collection.call_count == 0
+
+    def test_provisioning_is_read_again(self, *args):
+        self.get_manager().gtm_provisioned()
+
+        # An upgraded device
+        mm = self.get_manager(version='13.0.0')
+        mm.gtm_provisioned()
+        assert mm.client.api.tm.sys.provision.get_collection.call_count == 1
+
+        # A device whose provisioning was changed
+        os.remove(mm.cache.path)
+        mm = self.get_manager(version='13.0.0')
+        mm.gtm_provisioned()
+        assert mm.client.api.tm.sys.provision.get_collection.call_count == 1
+
+        # An expired record
+        mm = self.get_manager(version='13.0.0')
+        mm.cache.ttl = -1
+        mm.gtm_provisioned()
+        assert mm.client.api.tm.sys.provision.get_collection.call_count == 1
@@ -201,6 +201,16 @@ class TestParameters(unittest.TestCase):
         assert p.tables[0]['rows'][0]['row'] == ['12.12.12.12', '80', '0']
         assert p.tables[0]['rows'][1]['row'] == ['13.13.13.13', '443', '10']
 
+    def test_normalized_tables_are_reused(self):
+        p = Parameters(dict(
+            tables=[dict(name='pool__members', columnNames=['addr'], rows=[dict(row=['10.1.1.1'])])]
+        ))
+        assert p.tables is p.tables
+        assert p.digests('tables') is p.digests('tables')
+
+        p.tables = [dict(name='pool__members', columnNames=['addr'], rows=[dict(row=['10.1.1.2'])])]
+        assert p.tables[0]['rows'] == [dict(row=['10.1.1.2'])]
+
     def test_api_parameters_device_group(self):
         args = dict(
             deviceGroup='none'
@@ -318,3 +328,50 @@ class TestManager(unittest.TestCase):
 
         results = mm.exec_module()
         assert results['changed'] is True
+
+    def test_update_sends_changed_sections_only(self, *args):
+        parameters = load_fixture('update_iapp_service_parameters_f5_http.json')
+        set_module_args(dict(
+            name='foo',
+            template='f5.http',
+            parameters=parameters,
+            state='present',
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        # Configure the parameters that would be returned by querying the
+        # remote device
+        parameters = load_fixture('create_iapp_service_parameters_f5_http.json')
+        current = Parameters(parameters)
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        resource = client.api.tm.sys.application.services.service.load.return_value
+        mm = ModuleManager(client)
+
+        # Override methods to force specific logic in the module to happen
+        mm.exists = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=current)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['parameters_diff'] == dict(
+            tables=dict(
+                pool__members=dict(
+                    added=[['20.1.1.1', '0']],
+                    removed=[['10.1.1.1', '0']]
+                )
+            )
+        )
+        params = resource.modify.call_args[1]
+        assert params['execute-action'] == 'definition'
+        assert 'tables' in params
+        assert 'variables' not in params
+        assert 'lists' not in params
@@ -33,6 +33,7 @@ from ansible.compat.tests.mock import patch, mock_open, Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
+from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 from ansible.module_utils.six import PY3
 
 try:
@@ -248,7 +249,68 @@ class TestManager(unittest.TestCase):
         assert results['content'] == 'this is my content'
         assert results['module'] == 'gtm'
         assert results['src'] == '/path/to/irules/foo.tcl'
-        assert len(results.keys()) == 4
+        assert len(results.keys()) == 5
+
+    def get_client(self, **kwargs):
+        args = dict(
+            name='foo',
+            module='gtm',
+            content='this is my content',
+            partition='Common',
+            server='localhost',
+            password='password',
+            user='admin'
+        )
+        args.update(kwargs)
+        set_module_args(args)
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name,
+            mutually_exclusive=self.spec.mutually_exclusive,
+        )
+        client.api = Mock()
+        return client
+
+    def test_update_irule_idempotent_in_one_request(self, *args):
+        client = self.get_client()
+        resource = Mock(attrs=dict(name='foo', apiAnonymous='this is my content'))
+        client.api.tm.gtm.rules.rule.load.return_value = resource
+
+        mm = ModuleManager(client)
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert results['requests'] == 1
+        assert client.api.tm.gtm.rules.rule.load.call_count == 1
+        assert client.api.tm.gtm.rules.rule.exists.call_count == 0
+        assert resource.update.call_count == 0
+
+    def test_update_irule_reuses_loaded_resource(self, *args):
+        client = self.get_client(content='new content')
+        resource = Mock(attrs=dict(name='foo', apiAnonymous='this is my content'))
+        client.api.tm.gtm.rules.rule.load.return_value = resource
+
+        mm = ModuleManager(client)
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['requests'] == 2
+        assert client.api.tm.gtm.rules.rule.load.call_count == 1
+        resource.update.assert_called_once_with(apiAnonymous='new content')
+
+    def test_create_missing_irule(self, *args):
+        client = self.get_client()
+        missing = iControlUnexpectedHTTPError(response=Mock(status_code=404))
+        client.api.tm.gtm.rules.rule.load.side_effect = [missing, Mock()]
+
+        mm = ModuleManager(client)
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        # Checking for the iRule, creating it and checking that it exists
+        assert results['requests'] == 3
+        assert client.api.tm.gtm.rules.rule.create.call_count == 1
 
     def test_module_mutual_exclusion(self, *args):
         set_module_args(dict(
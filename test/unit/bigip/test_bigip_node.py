@@ -30,7 +30,7 @@ if sys.version_info < (2, 7):
     raise SkipTest("F5 Ansible modules require Python >= 2.7")
 
 from ansible.compat.tests import unittest
-from ansible.compat.tests.mock import patch, Mock
+from ansible.compat.tests.mock import patch, Mock, MagicMock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
@@ -39,12 +39,14 @@ from ansible.module_utils.f5_utils import F5ModuleError
 try:
     from library.bigip_node import Parameters
     from library.bigip_node import ModuleManager
+    from library.bigip_node import BulkManager
     from library.bigip_node import ArgumentSpec
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 except ImportError:
     try:
         from ansible.modules.network.f5.bigip_node import Parameters
         from ansible.modules.network.f5.bigip_node import ModuleManager
+        from ansible.modules.network.f5.bigip_node import BulkManager
         from ansible.modules.network.f5.bigip_node import ArgumentSpec
         from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
     except ImportError:
@@ -108,3 +110,112 @@ class TestParameters(unittest.TestCase):
 class TestManager(unittest.TestCase):
     def test_create(self, *args):
         raise Exception('You must write a creation test')
+
+
+def node(name, **kwargs):
+    attrs = dict(
+        kind='tm:ltm:node:nodestate',
+        name=name,
+        partition='Common',
+        session='user-enabled',
+        state='unchecked'
+    )
+    attrs.update(kwargs)
+    resource = Mock(attrs=attrs, state=attrs['state'])
+    resource.name = name
+    return resource
+
+
+@patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
+       return_value=True)
+class TestBulkManager(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+
+    def get_client(self, **kwargs):
+        args = dict(
+            nodes=[
+                dict(name='web1', address='10.1.1.1'),
+                dict(name='web2', address='10.1.1.2', description='new'),
+                dict(name='web3', address='10.1.1.3'),
+                dict(name='web4', fqdn='web4.example.com'),
+                dict(name='web5', state='absent'),
+                dict(name='web6', state='absent'),
+            ],
+            transaction_size=2,
+            password='password',
+            server='localhost',
+            user='admin'
+        )
+        args.update(kwargs)
+        set_module_args(args)
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            mutually_exclusive=self.spec.mutually_exclusive,
+            required_one_of=self.spec.required_one_of,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        return client
+
+    def test_apply_plan_in_transactions(self, *args):
+        client = self.get_client()
+        current = [
+            node('web1', address='10.1.1.1'),
+            node('web2', address='10.1.1.2'),
+            node('web5', address='10.1.1.5'),
+        ]
+        # Only the name and state are selected for the FQDN checks, so the
+        # SDK returns plain dicts rather than nodes.
+        checking = [dict(name='web4', state='fqdn-checking')]
+        checked = [dict(name='web4', state='fqdn-up')]
+        client.api.tm.ltm.nodes.get_collection.side_effect = [
+            current, checking, checked
+        ]
+
+        with patch('library.bigip_node.TransactionContextManager') as tx:
+            tx.return_value.__enter__.return_value = client.api
+            mm = BulkManager(client)
+            results = mm.exec_module()
+
+        assert results['changed'] is True
+        report = dict((x['name'], x['status']) for x in results['nodes'])
+        assert report == dict(
+            web1='unchanged', web2='updated', web3='created',
+            web4='created', web5='removed', web6='absent'
+        )
+
+        # One read for the plan and two for the FQDN checks
+        assert client.api.tm.ltm.nodes.get_collection.call_count == 3
+        params = client.api.tm.ltm.nodes.get_collection.call_args_list[0][1]
+        assert params['requests_params']['params'] == "$filter=partition+eq+'Common'"
+        params = client.api.tm.ltm.nodes.get_collection.call_args_list[1][1]
+        assert params['requests_params']['params'] == "$select=name,state&$filter=partition+eq+'Common'"
+
+        # A removal, two creations and an update, with two nodes per transaction
+        assert tx.call_count == 3
+        assert current[2].delete.call_count == 1
+        assert current[0].modify.call_count == 0
+        current[1].modify.assert_called_once_with(description='new')
+        creates = client.api.tm.ltm.nodes.node.create.call_args_list
+        assert [x[1]['name'] for x in creates] == ['web3', 'web4']
+        assert creates[1][1]['address'] == 'any6'
+        assert creates[1][1]['fqdn']['tmName'] == 'web4.example.com'
+        assert results['wait_times']['fqdn_checks']['polls'] == 2
+
+    def test_check_mode_changes_nothing(self, *args):
+        client = self.get_client(_ansible_check_mode=True)
+        client.api.tm.ltm.nodes.get_collection.return_value = [
+            node('web5', address='10.1.1.5'),
+        ]
+
+        with patch('library.bigip_node.TransactionContextManager') as tx:
+            mm = BulkManager(client)
+            results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert tx.call_count == 0
+        assert client.api.tm.ltm.nodes.node.create.call_count == 0
+        assert 'wait_times' not in results
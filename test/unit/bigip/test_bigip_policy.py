@@ -37,16 +37,18 @@ from ansible.module_utils.f5_utils import AnsibleF5Client
 try:
     from library.bigip_policy import Parameters
     from library.bigip_policy import ModuleManager
-    from library.bigip_policy import SimpleTrafficPolicyManager
-    from library.bigip_policy import ComplexTrafficPolicyManager
+    from library.bigip_policy import SimpleManager
+    from library.bigip_policy import ComplexManager
     from library.bigip_policy import ArgumentSpec
+    from library.bigip_policy import plan_ordinals
 except ImportError:
     try:
         from ansible.modules.network.f5.bigip_policy import Parameters
         from ansible.modules.network.f5.bigip_policy import ModuleManager
-        from ansible.modules.network.f5.bigip_policy import SimpleTrafficPolicyManager
-        from ansible.modules.network.f5.bigip_policy import ComplexTrafficPolicyManager
+        from ansible.modules.network.f5.bigip_policy import SimpleManager
+        from ansible.modules.network.f5.bigip_policy import ComplexManager
         from ansible.modules.network.f5.bigip_policy import ArgumentSpec
+        from ansible.modules.network.f5.bigip_policy import plan_ordinals
     except ImportError:
         raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
 
@@ -147,6 +149,26 @@ class TestParameters(unittest.TestCase):
         assert p.description == 'asdf asdf asdf'
         assert p.strategy == '/Common/asdf'
 
+    def test_plan_ordinals(self):
+        current = dict(rule1=0, rule2=1, rule3=2, rule4=3)
+
+        # Nothing to change
+        ordinals = plan_ordinals(['rule1', 'rule2', 'rule3', 'rule4'], current)
+        assert ordinals == current
+
+        # Moving the last rule to the front has no room, so all are renumbered
+        ordinals = plan_ordinals(['rule4', 'rule1', 'rule2', 'rule3'], current)
+        assert ordinals == dict(rule4=0, rule1=1, rule2=2, rule3=3)
+
+        # Moving a rule to the end only changes that rule
+        ordinals = plan_ordinals(['rule2', 'rule3', 'rule4', 'rule1'], current)
+        assert ordinals == dict(rule2=1, rule3=2, rule4=3, rule1=4)
+
+        # New and moved rules fill the gaps between existing rules
+        current = dict(rule1=0, rule2=10, rule3=20)
+        ordinals = plan_ordinals(['rule1', 'new', 'rule3', 'rule2'], current)
+        assert ordinals == dict(rule1=0, new=1, rule3=2, rule2=10)
+
 
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
@@ -172,7 +194,7 @@ class TestSimpleTrafficPolicyManager(unittest.TestCase):
         )
 
         # Override methods in the specific type of manager
-        tm = SimpleTrafficPolicyManager(client)
+        tm = SimpleManager(client)
         tm.exists = Mock(return_value=False)
         tm.create_on_device = Mock(return_value=True)
 
@@ -184,3 +206,57 @@ class TestSimpleTrafficPolicyManager(unittest.TestCase):
         results = mm.exec_module()
 
         assert results['changed'] is True
+
+
+@patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
+       return_value=True)
+class TestComplexTrafficPolicyManager(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+
+    def rule(self, name, ordinal):
+        result = Mock(ordinal=ordinal)
+        result.name = name
+        return result
+
+    def test_reorder_rules_of_draft(self, *args):
+        set_module_args(dict(
+            name="Policy-Foo",
+            state='draft',
+            rules=['rule1', 'rule3', 'rule2', 'rule4'],
+            password='password',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        client.api.tm.ltm.policys.policy.exists.return_value = True
+        rules = [
+            self.rule('rule1', 0),
+            self.rule('rule2', 10),
+            self.rule('rule3', 20)
+        ]
+        policy = Mock(attrs=dict(strategy='/Common/first-match'))
+        policy.rules_s.get_collection.return_value = rules
+        client.api.tm.ltm.policys.policy.load.return_value = policy
+
+        tm = ComplexManager(client)
+        with patch('library.bigip_policy.TransactionContextManager'):
+            results = tm.exec_module()
+
+        assert results['changed'] is True
+        assert client.api.tm.ltm.policys.policy.exists.call_count == 1
+        assert client.api.tm.ltm.policys.policy.load.call_count == 1
+        assert policy.rules_s.get_collection.call_count == 1
+        assert rules[0].modify.called is False
+        assert rules[1].modify.called is False
+        rules[2].modify.assert_called_once_with(ordinal=1)
+        policy.rules_s.rules.create.assert_called_once_with(
+            name='rule4', ordinal=11
+        )
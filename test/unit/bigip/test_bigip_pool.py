@@ -643,3 +643,152 @@ class TestManager(unittest.TestCase):
         assert results['monitors'] == ['/Testing/tcp', '/Testing/http']
         assert results['monitor_type'] == 'm_of_n'
         assert results['monitor'] == 'min 1 of { /Testing/tcp /Testing/http }'
+
+    def test_update_pool_reconcile_members(self, *args):
+        set_module_args(dict(
+            name='test_pool',
+            partition='Common',
+            members=[
+                dict(address='2.2.2.2', port=80),
+                dict(address='3.3.3.3', port=443, ratio=2)
+            ],
+            server='localhost',
+            password='password',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+
+        current = (
+            Parameters(
+                load_fixture('load_ltm_pool.json')
+            ),
+            self.loaded_members,
+            {},
+        )
+
+        mm.update_on_device = Mock(return_value=True)
+        mm.exists = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=current)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['members_added'] == ['2.2.2.2:80', '3.3.3.3:443']
+        assert results['members_removed'] == ['1.1.1.1:80']
+        assert mm.member_plan['members'][1]['ratio'] == 2
+        assert mm.update_on_device.call_count == 1
+
+    def test_read_pool_and_members_in_one_request(self, *args):
+        set_module_args(dict(
+            name='test_pool',
+            partition='Common',
+            members=[
+                dict(address='1.1.1.1', port=80, ratio=1)
+            ],
+            server='localhost',
+            password='password',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        attrs = dict(load_fixture('load_ltm_pool.json'))
+        attrs['membersReference'] = dict(
+            items=load_fixture('pool_members_subcollection.json')
+        )
+        resource = Mock(attrs=attrs)
+        client.api.tm.ltm.pools.pool.load.return_value = resource
+
+        mm = ModuleManager(client)
+        have, members, poolres = mm.read_current_from_device()
+
+        assert mm.exists() is True
+        assert [x.name for x in members] == ['1.1.1.1:80']
+        assert members[0].ratio == 1
+        assert mm.requests == 1
+        assert client.api.tm.ltm.pools.pool.load.call_count == 1
+        assert resource.members_s.get_collection.call_count == 0
+
+    def test_update_pool_members_unchanged(self, *args):
+        set_module_args(dict(
+            name='test_pool',
+            partition='Common',
+            members=[
+                dict(address='1.1.1.1', port=80, ratio=1)
+            ],
+            server='localhost',
+            password='password',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+
+        current = (
+            Parameters(
+                load_fixture('load_ltm_pool.json')
+            ),
+            self.loaded_members,
+            {},
+        )
+
+        mm.update_on_device = Mock(return_value=True)
+        mm.exists = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=current)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert mm.update_on_device.call_count == 0
+
+    def test_update_pool_modify_member(self, *args):
+        set_module_args(dict(
+            name='test_pool',
+            partition='Common',
+            members=[
+                dict(address='1.1.1.1', port=80, priority_group=5)
+            ],
+            server='localhost',
+            password='password',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+
+        current = (
+            Parameters(
+                load_fixture('load_ltm_pool.json')
+            ),
+            self.loaded_members,
+            {},
+        )
+
+        mm.update_on_device = Mock(return_value=True)
+        mm.exists = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=current)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert results['members_modified'] == ['1.1.1.1:80']
+        assert mm.member_plan['members'][0]['priorityGroup'] == 5
+        assert mm.member_plan['members'][0]['ratio'] == 1
@@ -22,7 +22,9 @@ __metaclass__ = type
 
 import os
 import json
+import shutil
 import sys
+import tempfile
 
 from nose.plugins.skip import SkipTest
 if sys.version_info < (2, 7):
@@ -129,6 +131,78 @@ class TestManager(unittest.TestCase):
         assert results['changed'] is True
         assert results['level'] == 'nominal'
 
+    def test_provision_without_wait(self, *args):
+        set_module_args(dict(
+            module='gtm',
+            wait='no',
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        current = Parameters(
+            dict(
+                module='gtm',
+                level='none'
+            )
+        )
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+
+        # Override methods to force specific logic in the module to happen
+        mm.update_on_device = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=current)
+        mm._wait_for_module_provisioning = Mock()
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert mm._wait_for_module_provisioning.called is False
+        assert results['task']['operation'] == 'provision'
+        assert results['task']['server'] == 'localhost'
+        assert results['task']['module'] == 'gtm'
+        assert results['task']['level'] == 'nominal'
+
+    def test_provision_removes_capability_record(self, *args):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        path = os.path.join(cache_dir, 'bigip-capabilities-localhost-443.json')
+        with open(path, 'w') as fh:
+            fh.write('{}')
+
+        set_module_args(dict(
+            module='gtm',
+            wait='no',
+            cache_dir=cache_dir,
+            password='passsword',
+            server='localhost',
+            user='admin'
+        ))
+
+        current = Parameters(
+            dict(
+                module='gtm',
+                level='none'
+            )
+        )
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        mm = ModuleManager(client)
+        mm.update_on_device = Mock(return_value=True)
+        mm.read_current_from_device = Mock(return_value=current)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert not os.path.exists(path)
+
     def test_provision_all_modules(self, *args):
         modules = [
             'afm', 'am', 'sam', 'asm', 'avr', 'fps',
@@ -189,3 +189,45 @@ class TestBulkLocationManager(unittest.TestCase):
             results = mm.exec_module()
 
         assert results['changed'] is False
+
+    def test_create_qkview_without_wait(self, *args):
+        set_module_args(dict(
+            dest='/tmp/foo.qkview',
+            wait='no',
+            server='localhost',
+            user='admin',
+            password='password'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+
+        # Override methods in the specific type of manager
+        tm = BulkLocationManager(client)
+        tm.execute_on_device = Mock(return_value=True)
+        tm._download_file = Mock(return_value=True)
+
+        # Override methods to force specific logic in the module to happen
+        mm = ModuleManager(client)
+        mm.is_version_less_than_14 = Mock(return_value=False)
+        mm.get_manager = Mock(return_value=tm)
+
+        results = mm.exec_module()
+
+        assert results['changed'] is False
+        assert tm.execute_on_device.called is False
+        assert tm._download_file.called is False
+        assert results['task']['operation'] == 'qkview'
+        assert results['task']['filename'] == 'localhost.localdomain.qkview'
+        assert results['task']['dest'] == '/tmp/foo.qkview'
+        assert results['task']['location'] == 'bulk'
+
+        cmd = client.api.tm.util.bash.exec_cmd.call_args[1]['utilCmdArgs']
+        assert '/usr/bin/qkview' in cmd
+        assert '-f localhost.localdomain.qkview' in cmd
+        assert '/var/config/rest/bulk/localhost.localdomain.qkview' in cmd
+        assert '.ansible-task-{0}.status'.format(results['task']['id']) in cmd
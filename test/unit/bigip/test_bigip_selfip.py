@@ -41,12 +41,14 @@ try:
     from library.bigip_selfip import ApiParameters
     from library.bigip_selfip import ModuleManager
     from library.bigip_selfip import ArgumentSpec
+    from library.bigip_selfip import parse_address
 except ImportError:
     try:
         from ansible.modules.network.f5.bigip_selfip import Parameters
         from ansible.modules.network.f5.bigip_selfip import ApiParameters
         from ansible.modules.network.f5.bigip_selfip import ModuleManager
         from ansible.modules.network.f5.bigip_selfip import ArgumentSpec
+        from ansible.modules.network.f5.bigip_selfip import parse_address
     except ImportError:
         raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
 
@@ -138,6 +140,17 @@ class TestParameters(unittest.TestCase):
         assert p.traffic_group == '/Common/traffic-group-local-only'
         assert p.vlan == '/Common/net1'
 
+    def test_parse_address(self):
+        assert parse_address('10.10.10.10') == ('10.10.10.10', None, None)
+        assert parse_address('10.10.10.10%2/255.255.0.0') == ('10.10.10.10', 2, 16)
+        assert parse_address('fe80:0::1%0/64') == ('fe80::1', 0, 64)
+        assert parse_address('10.10.10.10%x/24') is None
+        assert parse_address('foo') is None
+
+        # Each value is only parsed once
+        result = parse_address('10.10.10.11%1/24')
+        assert parse_address('10.10.10.11%1/24') is result
+
 
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
@@ -21,10 +21,13 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import hashlib
 import os
 import json
 import pytest
+import shutil
 import sys
+import tempfile
 
 from nose.plugins.skip import SkipTest
 if sys.version_info < (2, 7):
@@ -41,6 +44,7 @@ try:
     from library.bigip_software import Parameters
     from library.bigip_software import LocalManager
     from library.bigip_software import RemoteManager
+    from library.bigip_software import ModuleManager
     from library.bigip_software import ArgumentSpec
     from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 except ImportError:
@@ -48,6 +52,7 @@ except ImportError:
         from ansible.modules.network.f5.bigip_software import Parameters
         from ansible.modules.network.f5.bigip_software import LocalManager
         from ansible.modules.network.f5.bigip_software import RemoteManager
+        from ansible.modules.network.f5.bigip_software import ModuleManager
         from ansible.modules.network.f5.bigip_software import ArgumentSpec
         from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
     except ImportError:
@@ -84,17 +89,17 @@ def load_fixture(name):
 def cmd_side_effect_md5_ok(*args):
     soft = 'cat /shared/images/BIGIP'
     hf = 'cat /shared/images/Hotfix'
-    md5_soft = 'cd /shared/images; md5sum -c /shared/images/BIGIP'
-    md5_hf = 'cd /shared/images; md5sum -c /shared/images/Hotfix'
+    status_soft = 'cat /shared/images/.BIGIP'
+    status_hf = 'cat /shared/images/.Hotfix'
     curl = '-o /shared/images'
     if soft in args[0]:
         return BigIpObj(**load_fixture('cat_md5_software.json'))
     if hf in args[0]:
         return BigIpObj(**load_fixture('cat_md5_hotfix.json'))
-    if md5_soft in args[0]:
-        return BigIpObj(**load_fixture('md5_sum_ok_software.json'))
-    if md5_hf in args[0]:
-        return BigIpObj(**load_fixture('md5_sum_ok_hf.json'))
+    if status_soft in args[0]:
+        return BigIpObj(**load_fixture('download_status_done.json'))
+    if status_hf in args[0]:
+        return BigIpObj(**load_fixture('download_status_done.json'))
     if curl in args[0]:
         return True
 
@@ -102,17 +107,17 @@ def cmd_side_effect_md5_ok(*args):
 def cmd_side_effect_md5_fail(*args):
     soft = 'cat /shared/images/BIGIP'
     hf = 'cat /shared/images/Hotfix'
-    md5_soft = 'cd /shared/images; md5sum -c /shared/images/BIGIP'
-    md5_hf = 'cd /shared/images; md5sum -c /shared/images/Hotfix'
+    status_soft = 'cat /shared/images/.BIGIP'
+    status_hf = 'cat /shared/images/.Hotfix'
     curl = '-o /shared/images'
     if soft in args[0]:
         return BigIpObj(**load_fixture('cat_md5_software.json'))
     if hf in args[0]:
         return BigIpObj(**load_fixture('cat_md5_hotfix.json'))
-    if md5_soft in args[0]:
-        return BigIpObj(**load_fixture('md5_sum_failed_software.json'))
-    if md5_hf in args[0]:
-        return BigIpObj(**load_fixture('md5_sum_failed_hf.json'))
+    if status_soft in args[0]:
+        return BigIpObj(**load_fixture('download_status_failed.json'))
+    if status_hf in args[0]:
+        return BigIpObj(**load_fixture('download_status_failed.json'))
     if curl in args[0]:
         return True
 
@@ -120,17 +125,17 @@ def cmd_side_effect_md5_fail(*args):
 def cmd_side_effect_md5_fail_hotfix(*args):
     soft = 'cat /shared/images/BIGIP'
     hf = 'cat /shared/images/Hotfix'
-    md5_soft = 'cd /shared/images; md5sum -c /shared/images/BIGIP'
-    md5_hf = 'cd /shared/images; md5sum -c /shared/images/Hotfix'
+    status_soft = 'cat /shared/images/.BIGIP'
+    status_hf = 'cat /shared/images/.Hotfix'
     curl = '-o /shared/images'
     if soft in args[0]:
         return BigIpObj(**load_fixture('cat_md5_software.json'))
     if hf in args[0]:
         return BigIpObj(**load_fixture('cat_md5_hotfix.json'))
-    if md5_soft in args[0]:
-        return BigIpObj(**load_fixture('md5_sum_ok_software.json'))
-    if md5_hf in args[0]:
-        return BigIpObj(**load_fixture('md5_sum_failed_hf.json'))
+    if status_soft in args[0]:
+        return BigIpObj(**load_fixture('download_status_done.json'))
+    if status_hf in args[0]:
+        return BigIpObj(**load_fixture('download_status_failed.json'))
     if curl in args[0]:
         return True
 
@@ -204,6 +209,40 @@ class TestParameters(unittest.TestCase):
             assert p.volume == 'HD1.1'
             assert p.options == tmp
 
+    def test_iso_metadata(self):
+        iso = os.path.join(iso_path, 'Hotfix-BIGIP-12.1.1.1.0.196-HF1.iso')
+        args = dict(
+            hotfix=iso,
+            state='present',
+            remote_src=False
+        )
+
+        p = Parameters(args)
+        assert p.version == '12.1.1'
+        assert p.build == '1.0.196'
+
+    @patch('library.bigip_software.read_iso_record')
+    def test_iso_metadata_cached(self, read):
+        iso = os.path.join(iso_path, 'BIGIP-12.1.2.iso')
+        read.return_value = (
+            b'<update><version>12.1.2</version>'
+            b'<buildNumber>0.0.249</buildNumber></update>'
+        )
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        args = dict(
+            software=iso,
+            state='present',
+            remote_src=False,
+            cache_dir=cache_dir
+        )
+
+        for x in range(2):
+            p = Parameters(args)
+            assert p.version == '12.1.2'
+            assert p.build == '0.0.249'
+        assert read.call_count == 1
+
 
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
@@ -286,6 +325,49 @@ class TestLocalManager(unittest.TestCase):
             assert results['volume'] == 'HD1.3'
             assert results['build'] == '0.0.249'
 
+    def test_activate_installed_volume_without_wait(self, *args):
+        set_module_args(dict(
+            volume='HD1.3',
+            software=self.iso,
+            state='activated',
+            wait='no',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        to_patch = dict(
+            _check_active_volume=DEFAULT,
+            _volume_exists_on_device=DEFAULT,
+        )
+
+        # Override methods to force specific logic in the module to happen
+        with patch.multiple(Parameters, **to_patch) as patched:
+            patched['_check_active_volume'].return_value = True
+            patched['_volume_exists_on_device'].return_value = True
+
+            mm = LocalManager(client)
+            mm.exit_json = Mock(return_value=False)
+            mm.list_volumes_on_device = Mock(return_value=self.loaded_volumes)
+            mm.reboot_volume_on_device = Mock(return_value=True)
+            mm.wait_for_device_reboot = Mock(return_value=True)
+
+            results = mm.exec_module()
+            assert results['changed'] is True
+            assert mm.wait_for_device_reboot.called is False
+            assert results['task']['operation'] == 'software'
+            assert results['task']['server'] == 'localhost'
+            assert results['task']['volume'] == 'HD1.3'
+            assert results['task']['version'] == '12.1.2'
+            assert results['task']['build'] == '0.0.249'
+            assert results['task']['activate'] is True
+
     def test_activate_installed_volume_using_hotfix(self, *args):
         set_module_args(dict(
             volume='HD1.2',
@@ -1153,6 +1235,34 @@ class TestLocalManager(unittest.TestCase):
         assert results['state'] == 'present'
         assert results['software'] == self.iso
 
+    def test_upload_software_already_on_device(self, *args):
+        set_module_args(dict(
+            software=self.iso,
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = LocalManager(client)
+        mm.exit_json = Mock(return_value=False)
+        mm.image_exists_on_device = Mock(return_value=False)
+        mm.upload_to_device = Mock(return_value=False)
+        mm.list_images_on_device = Mock(return_value=self.loaded_images)
+        mm.list_hotfixes_on_device = Mock(return_value=self.loaded_hotfixes)
+        mm.wait_for_images = Mock(return_value=True)
+
+        mm.exec_module()
+
+        assert mm.upload_to_device.call_count == 1
+        assert mm.wait_for_images.called is False
+
     def test_upload_hotfix(self, *args):
         set_module_args(dict(
             hotfix=self.iso_hf1,
@@ -1221,6 +1331,239 @@ class TestLocalManager(unittest.TestCase):
         assert results['hotfix'] == self.iso_hf1
         assert results['software'] == self.iso2
 
+    def test_upload_skipped_when_image_on_device(self, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        with open(self.iso2, 'rb') as fh:
+            checksum = hashlib.md5(fh.read()).hexdigest()
+        client.api.tm.util.bash.exec_cmd.return_value = Mock(
+            commandResult=checksum + '\n'
+        )
+
+        mm = LocalManager(client)
+
+        assert mm.upload_to_device(self.iso2) is False
+        uploads = client.api.cm.autodeploy.software_image_uploads
+        assert uploads.upload_image.call_count == 0
+
+    @patch('library.bigip_software.time.sleep')
+    def test_wait_for_images_backs_off(self, sleep, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = LocalManager(client)
+        mm.list_images_on_device = Mock(side_effect=[
+            self.loaded_images, self.loaded_images, self.loaded_images,
+            self.loaded_images_after_upload
+        ])
+
+        mm.wait_for_images(self.loaded_images)
+
+        assert mm.list_images_on_device.call_count == 4
+        assert sleep.call_count == 3
+        delays = [x[0][0] for x in sleep.call_args_list]
+        assert delays[0] < delays[1] < delays[2]
+        assert mm.wait_times['images']['polls'] == 4
+
+    @patch('library.bigip_software.time.sleep')
+    def test_wait_times_add_up(self, sleep, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = LocalManager(client)
+        mm.list_images_on_device = Mock(side_effect=[
+            self.loaded_images, self.loaded_images_after_upload
+        ])
+        mm.list_hotfixes_on_device = Mock(side_effect=[
+            self.loaded_images, self.loaded_images,
+            self.loaded_images_after_upload
+        ])
+
+        mm.wait_for_images(self.loaded_images)
+        mm.wait_for_images(self.loaded_images, hotfix=True)
+
+        assert mm.wait_times['images']['polls'] == 5
+        assert mm.wait_times['images']['waits'] == 2
+
+    @patch('library.bigip_software.time.sleep')
+    def test_wait_for_images_timeout(self, sleep, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            state='present',
+            timeout=0,
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = LocalManager(client)
+        mm.list_images_on_device = Mock(return_value=self.loaded_images)
+
+        with pytest.raises(F5ModuleError) as err:
+            mm.wait_for_images(self.loaded_images)
+        assert 'Timed out' in str(err.value)
+        assert sleep.call_count == 0
+
+    def test_upload_software_to_targets(self, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            version='12.0.0',
+            build='0.0.606',
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+            targets=[
+                dict(server='bigip1', volume='HD1.2'),
+                'bigip2'
+            ]
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        managers = []
+
+        def get_manager(target, client):
+            mm = LocalManager(client)
+            mm.image_exists_on_device = Mock(return_value=False)
+            mm.upload_to_device = Mock(return_value=True)
+            mm.list_images_on_device = Mock(return_value=self.loaded_images)
+            mm.list_hotfixes_on_device = Mock(return_value=self.loaded_hotfixes)
+            mm.wait_for_images = Mock(return_value=True)
+            managers.append(mm)
+            return mm
+
+        mm = ModuleManager(client)
+        mm.get_manager = Mock(side_effect=get_manager)
+
+        with patch('library.bigip_software.ManagementRoot') as mgmt:
+            results = mm.exec_module()
+        assert mgmt.call_count == 2
+        assert results['changed'] is True
+        assert [x['server'] for x in results['targets']] == ['bigip1', 'bigip2']
+        assert len(managers) == 2
+        for manager in managers:
+            assert manager.upload_to_device.call_count == 1
+            assert manager.transfers is not None
+        volumes = sorted(
+            [(x.client._connect_params['server'], x.want.volume) for x in managers]
+        )
+        assert volumes == [('bigip1', 'HD1.2'), ('bigip2', None)]
+
+    def test_target_failure_is_reported(self, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            version='12.0.0',
+            build='0.0.606',
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+            targets=['bigip1', 'bigip2']
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        managers = []
+
+        def get_manager(target, client):
+            mm = LocalManager(client)
+            mm.exec_module = Mock(return_value=dict(changed=True))
+            if client._connect_params['server'] == 'bigip1':
+                mm.exec_module.side_effect = F5ModuleError('Volume HD1.2 is busy')
+            managers.append(mm)
+            return mm
+
+        mm = ModuleManager(client)
+        mm.get_manager = Mock(side_effect=get_manager)
+
+        with patch('library.bigip_software.ManagementRoot'):
+            results = mm.exec_module()
+
+        assert all(x.exec_module.call_count == 1 for x in managers)
+        assert results['changed'] is True
+        assert results['failed_targets'] == 1
+        assert results['targets'][0]['failed'] is True
+        assert results['targets'][0]['msg'] == 'Volume HD1.2 is busy'
+        assert results['targets'][1]['changed'] is True
+        assert 'failed' not in results['targets'][1]
+
+    def test_unexpected_target_error_is_raised(self, *args):
+        set_module_args(dict(
+            software=self.iso2,
+            version='12.0.0',
+            build='0.0.606',
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+            targets=['bigip1'],
+            max_concurrent_targets=1
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        manager = LocalManager(client)
+        manager.exec_module = Mock(side_effect=KeyError('volume'))
+        mm = ModuleManager(client)
+        mm.get_manager = Mock(return_value=manager)
+
+        with patch('library.bigip_software.ManagementRoot'):
+            with pytest.raises(KeyError):
+                mm.exec_module()
+
 
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
@@ -2890,3 +3233,73 @@ class TestRemoteManager(unittest.TestCase):
             mm.exec_module()
 
         assert err.value.message == msg
+
+    @patch('library.bigip_software.time.sleep')
+    def test_download_resumes_and_reports_progress(self, sleep, *args):
+        set_module_args(dict(
+            software='http://fake.com/BIGIP-12.1.2.iso',
+            software_md5sum='http://fake.com/BIGIP-12.1.2.iso.md5',
+            build='0.0.249',
+            version='12.1.2',
+            remote_src='yes',
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = RemoteManager(client)
+        mm.run_command_on_device = Mock(side_effect=[
+            Mock(commandResult='1000\n'),
+            Mock(commandResult='5000\n'),
+            Mock(commandResult='done\n'),
+        ])
+
+        mm.wait_for_download('BIGIP-12.1.2.iso')
+
+        progress = mm.downloads['BIGIP-12.1.2.iso']
+        assert progress['bytes'] == 5000
+        assert mm.wait_times['download']['polls'] == 3
+
+        cmd = mm.prepare_download_command(
+            'http://fake.com/BIGIP-12.1.2.iso', 'BIGIP-12.1.2.iso', 'abc123'
+        )
+        assert '-r $size-' in cmd
+        assert '[ $sum = abc123 ]' in cmd
+        assert 'if [ $rc -eq 0 ] || [ $rc -eq 22 ]; then rm -f /shared/images/BIGIP-12.1.2.iso.part; fi' in cmd
+        assert cmd.endswith('&"')
+
+    @patch('library.bigip_software.time.sleep')
+    def test_download_failed(self, sleep, *args):
+        set_module_args(dict(
+            software='http://fake.com/BIGIP-12.1.2.iso',
+            software_md5sum='http://fake.com/BIGIP-12.1.2.iso.md5',
+            build='0.0.249',
+            version='12.1.2',
+            remote_src='yes',
+            state='present',
+            server='localhost',
+            password='password',
+            user='admin',
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = RemoteManager(client)
+        mm.run_command_on_device = Mock(
+            return_value=Mock(commandResult='failed\n')
+        )
+
+        with pytest.raises(F5ModuleError) as err:
+            mm.wait_for_download('BIGIP-12.1.2.iso')
+        assert 'ISO download failed' in str(err.value)
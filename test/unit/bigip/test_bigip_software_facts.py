@@ -23,8 +23,10 @@ __metaclass__ = type
 
 import os
 import json
+import shutil
 import sys
 import pytest
+import tempfile
 
 from nose.plugins.skip import SkipTest
 if sys.version_info < (2, 7):
@@ -36,6 +38,7 @@ from mock import Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
+from requests.exceptions import ConnectionError
 
 try:
     from library.bigip_software_facts import Parameters
@@ -381,6 +384,73 @@ class TestFactManagerBase(unittest.TestCase):
 
         assert str(err.value) == msg
 
+    @patch('library.bigip_software_facts.BaseManager._filter_and_format_facts',
+           lambda self, fact: dict(name=fact.name))
+    def test_get_volumes_from_targets(self, *args):
+        dest_dir = tempfile.mkdtemp()
+        dest = os.path.join(dest_dir, 'facts.jsonl')
+        set_module_args(dict(
+            server='localhost',
+            password='password',
+            user='admin',
+            include='volume',
+            targets=['10.0.0.1', dict(server='10.0.0.2', server_port=8443)],
+            dest=dest
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        mm = ModuleManager(client)
+        try:
+            results = mm.exec_module()
+            with open(dest) as fh:
+                lines = [json.loads(x) for x in fh]
+        finally:
+            shutil.rmtree(dest_dir)
+
+        assert results['changed'] is True
+        assert [x['server'] for x in results['targets']] == ['10.0.0.1', '10.0.0.2']
+        assert 'volumes' not in results['targets'][0]
+        lines.sort(key=lambda x: x['server'])
+        assert lines[0]['server_port'] == 443
+        assert lines[1]['server_port'] == 8443
+        assert len(lines[0]['volumes']) == 4
+        assert len(lines[1]['volumes']) == 4
+
+    def test_failed_target_is_reported(self, *args):
+        set_module_args(dict(
+            server='localhost',
+            password='password',
+            user='admin',
+            include='volume',
+            targets=['10.0.0.1', '10.0.0.2']
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        def exec_device(target):
+            if target._connect_params['server'] == '10.0.0.2':
+                raise ConnectionError('Connection refused')
+            return dict(changed=False, volumes=[])
+
+        mm = ModuleManager(client)
+        mm.exec_device = Mock(side_effect=exec_device)
+        results = mm.exec_module()
+
+        assert results['failed_targets'] == 1
+        assert results['targets'][0]['volumes'] == []
+        assert 'failed' not in results['targets'][0]
+        assert results['targets'][1]['failed'] is True
+        assert results['targets'][1]['msg'] == 'Connection refused'
+
     def test_invalid_include_raises(self, *args):
         set_module_args(dict(
             server='localhost',
@@ -30,7 +30,7 @@ if sys.version_info < (2, 7):
 
 from ansible.compat.tests import unittest
 from ansible.module_utils import basic
-from ansible.compat.tests.mock import patch, Mock
+from ansible.compat.tests.mock import patch, Mock, DEFAULT
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
 
@@ -41,6 +41,7 @@ try:
     from library.bigip_ssl_certificate import CertificateManager
     from library.bigip_ssl_certificate import HAS_F5SDK
     from library.bigip_ssl_certificate import KeyManager
+    from library.bigip_ssl_certificate import ModuleManager
 except ImportError:
     try:
         from ansible.modules.network.f5.bigip_ssl_certificate import ArgumentSpec
@@ -49,6 +50,7 @@ except ImportError:
         from ansible.modules.network.f5.bigip_ssl_certificate import CertificateManager
         from ansible.modules.network.f5.bigip_ssl_certificate import HAS_F5SDK
         from ansible.modules.network.f5.bigip_ssl_certificate import KeyManager
+        from ansible.modules.network.f5.bigip_ssl_certificate import ModuleManager
     except ImportError:
         raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
 
@@ -246,3 +248,93 @@ class TestKeyManager(unittest.TestCase):
         results = cm.exec_module()
 
         assert results['changed'] is True
+
+
+@patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
+       return_value=True)
+class TestBulkManager(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+
+    def get_client(self, **kwargs):
+        args = dict(
+            certificates=[
+                dict(name='site1', cert_content=load_fixture('cert1.crt'),
+                     key_content=load_fixture('cert1.key')),
+                dict(name='site2', cert_content=load_fixture('cert2.crt')),
+                dict(name='site3', cert_content=load_fixture('chain1.crt')),
+            ],
+            state='present',
+            password='password',
+            server='localhost',
+            user='admin'
+        )
+        args.update(kwargs)
+        set_module_args(args)
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            mutually_exclusive=self.spec.mutually_exclusive,
+            required_one_of=self.spec.required_one_of,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        return client
+
+    def checksum(self, name):
+        return 'SHA1:1234:{0}'.format(
+            CertParameters()._get_hash(load_fixture(name))
+        )
+
+    def test_upload_only_changed_certificates(self, *args):
+        client = self.get_client()
+        client.api.tm.sys.file.ssl_certs.get_collection.return_value = [
+            dict(name='site1.crt', checksum=self.checksum('cert1.crt')),
+            dict(name='site2.crt', checksum=self.checksum('cert1.crt')),
+        ]
+        client.api.tm.sys.file.ssl_keys.get_collection.return_value = [
+            dict(name='site1.key', checksum=self.checksum('cert1.key')),
+        ]
+
+        with patch.multiple(CertificateManager, create_on_device=DEFAULT,
+                            update_on_device=DEFAULT) as cert:
+            with patch.multiple(KeyManager, create_on_device=DEFAULT,
+                                update_on_device=DEFAULT) as key:
+                mm = ModuleManager(client)
+                results = mm.exec_module()
+
+        assert results['changed'] is True
+        report = dict((x['name'], x) for x in results['certificates'])
+        assert report['site1']['cert'] == 'unchanged'
+        assert report['site1']['key'] == 'unchanged'
+        assert report['site2']['cert'] == 'updated'
+        assert 'key' not in report['site2']
+        assert report['site3']['cert'] == 'created'
+        assert cert['update_on_device'].call_count == 1
+        assert cert['create_on_device'].call_count == 1
+        assert key['update_on_device'].call_count == 0
+        assert key['create_on_device'].call_count == 0
+
+        params = client.api.tm.sys.file.ssl_certs.get_collection.call_args[1]
+        assert params['requests_params']['params'] == "$select=name,checksum&$filter=partition+eq+'Common'"
+
+    def test_remove_certificates(self, *args):
+        client = self.get_client(state='absent')
+        client.api.tm.sys.file.ssl_certs.get_collection.return_value = [
+            dict(name='site1.crt', checksum=self.checksum('cert1.crt')),
+        ]
+        client.api.tm.sys.file.ssl_keys.get_collection.return_value = [
+            dict(name='site1.key', checksum=self.checksum('cert1.key')),
+        ]
+
+        with patch.multiple(CertificateManager, remove_from_device=DEFAULT) as cert:
+            with patch.multiple(KeyManager, remove_from_device=DEFAULT) as key:
+                mm = ModuleManager(client)
+                results = mm.exec_module()
+
+        assert results['changed'] is True
+        assert [x['cert'] for x in results['certificates']] == ['removed', 'absent', 'absent']
+        assert [x['key'] for x in results['certificates']] == ['removed', 'absent', 'absent']
+        assert cert['remove_from_device'].call_count == 1
+        assert key['remove_from_device'].call_count == 1
@@ -134,6 +134,12 @@ class TestParameters(unittest.TestCase):
         p = Parameters(args)
         assert p.destination == '10.10.10.10/32'
 
+        # route domain
+        args = dict(destination="10.10.10.0%2/24", gateway_address="10.10.10.1%2")
+        p = Parameters(args)
+        assert p.destination == '10.10.10.0%2/24'
+        assert p.gateway_address == '10.10.10.1%2'
+
     def test_vlan_with_partition(self):
         args = dict(
             vlan="/Common/foo",
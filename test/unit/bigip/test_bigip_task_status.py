@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2017 F5 Networks Inc.
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import json
+import pytest
+import shutil
+import sys
+import tempfile
+
+from nose.plugins.skip import SkipTest
+if sys.version_info < (2, 7):
+    raise SkipTest("F5 Ansible modules require Python >= 2.7")
+
+from ansible.compat.tests import unittest
+from ansible.compat.tests.mock import patch, Mock
+from ansible.module_utils.f5_utils import F5ModuleError
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes
+from ansible.module_utils.f5_utils import AnsibleF5Client
+from requests.exceptions import ConnectionError
+
+try:
+    from library.bigip_task_status import Parameters
+    from library.bigip_task_status import ModuleManager
+    from library.bigip_task_status import DeviceManager
+    from library.bigip_task_status import ArgumentSpec
+except ImportError:
+    try:
+        from ansible.modules.network.f5.bigip_task_status import Parameters
+        from ansible.modules.network.f5.bigip_task_status import ModuleManager
+        from ansible.modules.network.f5.bigip_task_status import DeviceManager
+        from ansible.modules.network.f5.bigip_task_status import ArgumentSpec
+    except ImportError:
+        raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
+
+fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
+fixture_data = {}
+
+
+def set_module_args(args):
+    args = json.dumps({'ANSIBLE_MODULE_ARGS': args})
+    basic._ANSIBLE_ARGS = to_bytes(args)
+
+
+def load_fixture(name):
+    path = os.path.join(fixture_path, name)
+
+    if path in fixture_data:
+        return fixture_data[path]
+
+    with open(path) as f:
+        data = f.read()
+
+    try:
+        data = json.loads(data)
+    except Exception:
+        pass
+
+    fixture_data[path] = data
+    return data
+
+
+class TestParameters(unittest.TestCase):
+    def test_module_parameters(self):
+        args = dict(
+            tasks=[
+                dict(id='abc', server='10.0.0.1', operation='provision'),
+            ],
+            wait=True,
+            timeout=600
+        )
+        p = Parameters(args)
+        assert p.tasks[0]['id'] == 'abc'
+        assert p.wait is True
+        assert p.timeout == 600
+
+    def test_task_missing_id_raises(self):
+        p = Parameters(dict(tasks=[dict(server='10.0.0.1', operation='ucs')]))
+        with pytest.raises(F5ModuleError) as ex:
+            p.tasks
+        assert 'missing id' in str(ex.value)
+
+    def test_task_unknown_operation_raises(self):
+        p = Parameters(dict(tasks=[dict(id='abc', server='10.0.0.1', operation='foo')]))
+        with pytest.raises(F5ModuleError) as ex:
+            p.tasks
+        assert "'foo' operation" in str(ex.value)
+
+
+@patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
+       return_value=True)
+class TestManager(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+        self.tasks = [
+            dict(id='a1', server='10.0.0.1', server_port=443,
+                 operation='software', volume='HD1.2', version='12.1.2',
+                 build='0.0.249', activate=True),
+            dict(id='b1', server='10.0.0.2', server_port=443,
+                 operation='provision', module='asm', level='nominal'),
+            dict(id='a2', server='10.0.0.1', server_port=443,
+                 operation='ucs', ucs='backup.ucs'),
+        ]
+
+    def get_client(self, **kwargs):
+        args = dict(
+            tasks=self.tasks,
+            server='localhost',
+            password='password',
+            user='admin'
+        )
+        args.update(kwargs)
+        set_module_args(args)
+        return AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+    def test_check_tasks_on_each_device(self, *args):
+        client = self.get_client()
+        mm = ModuleManager(client)
+
+        with patch.multiple(
+            DeviceManager,
+            check_software=Mock(return_value=('finished', None)),
+            check_provision=Mock(return_value=('running', 'Modules are being provisioned.')),
+            check_ucs=Mock(return_value=('finished', None))
+        ):
+            with patch.object(mm, 'get_manager', wraps=mm.get_manager) as get_manager:
+                results = mm.exec_module()
+
+        assert get_manager.call_count == 2
+        assert results['changed'] is False
+        assert results['finished'] is False
+        assert [x['id'] for x in results['tasks']] == ['a1', 'b1', 'a2']
+        assert results['tasks'][0]['status'] == 'finished'
+        assert results['tasks'][1]['status'] == 'running'
+        assert results['tasks'][1]['msg'] == 'Modules are being provisioned.'
+        assert results['tasks'][2]['status'] == 'finished'
+
+    @patch('library.bigip_task_status.time.sleep')
+    def test_wait_for_tasks(self, sleep, *args):
+        client = self.get_client(wait='yes')
+        mm = ModuleManager(client)
+
+        software = Mock(side_effect=[
+            ('running', None), ('running', None), ('finished', None)
+        ])
+        with patch.multiple(
+            DeviceManager,
+            check_software=software,
+            check_provision=Mock(return_value=('finished', None)),
+            check_ucs=Mock(return_value=('finished', None))
+        ):
+            results = mm.exec_module()
+
+        assert results['finished'] is True
+        assert software.call_count == 3
+        assert results['wait_times']['10.0.0.1']['polls'] == 3
+        assert results['wait_times']['10.0.0.2']['polls'] == 1
+
+    def test_failed_task_raises(self, *args):
+        client = self.get_client()
+        mm = ModuleManager(client)
+
+        with patch.multiple(
+            DeviceManager,
+            check_software=Mock(return_value=('failed', 'failed (Install failed)')),
+            check_provision=Mock(return_value=('finished', None)),
+            check_ucs=Mock(return_value=('finished', None))
+        ):
+            with pytest.raises(F5ModuleError) as ex:
+                mm.exec_module()
+
+        assert 'software a1 on 10.0.0.1: failed (Install failed)' in str(ex.value)
+
+    def test_unreachable_device_is_running(self, *args):
+        client = self.get_client()
+        mm = ModuleManager(client)
+
+        with patch.multiple(
+            DeviceManager,
+            check_software=Mock(side_effect=ConnectionError('Connection aborted')),
+            check_provision=Mock(return_value=('finished', None)),
+            check_ucs=Mock(return_value=('finished', None))
+        ):
+            results = mm.exec_module()
+
+        assert results['finished'] is False
+        assert results['tasks'][0]['status'] == 'running'
+        assert results['tasks'][0]['msg'] == 'Connection aborted'
+
+    def test_unexpected_error_raises(self, *args):
+        client = self.get_client()
+        mm = ModuleManager(client)
+
+        with patch.multiple(
+            DeviceManager,
+            check_software=Mock(side_effect=KeyError('volume')),
+            check_provision=Mock(return_value=('finished', None)),
+            check_ucs=Mock(return_value=('finished', None))
+        ):
+            with pytest.raises(KeyError):
+                mm.exec_module()
+
+    def test_read_task_status(self, *args):
+        client = Mock()
+        client.api.tm.util.bash.exec_cmd.return_value = Mock(
+            commandResult='done\n'
+        )
+        dm = DeviceManager(client, Parameters(dict(wait=False)), self.tasks)
+
+        result = dm.read_task_status_on_device(self.tasks[2])
+
+        assert result == ('finished', None)
+        cmd = client.api.tm.util.bash.exec_cmd.call_args[1]['utilCmdArgs']
+        assert cmd == '-c "cat /var/tmp/.ansible-task-a2.status"'
+
+    def test_check_software_activated(self, *args):
+        volume = Mock(
+            status='complete', version='12.1.2', build='0.0.249', active=False
+        )
+        volume.name = 'HD1.2'
+        client = Mock()
+        client.api.tm.sys.software.volumes.get_collection.return_value = [volume]
+        dm = DeviceManager(client, Parameters(dict(wait=False)), self.tasks)
+
+        assert dm.check_software(self.tasks[0])[0] == 'running'
+        volume.active = True
+        assert dm.check_software(self.tasks[0]) == ('finished', None)
+
+    def get_qkview_manager(self, dest, remote_files):
+        task = dict(
+            id='c1', server='10.0.0.1', server_port=443, operation='qkview',
+            filename='localhost.qkview', dest=dest, location='bulk'
+        )
+        client = Mock()
+        client.api.tm.util.bash.exec_cmd.return_value = Mock(
+            commandResult='done\n'
+        )
+        client.api.tm.util.unix_ls.exec_cmd.return_value = Mock(
+            commandResult=remote_files
+        )
+
+        def download_file(filename, dest):
+            with open(dest, 'w') as fh:
+                fh.write('new')
+
+        location = client.api.shared.file_transfer.bulk
+        location.download_file.side_effect = download_file
+        dm = DeviceManager(client, Parameters(dict(wait=False)), [task])
+        dm.results['c1'] = dict(task, status='running')
+        return dm, task
+
+    def test_check_qkview_replaces_dest(self, *args):
+        tmpdir = tempfile.mkdtemp()
+        dest = os.path.join(tmpdir, 'localhost.qkview')
+        with open(dest, 'w') as fh:
+            fh.write('old')
+        dm, task = self.get_qkview_manager(dest, 'localhost.qkview\n')
+
+        try:
+            result = dm.check_qkview(task)
+            with open(dest) as fh:
+                content = fh.read()
+        finally:
+            shutil.rmtree(tmpdir)
+
+        assert result == ('finished', None)
+        assert content == 'new'
+        assert dm.results['c1']['downloaded'] is True
+        cmd = dm.client.api.tm.util.unix_rm.exec_cmd.call_args[1]['utilCmdArgs']
+        assert cmd == '/var/config/rest/bulk/localhost.qkview'
+
+    def test_check_qkview_already_downloaded(self, *args):
+        tmpdir = tempfile.mkdtemp()
+        dest = os.path.join(tmpdir, 'localhost.qkview')
+        with open(dest, 'w') as fh:
+            fh.write('old')
+        dm, task = self.get_qkview_manager(dest, 'other.qkview\n')
+
+        try:
+            result = dm.check_qkview(task)
+        finally:
+            shutil.rmtree(tmpdir)
+
+        assert result == ('finished', None)
+        assert dm.client.api.shared.file_transfer.bulk.download_file.called is False
+        assert 'downloaded' not in dm.results['c1']
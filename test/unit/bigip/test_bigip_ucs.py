@@ -211,6 +211,38 @@ class TestV1Manager(unittest.TestCase):
 
         assert results['changed'] is True
 
+    def test_ucs_installed_without_wait(self, *args):
+        set_module_args(dict(
+            ucs="/root/bigip.localhost.localdomain.ucs",
+            server='localhost',
+            password='password',
+            user='admin',
+            state='installed',
+            wait='no'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+
+        # Override methods to force specific logic in the module to happen
+        vm = V1Manager(client)
+        vm.create_on_device = Mock(return_value=True)
+        vm.exists = Mock(side_effect=[False, True])
+        vm.start_install_on_device = Mock()
+        vm.wait_for_configuration_reload = Mock()
+
+        results = vm.exec_module()
+
+        assert results['changed'] is True
+        assert vm.wait_for_configuration_reload.called is False
+        assert results['task']['operation'] == 'ucs'
+        assert results['task']['server'] == 'localhost'
+        assert results['task']['ucs'] == 'bigip.localhost.localdomain.ucs'
+        vm.start_install_on_device.assert_called_once_with(results['task'])
+
     def test_ucs_absent_exists(self, *args):
         set_module_args(dict(
             ucs="/root/bigip.localhost.localdomain.ucs",
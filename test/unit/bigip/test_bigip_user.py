@@ -35,6 +35,7 @@ from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import AnsibleF5Client
 from ansible.module_utils.f5_utils import F5ModuleError
+from ansible.module_utils.f5_utils import iControlUnexpectedHTTPError
 
 try:
     from library.bigip_user import Parameters
@@ -42,6 +43,7 @@ try:
     from library.bigip_user import ArgumentSpec
     from library.bigip_user import UnparitionedManager
     from library.bigip_user import PartitionedManager
+    from library.bigip_user import BulkManager
 except ImportError:
     try:
         from ansible.modules.network.f5.bigip_user import Parameters
@@ -49,6 +51,7 @@ except ImportError:
         from ansible.modules.network.f5.bigip_user import ArgumentSpec
         from ansible.modules.network.f5.bigip_user import UnparitionedManager
         from ansible.modules.network.f5.bigip_user import PartitionedManager
+        from ansible.modules.network.f5.bigip_user import BulkManager
     except ImportError:
         raise SkipTest("F5 Ansible modules require the f5-sdk Python library")
 
@@ -931,3 +934,163 @@ class TestLegacyManager(unittest.TestCase):
         with pytest.raises(F5ModuleError) as ex:
             upm.exec_module()
         assert str(ex.value) == msg
+
+
+@patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
+       return_value=True)
+class TestLookups(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = ArgumentSpec()
+
+    def user(self, name, **attrs):
+        attrs.update(dict(name=name, partition='Common'))
+        result = Mock(attrs=attrs, partition='Common')
+        result.name = name
+        return result
+
+    def test_update_user_with_one_read(self, *args):
+        set_module_args(dict(
+            username_credential='someuser',
+            full_name='Some User',
+            password='password',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        resource = self.user('someuser', description='Someone')
+        client.api.tm.auth.users.user.load.return_value = resource
+
+        pm = PartitionedManager(client)
+        results = pm.exec_module()
+
+        assert results['changed'] is True
+        assert results['requests'] == 2
+        client.api.tm.auth.users.user.load.assert_called_once_with(name='someuser')
+        assert client.api.tm.auth.users.get_collection.called is False
+        assert resource.modify.call_count == 1
+
+    def test_user_in_other_partition_is_absent(self, *args):
+        set_module_args(dict(
+            username_credential='someuser',
+            state='absent',
+            partition='Other',
+            password='password',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name
+        )
+        client.api = Mock()
+        resource = self.user('someuser')
+        client.api.tm.auth.users.user.load.return_value = resource
+
+        pm = PartitionedManager(client)
+        results = pm.exec_module()
+
+        assert results['changed'] is False
+        assert resource.delete.called is False
+
+    def test_bulk_users(self, *args):
+        set_module_args(dict(
+            users=[
+                dict(name='unchanged', full_name='Unchanged'),
+                dict(name='updated', full_name='New Name'),
+                dict(
+                    name='created',
+                    password_credential='testpass',
+                    partition_access=['Common:guest']
+                ),
+                dict(name='removed', state='absent'),
+                dict(name='absent', state='absent')
+            ],
+            update_password='on_create',
+            password='password',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name,
+            mutually_exclusive=self.spec.mutually_exclusive,
+            required_one_of=self.spec.required_one_of
+        )
+        client.api = Mock()
+        client.api.tmos_version = '13.0.0'
+        users = [
+            self.user('unchanged', description='Unchanged'),
+            self.user('updated', description='Old Name'),
+            self.user('removed')
+        ]
+        client.api.tm.auth.users.get_collection.return_value = users
+        client.api.tm.auth.users.user.load.side_effect = iControlUnexpectedHTTPError(
+            response=Mock(status_code=404)
+        )
+
+        bm = BulkManager(client)
+        results = bm.exec_module()
+
+        assert results['changed'] is True
+        assert results['users'] == [
+            dict(name='unchanged', status='unchanged'),
+            dict(name='updated', status='updated'),
+            dict(name='created', status='created'),
+            dict(name='removed', status='removed'),
+            dict(name='absent', status='absent')
+        ]
+        assert client.api.tm.auth.users.get_collection.call_count == 1
+        assert users[0].modify.called is False
+        assert users[1].modify.call_count == 1
+        assert users[2].delete.call_count == 1
+        assert client.api.tm.auth.users.user.create.call_count == 1
+
+        # Only the removed user is read again, to check that it is gone
+        client.api.tm.auth.users.user.load.assert_called_once_with(name='removed')
+
+    def test_bulk_users_item_options(self, *args):
+        set_module_args(dict(
+            users=[
+                dict(
+                    name='created',
+                    password_credential='testpass',
+                    partition_access='all:admin',
+                    update_password='on_create'
+                )
+            ],
+            password='password',
+            server='localhost',
+            user='admin'
+        ))
+
+        client = AnsibleF5Client(
+            argument_spec=self.spec.argument_spec,
+            supports_check_mode=self.spec.supports_check_mode,
+            f5_product_name=self.spec.f5_product_name,
+            mutually_exclusive=self.spec.mutually_exclusive,
+            required_one_of=self.spec.required_one_of
+        )
+        client.api = Mock()
+        client.api.tmos_version = '13.0.0'
+        client.api.tm.auth.users.get_collection.return_value = []
+
+        bm = BulkManager(client)
+        results = bm.exec_module()
+
+        assert results['users'] == [dict(name='created', status='created')]
+        assert 'testpass' in client.module.no_log_values
+        params = client.api.tm.auth.users.user.create.call_args[1]
+        assert params['partitionAccess'] == [
+            dict(name='all-partitions', role='admin')
+        ]
@@ -24,9 +24,10 @@ __metaclass__ = type
 import os
 import pytest
 import json
+import re
 
 from ansible.compat.tests import unittest
-from ansible.compat.tests.mock import patch
+from ansible.compat.tests.mock import patch, Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from ansible.module_utils.f5_utils import (
@@ -71,26 +72,45 @@ class Namespace(object):
         self.__dict__.update(kwargs)
 
 
+def sdk_get_collection(items):
+    """Returns a stand-in for get_collection of the f5-sdk
+
+    Like the SDK, an item is only turned into a resource when its kind is
+    among the selected attributes. Otherwise it is left as a plain dict.
+    """
+    def get_collection(requests_params=None):
+        params = (requests_params or dict()).get('params', '')
+        selected = re.search(r'\$select=([^&]+)', params)
+        result = []
+        for item in items:
+            if selected:
+                names = selected.group(1).split(',')
+                item = dict((k, v) for k, v in item.items() if k in names)
+            if 'kind' in item:
+                result.append(Namespace(**item))
+            else:
+                result.append(item)
+        return result
+    return Mock(side_effect=get_collection)
+
+
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
 class TestParameters(unittest.TestCase):
 
     def setUp(self):
-        self.loaded_devices = []
-        devices_json = load_fixture('load_cm_cloud_managed_devices.json')
-        for item in devices_json:
-            self.loaded_devices.append(Namespace(**item))
-
-        self.loaded_connectors = []
-        devices_json = load_fixture('load_connectors.json')
-        for item in devices_json:
-            self.loaded_connectors.append(Namespace(**item))
-
-    @patch.object(Device, '_get_device_collection')
-    @patch.object(Connector, '_get_connector_collection')
+        self.client = Namespace(api=Mock())
+        dg = self.client.api.shared.resolver.device_groups
+        self.devices = dg.cm_cloud_managed_devices.devices_s
+        self.devices.get_collection = sdk_get_collection(
+            load_fixture('load_cm_cloud_managed_devices.json')
+        )
+        self.connectors = self.client.api.cm.cloud.connectors.locals
+        self.connectors.get_collection = sdk_get_collection(
+            load_fixture('load_connectors.json')
+        )
+
     def test_module_parameters_general(self, *args):
-        args[0].return_value = self.loaded_connectors
-        args[1].return_value = self.loaded_devices
         args = dict(
             device="10.2.2.3",
             password_credential="admin",
@@ -111,7 +131,7 @@ class TestParameters(unittest.TestCase):
             ]
         )
 
-        p = Parameters(args)
+        p = Parameters(args, client=self.client)
         assert p.device.address == '10.2.2.3'
         assert p.hostname == 'foo.example.com'
         assert len(p.interfaces) == 2
@@ -198,3 +218,30 @@ class TestParameters(unittest.TestCase):
         p = Parameters(args)
         with pytest.raises(F5ModuleError):
             assert len(p.interfaces) == 1
+
+    def test_device_lookup_reads_collection_once(self, *args):
+        client = self.client
+
+        for value in ['bigip1', '10.2.2.3', '10.0.2.15']:
+            device = Device(client=client)
+            device.update(value)
+            assert device.hostname == 'bigip1'
+
+        device = Device(client=client)
+        device.update('https://localhost/mgmt/shared/resolver/device-groups/cm-cloud-managed-devices/devices/d13074df-4f0c-4ed3-baf6-0050fe74695f')
+        assert device.address == '10.2.2.3'
+
+        assert self.devices.get_collection.call_count == 1
+
+        # A device that is not found may have been added since the
+        # collection was read, so it is read again before giving up.
+        with pytest.raises(F5ModuleError):
+            Device(client=client).update('iworkflow1')
+        assert self.devices.get_collection.call_count == 2
+
+    def test_connector_lookup(self, *args):
+        connector = Connector(client=self.client)
+        connector.update('foo')
+        assert connector.selfLink == \
+            'https://localhost/mgmt/cm/cloud/connectors/local/212301e6-6d01-4509-bfe3-8e372e792fb0'
+        assert connector.resource.displayName == 'BIG-IP'
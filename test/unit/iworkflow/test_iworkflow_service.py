@@ -23,9 +23,10 @@ __metaclass__ = type
 
 import os
 import json
+import re
 
 from ansible.compat.tests import unittest
-from ansible.compat.tests.mock import patch
+from ansible.compat.tests.mock import patch, Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 
@@ -66,15 +67,37 @@ class Namespace(object):
         self.__dict__.update(kwargs)
 
 
+def sdk_get_collection(items):
+    """Returns a stand-in for get_collection of the f5-sdk
+
+    Like the SDK, an item is only turned into a resource when its kind is
+    among the selected attributes. Otherwise it is left as a plain dict.
+    """
+    def get_collection(requests_params=None):
+        params = (requests_params or dict()).get('params', '')
+        selected = re.search(r'\$select=([^&]+)', params)
+        result = []
+        for item in items:
+            if selected:
+                names = selected.group(1).split(',')
+                item = dict((k, v) for k, v in item.items() if k in names)
+            if 'kind' in item:
+                result.append(Namespace(**item))
+            else:
+                result.append(item)
+        return result
+    return Mock(side_effect=get_collection)
+
+
 @patch('ansible.module_utils.f5_utils.AnsibleF5Client._get_mgmt_root',
        return_value=True)
 class TestParameters(unittest.TestCase):
 
     def setUp(self):
-        self.loaded_connectors = []
-        connectors_json = load_fixture('load_connectors.json')
-        for item in connectors_json:
-            self.loaded_connectors.append(Namespace(**item))
+        self.client = Namespace(api=Mock())
+        self.client.api.cm.cloud.connectors.locals.get_collection = sdk_get_collection(
+            load_fixture('load_connectors.json')
+        )
 
     def test_module_parameters(self, *args):
         arguments = dict(
@@ -85,47 +108,47 @@ class TestParameters(unittest.TestCase):
             tenant="tenant-foo",
             state="present"
         )
-        with patch.object(Parameters, '_get_connector_collection') as mo:
-            mo.return_value = self.loaded_connectors
-            p = Parameters(arguments)
-
-            assert p.name == 'bar'
-
-            # Check that tenant is correct
-            assert 'link' in p.tenantTemplateReference
-            assert p.tenantTemplateReference['link'] == \
-                'https://localhost/mgmt/cm/cloud/tenant/templates/iapp/app-svcs-int-v2.0-default'
-
-            # Check that cloud connector is correct
-            assert len(p.connector) == 1
-            assert p.connector[0]['id'] == 'cloudConnectorReference'
-            assert p.connector[0]['value'] == \
-                'https://localhost/mgmt/cm/cloud/connectors/local/212301e6-6d01-4509-bfe3-8e372e792fb0'
-
-            # Check that vars are correct
-            assert len(p.vars) == 3
-            assert p.vars[0]['name'] == 'pool__addr'
-            assert p.vars[0]['value'] == '172.27.1.10'
-            assert p.vars[1]['name'] == 'pool__port'
-            assert p.vars[1]['value'] == '900'
-            assert p.vars[2]['name'] == 'vs__ProfileClientProtocol'
-            assert p.vars[2]['value'] == 'tcp'
-
-            # Check that tables are correct
-            assert len(p.tables) == 1
-            assert 'name' in p.tables[0]
-            assert 'section' in p.tables[0]
-            assert 'columnNames' in p.tables[0]
-            assert 'rows' in p.tables[0]
-
-            assert p.tables[0]['name'] == 'pool__Members'
-            assert p.tables[0]['section'] == 'pool'
-            assert p.tables[0]['columnNames'] == ['IPAddress', 'Port']
-
-            assert len(p.tables[0]['rows']) == 2
-            assert len(p.tables[0]['rows'][0]) == 2
-            assert p.tables[0]['rows'][0] == ['20.0.1.11', '80']
-            assert p.tables[0]['rows'][1] == ['20.0.1.12']
-            assert p.tables[0]['rows'][0][0] == '20.0.1.11'
-            assert p.tables[0]['rows'][0][1] == '80'
-            assert p.tables[0]['rows'][1][0] == '20.0.1.12'
+        p = Parameters()
+        p.client = self.client
+        p.update(arguments)
+
+        assert p.name == 'bar'
+
+        # Check that tenant is correct
+        assert 'link' in p.tenantTemplateReference
+        assert p.tenantTemplateReference['link'] == \
+            'https://localhost/mgmt/cm/cloud/tenant/templates/iapp/app-svcs-int-v2.0-default'
+
+        # Check that cloud connector is correct
+        assert len(p.connector) == 1
+        assert p.connector[0]['id'] == 'cloudConnectorReference'
+        assert p.connector[0]['value'] == \
+            'https://localhost/mgmt/cm/cloud/connectors/local/212301e6-6d01-4509-bfe3-8e372e792fb0'
+
+        # Check that vars are correct
+        assert len(p.vars) == 3
+        assert p.vars[0]['name'] == 'pool__addr'
+        assert p.vars[0]['value'] == '172.27.1.10'
+        assert p.vars[1]['name'] == 'pool__port'
+        assert p.vars[1]['value'] == '900'
+        assert p.vars[2]['name'] == 'vs__ProfileClientProtocol'
+        assert p.vars[2]['value'] == 'tcp'
+
+        # Check that tables are correct
+        assert len(p.tables) == 1
+        assert 'name' in p.tables[0]
+        assert 'section' in p.tables[0]
+        assert 'columnNames' in p.tables[0]
+        assert 'rows' in p.tables[0]
+
+        assert p.tables[0]['name'] == 'pool__Members'
+        assert p.tables[0]['section'] == 'pool'
+        assert p.tables[0]['columnNames'] == ['IPAddress', 'Port']
+
+        assert len(p.tables[0]['rows']) == 2
+        assert len(p.tables[0]['rows'][0]) == 2
+        assert p.tables[0]['rows'][0] == ['20.0.1.11', '80']
+        assert p.tables[0]['rows'][1] == ['20.0.1.12']
+        assert p.tables[0]['rows'][0][0] == '20.0.1.11'
+        assert p.tables[0]['rows'][0][1] == '80'
+        assert p.tables[0]['rows'][1][0] == '20.0.1.12'
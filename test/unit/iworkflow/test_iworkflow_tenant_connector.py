@@ -23,11 +23,14 @@ __metaclass__ = type
 
 import os
 import json
+import re
 
 from ansible.compat.tests import unittest
+from ansible.compat.tests.mock import Mock
 from ansible.module_utils import basic
 from ansible.module_utils._text import to_bytes
 from library.iworkflow_tenant_connector import Parameters
+from library.iworkflow_tenant_connector import Connector
 
 
 fixture_path = os.path.join(os.path.dirname(__file__), 'fixtures')
@@ -57,6 +60,33 @@ def load_fixture(name):
     return data
 
 
+class Namespace(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+def sdk_get_collection(items):
+    """Returns a stand-in for get_collection of the f5-sdk
+
+    Like the SDK, an item is only turned into a resource when its kind is
+    among the selected attributes. Otherwise it is left as a plain dict.
+    """
+    def get_collection(requests_params=None):
+        params = (requests_params or dict()).get('params', '')
+        selected = re.search(r'\$select=([^&]+)', params)
+        result = []
+        for item in items:
+            if selected:
+                names = selected.group(1).split(',')
+                item = dict((k, v) for k, v in item.items() if k in names)
+            if 'kind' in item:
+                result.append(Namespace(**item))
+            else:
+                result.append(item)
+        return result
+    return Mock(side_effect=get_collection)
+
+
 class TestParameters(unittest.TestCase):
 
     def test_module_parameters(self):
@@ -71,3 +101,21 @@ class TestParameters(unittest.TestCase):
         args = load_fixture('load_tenant.json')
         p = Parameters(args)
         assert p.tenant.name == 'tenant-foo'
+
+    def test_connector_lookup(self):
+        client = Namespace(api=Mock())
+        connectors = client.api.cm.cloud.connectors.locals
+        connectors.get_collection = sdk_get_collection(
+            load_fixture('load_connectors.json')
+        )
+
+        connector = Connector(client=client)
+        connector.update('foo')
+        assert connector.selfLink == \
+            'https://localhost/mgmt/cm/cloud/connectors/local/212301e6-6d01-4509-bfe3-8e372e792fb0'
+
+        self_link = connector.selfLink
+        connector = Connector(client=client)
+        connector.update(self_link)
+        assert connector.name == 'foo'
+        assert connectors.get_collection.call_count == 1